@@ -572,6 +572,7 @@ class R2RStreamingAgent(R2RAgent):
                             # Reset buffer & calls
                             pending_tool_calls.clear()
                             partial_text_buffer = ""
+                            citation_tracker.reset_scan()
 
                         elif finish_reason == "stop":
                             # Handle thinking if present
@@ -863,6 +864,7 @@ class R2RXMLStreamingAgent(R2RStreamingAgent):
 
                     # Create state variables for each iteration
                     iteration_buffer = ""
+                    citation_tracker.reset_scan()
                     yielded_first_event = False
                     in_action_block = False
                     is_thinking = False
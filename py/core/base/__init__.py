@@ -14,6 +14,7 @@ __all__ = [
     ## ABSTRACTIONS
     # Base abstractions
     "AsyncSyncMeta",
+    "ExportFormat",
     "syncable",
     # Completion abstractions
     "MessageType",
@@ -81,6 +82,7 @@ __all__ = [
     ## PARSERS
     # Base parser
     "AsyncParser",
+    "ParserProcessPool",
     ## PROVIDERS
     # Base provider classes
     "AppConfig",
@@ -89,6 +91,7 @@ __all__ = [
     # Auth provider
     "AuthConfig",
     "AuthProvider",
+    "CredentialCache",
     # Crypto provider
     "CryptoConfig",
     "CryptoProvider",
@@ -102,6 +105,10 @@ __all__ = [
     "Handler",
     "PostgresConfigurationSettings",
     # Embedding provider
+    "EmbeddingBatcher",
+    "EmbeddingBatchingSettings",
+    "EmbeddingCache",
+    "EmbeddingCacheSettings",
     "EmbeddingConfig",
     "EmbeddingProvider",
     # Ingestion provider
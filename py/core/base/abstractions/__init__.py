@@ -1,4 +1,9 @@
-from shared.abstractions.base import AsyncSyncMeta, R2RSerializable, syncable
+from shared.abstractions.base import (
+    AsyncSyncMeta,
+    ExportFormat,
+    R2RSerializable,
+    syncable,
+)
 from shared.abstractions.document import (
     ChunkEnrichmentSettings,
     Document,
@@ -77,6 +82,7 @@ __all__ = [
     # Base abstractions
     "R2RSerializable",
     "AsyncSyncMeta",
+    "ExportFormat",
     "syncable",
     # Completion abstractions
     "MessageType",
@@ -1,5 +1,7 @@
 from .base_parser import AsyncParser
+from .process_pool import ParserProcessPool
 
 __all__ = [
     "AsyncParser",
+    "ParserProcessPool",
 ]
@@ -7,6 +7,34 @@ T = TypeVar("T")
 
 
 class AsyncParser(ABC, Generic[T]):
+    # Parsers that set this can read a binary file object passed in place of
+    # bytes, so large files need not be loaded into memory first.
+    accepts_file_objects: bool = False
+    # Parsers that set this are CPU-bound and use neither the database nor
+    # the LLM provider, so they can be run in a worker process.
+    process_pool_safe: bool = False
+    # Parsers that set this implement `count_pages` and `extract_pages`, so
+    # a worker pool can parse separate page ranges of one document at once.
+    supports_page_ranges: bool = False
+
     @abstractmethod
-    async def ingest(self, data: T, **kwargs) -> AsyncGenerator[str, None]:
-        pass
+    def ingest(self, data: T, **kwargs) -> AsyncGenerator[str, None]:
+        """Yields the parsed text of `data`. Implementations are async
+        generators."""
+
+    @classmethod
+    def count_pages(cls, path: str) -> int:
+        """Returns the number of pages in the file at `path`."""
+        raise NotImplementedError(
+            f"{cls.__name__} must set `supports_page_ranges` and implement "
+            "`count_pages` to be parsed by page range."
+        )
+
+    @classmethod
+    def extract_pages(cls, path: str, start: int, stop: int) -> list[str]:
+        """Returns the text of pages `start` to `stop` of the file at `path`,
+        as `ingest` would yield it."""
+        raise NotImplementedError(
+            f"{cls.__name__} must set `supports_page_ranges` and implement "
+            "`extract_pages` to be parsed by page range."
+        )
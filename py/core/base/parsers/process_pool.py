@@ -0,0 +1,172 @@
+"""Runs CPU-bound parsers in a pool of worker processes."""
+
+import asyncio
+import multiprocessing
+import os
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncGenerator, BinaryIO, Optional
+
+from .base_parser import AsyncParser
+
+
+async def _collect(parser: AsyncParser, data: Any, kwargs: dict) -> list:
+    return [item async for item in parser.ingest(data, **kwargs)]
+
+
+def _ingest_file(
+    parser_cls: type[AsyncParser], config: Any, path: str, kwargs: dict
+) -> list:
+    """Parses a whole file in a worker process."""
+    parser = parser_cls(  # type: ignore
+        config=config, database_provider=None, llm_provider=None
+    )
+    with open(path, "rb") as file:
+        data = file if parser.accepts_file_objects else file.read()
+        return asyncio.run(_collect(parser, data, kwargs))
+
+
+class ParserProcessPool:
+    """Runs parsers that are `process_pool_safe` in worker processes, so that
+    parsing uses several cores and never blocks the event loop.
+
+    Parsers that support page ranges are fanned out over the pool in tasks
+    of `pages_per_task` pages, with results yielded in page order and at
+    most two tasks per worker in flight. Others are parsed whole in one
+    worker. Each document must finish within `timeout` seconds. On timeout
+    its queued tasks are cancelled, though a task already running finishes
+    in its worker and its result is discarded.
+
+    Workers are started with `spawn` on first use, because forking a
+    process that runs an event loop and threads is unsafe.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        timeout: Optional[float] = None,
+        pages_per_task: int = 8,
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.pages_per_task = pages_per_task
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def ingest(
+        self, parser: AsyncParser, data: bytes | BinaryIO, **kwargs
+    ) -> AsyncGenerator[Any, None]:
+        """Parses `data` with `parser` in the pool, yielding what
+        `parser.ingest` would."""
+        # Workers read the document from a temporary file rather than each
+        # being sent a copy of it.
+        fd, path = tempfile.mkstemp(prefix="r2r-parse-")
+        try:
+            await asyncio.to_thread(self._write, fd, data)
+            loop = asyncio.get_running_loop()
+            deadline = (
+                loop.time() + self.timeout
+                if self.timeout is not None
+                else None
+            )
+            if parser.supports_page_ranges:
+                results = self._ingest_pages(parser, path, deadline)
+            else:
+                results = self._ingest_whole(parser, path, kwargs, deadline)
+            async for result in results:
+                yield result
+        finally:
+            os.unlink(path)
+
+    @staticmethod
+    def _write(fd: int, data: bytes | BinaryIO) -> None:
+        with open(fd, "wb") as file:
+            if isinstance(data, bytes):
+                file.write(data)
+            else:
+                shutil.copyfileobj(data, file)
+
+    async def _wait(self, future: asyncio.Future, deadline: Optional[float]):
+        timeout = (
+            None
+            if deadline is None
+            else max(0.0, deadline - asyncio.get_running_loop().time())
+        )
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Parsing did not finish within {self.timeout} seconds."
+            ) from None
+
+    async def _ingest_whole(
+        self,
+        parser: AsyncParser,
+        path: str,
+        kwargs: dict,
+        deadline: Optional[float],
+    ) -> AsyncGenerator[Any, None]:
+        future = asyncio.get_running_loop().run_in_executor(
+            self._get_executor(),
+            _ingest_file,
+            type(parser),
+            parser.config,  # type: ignore
+            path,
+            kwargs,
+        )
+        for result in await self._wait(future, deadline):
+            yield result
+
+    async def _ingest_pages(
+        self, parser: AsyncParser, path: str, deadline: Optional[float]
+    ) -> AsyncGenerator[str, None]:
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        parser_cls = type(parser)
+        page_count = await self._wait(
+            loop.run_in_executor(executor, parser_cls.count_pages, path),
+            deadline,
+        )
+
+        starts = iter(range(0, page_count, self.pages_per_task))
+        pending: deque[asyncio.Future] = deque()
+
+        def submit() -> None:
+            start = next(starts, None)
+            if start is not None:
+                pending.append(
+                    loop.run_in_executor(
+                        executor,
+                        parser_cls.extract_pages,
+                        path,
+                        start,
+                        start + self.pages_per_task,
+                    )
+                )
+
+        try:
+            for _ in range(2 * self.max_workers):
+                submit()
+            while pending:
+                texts = await self._wait(pending[0], deadline)
+                pending.popleft()
+                submit()
+                for text in texts:
+                    yield text
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -1,4 +1,4 @@
-from .auth import AuthConfig, AuthProvider
+from .auth import AuthConfig, AuthProvider, CredentialCache
 from .base import AppConfig, Provider, ProviderConfig
 from .crypto import CryptoConfig, CryptoProvider
 from .database import (
@@ -10,7 +10,14 @@ from .database import (
     PostgresConfigurationSettings,
 )
 from .email import EmailConfig, EmailProvider
-from .embedding import EmbeddingConfig, EmbeddingProvider
+from .embedding import (
+    EmbeddingBatcher,
+    EmbeddingBatchingSettings,
+    EmbeddingCache,
+    EmbeddingCacheSettings,
+    EmbeddingConfig,
+    EmbeddingProvider,
+)
 from .ingestion import (
     ChunkingStrategy,
     IngestionConfig,
@@ -24,6 +31,7 @@ __all__ = [
     # Auth provider
     "AuthConfig",
     "AuthProvider",
+    "CredentialCache",
     # Base provider classes
     "AppConfig",
     "Provider",
@@ -47,6 +55,10 @@ __all__ = [
     "DatabaseProvider",
     "Handler",
     # Embedding provider
+    "EmbeddingBatcher",
+    "EmbeddingBatchingSettings",
+    "EmbeddingCache",
+    "EmbeddingCacheSettings",
     "EmbeddingConfig",
     "EmbeddingProvider",
     # LLM provider
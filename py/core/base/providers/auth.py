@@ -1,7 +1,11 @@
+import hashlib
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
+from uuid import UUID
 
 from fastapi import Security
 from fastapi.security import (
@@ -32,6 +36,13 @@ class AuthConfig(ProviderConfig):
     default_admin_password: str = "change_me_immediately"
     access_token_lifetime_in_minutes: Optional[int] = None
     refresh_token_lifetime_in_days: Optional[int] = None
+    # Cache verified credentials for this many seconds. Disabled when unset.
+    credential_cache_ttl_seconds: Optional[float] = None
+    credential_cache_max_entries: int = 10_000
+    # Answer blacklist checks from an in-memory mirror of the blacklisted
+    # tokens table, reloaded once it is older than this many seconds.
+    # Disabled when unset.
+    blacklist_mirror_refresh_seconds: Optional[float] = None
 
     @property
     def supported_providers(self) -> list[str]:
@@ -41,6 +52,84 @@ class AuthConfig(ProviderConfig):
         pass
 
 
+class CredentialCache:
+    """A bounded, short-lived cache of verified credentials.
+
+    Maps a SHA-256 digest of a bearer token or API key to the `User` it
+    resolved to, so that repeat requests skip token decoding, API key hashing
+    and the user lookup. Entries expire after `ttl_seconds`, or earlier if the
+    credential itself expires, and are dropped per user whenever that user
+    changes.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, User]] = OrderedDict()
+        self._keys_by_user: dict[UUID, set[bytes]] = {}
+
+    @staticmethod
+    def make_key(credential: str) -> bytes:
+        return hashlib.sha256(credential.encode()).digest()
+
+    def get(self, credential: str) -> Optional[User]:
+        key = self.make_key(credential)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, user = entry
+        if time.monotonic() >= expires_at:
+            self._discard(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return user
+
+    def set(
+        self,
+        credential: str,
+        user: User,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        ttl = self.ttl_seconds
+        if expires_at is not None:
+            ttl = min(ttl, expires_at.timestamp() - time.time())
+        if ttl <= 0:
+            return
+
+        key = self.make_key(credential)
+        self._discard(key)
+        self._entries[key] = (time.monotonic() + ttl, user)
+        self._keys_by_user.setdefault(user.id, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+    def invalidate(self, credential: str) -> None:
+        self._discard(self.make_key(credential))
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        for key in self._keys_by_user.pop(user_id, set()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_keys = self._keys_by_user.get(entry[1].id)
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[entry[1].id]
+
+
 class AuthProvider(Provider, ABC):
     security = HTTPBearer(auto_error=False)
     crypto_provider: CryptoProvider
@@ -67,6 +156,17 @@ class AuthProvider(Provider, ABC):
         super().__init__(config)
         self.config: AuthConfig = config
         self.database_provider: "PostgresDatabaseProvider" = database_provider
+        self.credential_cache: Optional[CredentialCache] = None
+        if config.credential_cache_ttl_seconds:
+            self.credential_cache = CredentialCache(
+                config.credential_cache_ttl_seconds,
+                config.credential_cache_max_entries,
+            )
+            # Any change to a user (password, roles, collections, API keys)
+            # drops their cached credentials.
+            database_provider.users_handler.add_invalidation_hook(
+                self.credential_cache.invalidate_user
+            )
 
     async def _get_default_admin_user(self) -> User:
         return await self.database_provider.users_handler.get_user_by_email(
@@ -119,6 +219,37 @@ class AuthProvider(Provider, ABC):
     ) -> dict[str, Token]:
         pass
 
+    async def _get_cached_user(
+        self, credential: str, is_bearer: bool
+    ) -> Optional[User]:
+        if self.credential_cache is None:
+            return None
+        user = self.credential_cache.get(credential)
+        if user is None:
+            return None
+        # Tokens may have been revoked by another worker since they were
+        # cached.
+        if (
+            is_bearer
+            and await self.database_provider.token_handler.is_token_blacklisted(
+                credential,
+                max_staleness_seconds=self.config.blacklist_mirror_refresh_seconds,
+            )
+        ):
+            self.credential_cache.invalidate(credential)
+            return None
+        return user
+
+    def _cache_user(
+        self,
+        credential: str,
+        user: User,
+        expires_at: Optional[datetime] = None,
+    ) -> User:
+        if self.credential_cache is not None:
+            self.credential_cache.set(credential, user, expires_at)
+        return user
+
     def auth_wrapper(
         self,
         public: bool = False,
@@ -146,6 +277,13 @@ class AuthProvider(Provider, ABC):
                     message="Cannot have both Bearer token and API key",
                     status_code=400,
                 )
+            cached_user = await self._get_cached_user(
+                auth.credentials if auth is not None else api_key,  # type: ignore
+                is_bearer=auth is not None,
+            )
+            if cached_user is not None:
+                return cached_user
+
             # 1. Try JWT if `auth` is present (Bearer token)
             if auth is not None:
                 credentials = auth.credentials
@@ -155,7 +293,9 @@ class AuthProvider(Provider, ABC):
                         token_data.email
                     )
                     if user is not None:
-                        return user
+                        return self._cache_user(
+                            credentials, user, token_data.exp
+                        )
                 except R2RException:
                     # JWT decoding failed for logical reasons (invalid token)
                     pass
@@ -179,7 +319,7 @@ class AuthProvider(Provider, ABC):
                                 api_key_record["user_id"]
                             )
                             if user is not None and user.is_active:
-                                return user
+                                return self._cache_user(credentials, user)
 
             # 3. If no Bearer token worked, try the X-API-Key header
             if api_key is not None and "." in api_key:
@@ -196,7 +336,7 @@ class AuthProvider(Provider, ABC):
                             api_key_record["user_id"]
                         )
                         if user is not None and user.is_active:
-                            return user
+                            return self._cache_user(api_key, user)
 
             # If we reach here, both JWT and API key auth failed
             raise R2RException(
@@ -37,6 +37,7 @@ class DatabaseConnectionManager(ABC):
         self,
         query: str,
         params: Optional[dict[str, Any] | Sequence[Any]] = None,
+        settings: Optional[dict[str, str]] = None,
     ):
         pass
 
@@ -132,6 +133,12 @@ class DatabaseConfig(ProviderConfig):
     collection_summary_system_prompt: str = "system"
     collection_summary_prompt: str = "collection_summary"
     enable_fts: bool = False
+    # Store chunks with a binary COPY into a staging table instead of
+    # per-row upserts. Recommended for high-volume ingestion.
+    bulk_load_chunks: bool = False
+    # Stored files are written to and read from large objects in pieces of
+    # this size. Files no larger than it are written in a single round trip.
+    file_chunk_size: int = 4 * 1024 * 1024
 
     # Graph settings
     batch_size: Optional[int] = 1
@@ -141,6 +148,10 @@ class DatabaseConfig(ProviderConfig):
     )
     graph_creation_settings: GraphCreationSettings = GraphCreationSettings()
     graph_search_settings: GraphSearchSettings = GraphSearchSettings()
+    # "service" posts relationships to the clustering service at
+    # CLUSTERING_SERVICE_URL. "local" clusters in a worker process of this
+    # server, which requires graspologic to be installed.
+    graph_clustering_backend: str = "service"
 
     # Rate limits
     limits: LimitSettings = LimitSettings(
@@ -148,10 +159,24 @@ class DatabaseConfig(ProviderConfig):
     )
     route_limits: dict[str, LimitSettings] = {}
     user_limits: dict[UUID, LimitSettings] = {}
+    # "postgres" counts `request_log` rows on every check. "memory" keeps
+    # per-minute counters in process, batches `request_log` inserts and only
+    # reads monthly totals from Postgres, refreshing them periodically.
+    limits_backend: str = "postgres"
+    request_log_flush_interval_seconds: float = 5.0
+    monthly_count_refresh_seconds: float = 60.0
 
     def validate_config(self) -> None:
         if self.provider not in self.supported_providers:
             raise ValueError(f"Provider '{self.provider}' is not supported.")
+        if self.limits_backend not in ("postgres", "memory"):
+            raise ValueError(
+                f"Limits backend '{self.limits_backend}' is not supported."
+            )
+        if self.graph_clustering_backend not in ("service", "local"):
+            raise ValueError(
+                f"Graph clustering backend '{self.graph_clustering_backend}' is not supported."
+            )
 
     @property
     def supported_providers(self) -> list[str]:
@@ -3,10 +3,13 @@ import logging
 import random
 import time
 from abc import abstractmethod
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
+import numpy as np
 from litellm import AuthenticationError
+from pydantic import BaseModel
 
 from core.base.abstractions import VectorQuantizationSettings
 
@@ -20,6 +23,163 @@ from .base import Provider, ProviderConfig
 logger = logging.getLogger()
 
 
+class EmbeddingCacheSettings(BaseModel):
+    """Settings for the in-process embedding cache."""
+
+    enabled: bool = False
+    max_entries: int = 10_000
+    ttl_seconds: Optional[float] = 3600
+    # Store vectors as compact numpy arrays ("float32" or "float16") rather
+    # than Python lists. "float16" halves memory again at a small precision
+    # cost.
+    storage_dtype: Optional[str] = None
+
+
+class EmbeddingCache:
+    """A bounded LRU cache of embeddings with an optional TTL.
+
+    Keys combine the model, stage, purpose and whitespace-normalized text so
+    that a cached vector is only reused for an equivalent request.
+    """
+
+    def __init__(self, settings: EmbeddingCacheSettings):
+        if settings.storage_dtype not in (None, "float32", "float16"):
+            raise ValueError(
+                f"Unsupported embedding cache storage_dtype '{settings.storage_dtype}'."
+            )
+        self.settings = settings
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        model: str, stage: Any, purpose: Any, text: str
+    ) -> tuple[str, str, str, str]:
+        return (model, str(stage), str(purpose), " ".join(text.split()))
+
+    def get(self, key: tuple) -> Optional[list[float]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        created_at, value = entry
+        if (
+            self.settings.ttl_seconds is not None
+            and time.monotonic() - created_at > self.settings.ttl_seconds
+        ):
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value.tolist() if isinstance(value, np.ndarray) else value
+
+    def set(self, key: tuple, vector: list[float]) -> None:
+        value: Any = vector
+        if self.settings.storage_dtype:
+            value = np.asarray(vector, dtype=self.settings.storage_dtype)
+
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.settings.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class EmbeddingBatchingSettings(BaseModel):
+    """Settings for coalescing concurrent single-text embedding requests."""
+
+    enabled: bool = False
+    # How long the first request of a batch waits for others to join.
+    window_ms: float = 5.0
+    max_batch_size: int = 64
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent single-text embedding requests into batches.
+
+    Requests with the same stage and purpose that arrive within
+    `window_ms` of each other are sent as one multi-text request, with
+    identical texts embedded only once. A batch is dispatched early once it
+    reaches `max_batch_size` requests.
+    """
+
+    def __init__(
+        self,
+        settings: EmbeddingBatchingSettings,
+        execute: Callable[[dict[str, Any]], Awaitable[list[list[float]]]],
+    ):
+        self.settings = settings
+        self._execute = execute
+        self._pending: dict[tuple, list[tuple[str, asyncio.Future]]] = {}
+        self._timers: dict[tuple, asyncio.TimerHandle] = {}
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def submit(self, task: dict[str, Any]) -> list[list[float]]:
+        loop = asyncio.get_running_loop()
+        key = (task["stage"], task["purpose"])
+        future: asyncio.Future = loop.create_future()
+
+        pending = self._pending.setdefault(key, [])
+        pending.append((task["texts"][0], future))
+        if len(pending) >= self.settings.max_batch_size:
+            self._flush(key, task)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(
+                self.settings.window_ms / 1000, self._flush, key, task
+            )
+
+        return [await future]
+
+    def _flush(self, key: tuple, task: dict[str, Any]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        pending = self._pending.pop(key, [])
+        if not pending:
+            return
+
+        dispatch = asyncio.create_task(self._dispatch(task, pending))
+        self._in_flight.add(dispatch)
+        dispatch.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(
+        self,
+        task: dict[str, Any],
+        pending: list[tuple[str, asyncio.Future]],
+    ) -> None:
+        texts = list(dict.fromkeys(text for text, _ in pending))
+        try:
+            vectors = await self._execute({**task, "texts": texts})
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        vectors_by_text = dict(zip(texts, vectors, strict=True))
+        for text, future in pending:
+            if not future.done():
+                future.set_result(vectors_by_text[text])
+
+
 class EmbeddingConfig(ProviderConfig):
     provider: str
     base_model: str
@@ -36,6 +196,8 @@ class EmbeddingConfig(ProviderConfig):
     quantization_settings: VectorQuantizationSettings = (
         VectorQuantizationSettings()
     )
+    cache_settings: EmbeddingCacheSettings = EmbeddingCacheSettings()
+    batching_settings: EmbeddingBatchingSettings = EmbeddingBatchingSettings()
 
     ## deprecated
     rerank_dimension: Optional[int] = None
@@ -66,8 +228,65 @@ class EmbeddingProvider(Provider):
         self.config: EmbeddingConfig = config
         self.semaphore = asyncio.Semaphore(config.concurrent_request_limit)
         self.current_requests = 0
+        self.cache: Optional[EmbeddingCache] = (
+            EmbeddingCache(config.cache_settings)
+            if config.cache_settings.enabled
+            else None
+        )
+        self.batcher: Optional[EmbeddingBatcher] = (
+            EmbeddingBatcher(
+                config.batching_settings, self._execute_with_retries_async
+            )
+            if config.batching_settings.enabled
+            else None
+        )
 
     async def _execute_with_backoff_async(self, task: dict[str, Any]):
+        # Extra provider kwargs may change the resulting vectors, so such
+        # requests always bypass the cache.
+        if (
+            self.cache is not None
+            and "texts" in task
+            and not task.get("kwargs")
+        ):
+            return await self._execute_with_cache_async(task)
+        return await self._execute_uncached_async(task)
+
+    async def _execute_uncached_async(self, task: dict[str, Any]):
+        if (
+            self.batcher is not None
+            and len(task.get("texts", [])) == 1
+            and not task.get("kwargs")
+        ):
+            return await self.batcher.submit(task)
+        return await self._execute_with_retries_async(task)
+
+    async def _execute_with_cache_async(
+        self, task: dict[str, Any]
+    ) -> list[list[float]]:
+        cache = self.cache
+        assert cache is not None
+        texts: list[str] = task["texts"]
+        keys = [
+            EmbeddingCache.make_key(
+                self.config.base_model, task["stage"], task["purpose"], text
+            )
+            for text in texts
+        ]
+        vectors: list[Optional[list[float]]] = [cache.get(key) for key in keys]
+
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            computed = await self._execute_uncached_async(
+                {**task, "texts": [texts[i] for i in missing]}
+            )
+            for i, vector in zip(missing, computed, strict=True):
+                cache.set(keys[i], vector)
+                vectors[i] = vector
+
+        return vectors  # type: ignore
+
+    async def _execute_with_retries_async(self, task: dict[str, Any]):
         retries = 0
         backoff = self.config.initial_backoff
         while retries < self.config.max_retries:
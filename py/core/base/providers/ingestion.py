@@ -43,6 +43,9 @@ class IngestionConfig(ProviderConfig):
         "vision_img_model": None,
         "vision_pdf_prompt_name": "vision_pdf",
         "vision_pdf_model": None,
+        "vision_pdf_dpi": 300,
+        "vision_pdf_window_pages": 8,
+        "vision_pdf_max_concurrent_pages": 8,
         "skip_document_summary": False,
         "document_summary_system_prompt": "system",
         "document_summary_task_prompt": "summary",
@@ -52,6 +55,11 @@ class IngestionConfig(ProviderConfig):
         "parser_overrides": {},
         "extra_fields": {},
         "automatic_extraction": False,
+        "pipeline_ingestion": False,
+        "pipeline_queue_size": 256,
+        "parser_process_pool_workers": 0,
+        "parser_timeout_seconds": 600.0,
+        "parser_pages_per_task": 8,
     }
 
     provider: str = Field(
@@ -95,6 +103,21 @@ class IngestionConfig(ProviderConfig):
     vision_pdf_model: Optional[str] = Field(
         default_factory=lambda: IngestionConfig._defaults["vision_pdf_model"]
     )
+    # Vision PDF pages are rendered `vision_pdf_window_pages` at a time, with
+    # at most `vision_pdf_max_concurrent_pages` awaiting the vision model.
+    vision_pdf_dpi: int = Field(
+        default_factory=lambda: IngestionConfig._defaults["vision_pdf_dpi"]
+    )
+    vision_pdf_window_pages: int = Field(
+        default_factory=lambda: IngestionConfig._defaults[
+            "vision_pdf_window_pages"
+        ]
+    )
+    vision_pdf_max_concurrent_pages: int = Field(
+        default_factory=lambda: IngestionConfig._defaults[
+            "vision_pdf_max_concurrent_pages"
+        ]
+    )
     skip_document_summary: bool = Field(
         default_factory=lambda: IngestionConfig._defaults[
             "skip_document_summary"
@@ -133,6 +156,33 @@ class IngestionConfig(ProviderConfig):
             "document_summary_max_length"
         ]
     )
+    # Parse, embed and store file chunks as a pipeline of bounded queues
+    # rather than one stage after another.
+    pipeline_ingestion: bool = Field(
+        default_factory=lambda: IngestionConfig._defaults["pipeline_ingestion"]
+    )
+    pipeline_queue_size: int = Field(
+        default_factory=lambda: IngestionConfig._defaults[
+            "pipeline_queue_size"
+        ]
+    )
+    # With workers > 0, CPU-bound parsers run in a pool of worker processes
+    # instead of on the event loop, with PDFs split into page ranges.
+    parser_process_pool_workers: int = Field(
+        default_factory=lambda: IngestionConfig._defaults[
+            "parser_process_pool_workers"
+        ]
+    )
+    parser_timeout_seconds: Optional[float] = Field(
+        default_factory=lambda: IngestionConfig._defaults[
+            "parser_timeout_seconds"
+        ]
+    )
+    parser_pages_per_task: int = Field(
+        default_factory=lambda: IngestionConfig._defaults[
+            "parser_pages_per_task"
+        ]
+    )
 
     @classmethod
     def set_default(cls, **kwargs):
@@ -167,6 +217,9 @@ class IngestionProvider(Provider, ABC):
     config: IngestionConfig
     database_provider: "PostgresDatabaseProvider"
     llm_provider: CompletionProvider
+    # Providers that set this accept a binary file object in place of bytes
+    # in `parse`.
+    accepts_file_objects: bool = False
 
     def __init__(
         self,
@@ -178,3 +231,7 @@ class IngestionProvider(Provider, ABC):
         self.config: IngestionConfig = config
         self.llm_provider = llm_provider
         self.database_provider: "PostgresDatabaseProvider" = database_provider
+
+    def close(self) -> None:
+        """Releases resources held by the provider, such as worker
+        processes."""
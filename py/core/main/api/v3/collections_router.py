@@ -5,11 +5,10 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import Body, Depends, Path, Query
-from fastapi.background import BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
 from core.base import R2RException
-from core.base.abstractions import GraphCreationSettings
+from core.base.abstractions import ExportFormat, GraphCreationSettings
 from core.base.api.models import (
     GenericBooleanResponse,
     WrappedBooleanResponse,
@@ -238,7 +237,6 @@ class CollectionsRouter(BaseRouterV3):
         )
         @self.base_endpoint
         async def export_collections(
-            background_tasks: BackgroundTasks,
             columns: Optional[list[str]] = Body(
                 None, description="Specific columns to export"
             ),
@@ -248,9 +246,13 @@ class CollectionsRouter(BaseRouterV3):
             include_header: Optional[bool] = Body(
                 True, description="Whether to include column headers"
             ),
+            export_format: ExportFormat = Body(
+                ExportFormat.CSV,
+                description="The format to export in: `csv`, or `parquet` or `arrow` for columnar output",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
-        ) -> FileResponse:
-            """Export collections as a CSV file."""
+        ) -> StreamingResponse:
+            """Export collections as a CSV, Parquet or Arrow file."""
 
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -258,23 +260,21 @@ class CollectionsRouter(BaseRouterV3):
                     403,
                 )
 
-            (
-                csv_file_path,
-                temp_file,
-            ) = await self.services.management.export_collections(
+            export_stream = await self.services.management.export_collections(
                 columns=columns,
                 filters=filters,
                 include_header=include_header
                 if include_header is not None
                 else True,
+                export_format=export_format,
             )
 
-            background_tasks.add_task(temp_file.close)
-
-            return FileResponse(
-                path=csv_file_path,
-                media_type="text/csv",
-                filename="collections_export.csv",
+            return StreamingResponse(
+                export_stream,
+                media_type=export_format.media_type,
+                headers={
+                    "Content-Disposition": f"attachment; filename=collections_export.{export_format.value}",
+                },
             )
 
         @self.router.get(
@@ -338,6 +338,14 @@ class CollectionsRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="The `next_cursor` of the previous page. Returns the page after it, which is as fast to fetch as the first page however deep it is.",
+            ),
+            exact_total: bool = Query(
+                False,
+                description="Whether to count `total_entries` exactly. By default it may be an estimate, which is much cheaper for long lists.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedCollectionsResponse:
             """Returns a paginated list of collections the authenticated user
@@ -362,6 +370,8 @@ class CollectionsRouter(BaseRouterV3):
                     collection_ids=collection_uuids,
                     offset=offset,
                     limit=limit,
+                    cursor=cursor,
+                    exact_total=exact_total,
                 )
             )
 
@@ -370,7 +380,10 @@ class CollectionsRouter(BaseRouterV3):
                 {
                     "total_entries": collections_overview_response[
                         "total_entries"
-                    ]
+                    ],
+                    "next_cursor": collections_overview_response[
+                        "next_cursor"
+                    ],
                 },
             )
 
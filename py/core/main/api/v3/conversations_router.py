@@ -4,10 +4,9 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import Body, Depends, Path, Query
-from fastapi.background import BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
-from core.base import Message, R2RException
+from core.base import ExportFormat, Message, R2RException
 from core.base.api.models import (
     GenericBooleanResponse,
     WrappedBooleanResponse,
@@ -153,6 +152,14 @@ class ConversationsRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="The `next_cursor` of the previous page. Returns the page after it, which is as fast to fetch as the first page however deep it is.",
+            ),
+            exact_total: bool = Query(
+                False,
+                description="Whether to count `total_entries` exactly. By default it may be an estimate, which is much cheaper for long lists.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedConversationsResponse:
             """List conversations with pagination and sorting options.
@@ -174,10 +181,13 @@ class ConversationsRouter(BaseRouterV3):
                     limit=limit,
                     conversation_ids=conversation_uuids,
                     user_ids=requesting_user_id,
+                    cursor=cursor,
+                    exact_total=exact_total,
                 )
             )
             return conversations_response["results"], {  # type: ignore
-                "total_entries": conversations_response["total_entries"]
+                "total_entries": conversations_response["total_entries"],
+                "next_cursor": conversations_response["next_cursor"],
             }
 
         @self.router.post(
@@ -235,7 +245,6 @@ class ConversationsRouter(BaseRouterV3):
         )
         @self.base_endpoint
         async def export_conversations(
-            background_tasks: BackgroundTasks,
             columns: Optional[list[str]] = Body(
                 None, description="Specific columns to export"
             ),
@@ -245,9 +254,13 @@ class ConversationsRouter(BaseRouterV3):
             include_header: Optional[bool] = Body(
                 True, description="Whether to include column headers"
             ),
+            export_format: ExportFormat = Body(
+                ExportFormat.CSV,
+                description="The format to export in: `csv`, or `parquet` or `arrow` for columnar output",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
-        ) -> FileResponse:
-            """Export conversations as a downloadable CSV file."""
+        ) -> StreamingResponse:
+            """Export conversations as a downloadable CSV, Parquet or Arrow file."""
 
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -255,23 +268,23 @@ class ConversationsRouter(BaseRouterV3):
                     403,
                 )
 
-            (
-                csv_file_path,
-                temp_file,
-            ) = await self.services.management.export_conversations(
-                columns=columns,
-                filters=filters,
-                include_header=include_header
-                if include_header is not None
-                else True,
+            export_stream = (
+                await self.services.management.export_conversations(
+                    columns=columns,
+                    filters=filters,
+                    include_header=include_header
+                    if include_header is not None
+                    else True,
+                    export_format=export_format,
+                )
             )
 
-            background_tasks.add_task(temp_file.close)
-
-            return FileResponse(
-                path=csv_file_path,
-                media_type="text/csv",
-                filename="documents_export.csv",
+            return StreamingResponse(
+                export_stream,
+                media_type=export_format.media_type,
+                headers={
+                    "Content-Disposition": f"attachment; filename=documents_export.{export_format.value}",
+                },
             )
 
         @self.router.post(
@@ -329,7 +342,6 @@ class ConversationsRouter(BaseRouterV3):
         )
         @self.base_endpoint
         async def export_messages(
-            background_tasks: BackgroundTasks,
             columns: Optional[list[str]] = Body(
                 None, description="Specific columns to export"
             ),
@@ -339,9 +351,13 @@ class ConversationsRouter(BaseRouterV3):
             include_header: Optional[bool] = Body(
                 True, description="Whether to include column headers"
             ),
+            export_format: ExportFormat = Body(
+                ExportFormat.CSV,
+                description="The format to export in: `csv`, or `parquet` or `arrow` for columnar output",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
-        ) -> FileResponse:
-            """Export conversations as a downloadable CSV file."""
+        ) -> StreamingResponse:
+            """Export conversations as a downloadable CSV, Parquet or Arrow file."""
 
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -349,23 +365,21 @@ class ConversationsRouter(BaseRouterV3):
                     403,
                 )
 
-            (
-                csv_file_path,
-                temp_file,
-            ) = await self.services.management.export_messages(
+            export_stream = await self.services.management.export_messages(
                 columns=columns,
                 filters=filters,
                 include_header=include_header
                 if include_header is not None
                 else True,
+                export_format=export_format,
             )
 
-            background_tasks.add_task(temp_file.close)
-
-            return FileResponse(
-                path=csv_file_path,
-                media_type="text/csv",
-                filename="documents_export.csv",
+            return StreamingResponse(
+                export_stream,
+                media_type=export_format.media_type,
+                headers={
+                    "Content-Disposition": f"attachment; filename=documents_export.{export_format.value}",
+                },
             )
 
         @self.router.get(
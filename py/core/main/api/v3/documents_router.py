@@ -1,16 +1,14 @@
-import base64
 import logging
 import mimetypes
 import textwrap
 from datetime import datetime
 from io import BytesIO
-from typing import Any, Optional
+from typing import Any, AsyncGenerator, Optional
 from urllib.parse import quote
 from uuid import UUID
 
 from fastapi import Body, Depends, File, Form, Path, Query, UploadFile
-from fastapi.background import BackgroundTasks
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
 from pydantic import Json
 
 from core.base import (
@@ -25,7 +23,11 @@ from core.base import (
     generate_id,
     select_search_filters,
 )
-from core.base.abstractions import GraphCreationSettings, StoreType
+from core.base.abstractions import (
+    ExportFormat,
+    GraphCreationSettings,
+    StoreType,
+)
 from core.base.api.models import (
     GenericBooleanResponse,
     WrappedBooleanResponse,
@@ -319,20 +321,20 @@ class DocumentsRouter(BaseRouterV3):
                         message=f"User has reached the maximum number of documents allowed ({user_max_documents}).",
                     )
 
-                # Get chunks using the vector handler's list_chunks method
                 user_chunk_count = (
-                    await self.services.ingestion.list_chunks(
-                        filters={"owner_id": {"$eq": str(auth_user.id)}},
-                        offset=0,
-                        limit=1,
+                    await self.services.management.get_user_chunk_count(
+                        auth_user.id
                     )
-                )["total_entries"]
+                )
                 user_max_chunks = (
                     await self.services.management.get_user_max_chunks(
                         auth_user.id
                     )
                 )
-                if user_chunk_count >= user_max_chunks:
+                if (
+                    user_max_chunks is not None
+                    and user_chunk_count >= user_max_chunks
+                ):
                     raise R2RException(
                         status_code=403,
                         message=f"User has reached the maximum number of chunks allowed ({user_max_chunks}).",
@@ -451,25 +453,23 @@ class DocumentsRouter(BaseRouterV3):
                 }
 
             else:
+                files_handler = self.providers.database.files_handler
                 if file:
-                    file_data = await self._process_file(file)
-
                     if not file.filename:
                         raise R2RException(
                             status_code=422,
                             message="Uploaded file must have a filename.",
                         )
+                    filename: str = file.filename
 
-                    file_ext = file.filename.split(".")[
-                        -1
-                    ]  # e.g. "pdf", "txt"
+                    file_ext = filename.split(".")[-1]  # e.g. "pdf", "txt"
                     max_allowed_size = await self.services.management.get_max_upload_size_by_type(
                         user_id=auth_user.id, file_type_or_ext=file_ext
                     )
 
-                    content_length = file_data["content_length"]
-
-                    if content_length > max_allowed_size:
+                    # The size of a spooled upload is usually known up front,
+                    # and is enforced again while streaming when it is not.
+                    if file.size is not None and file.size > max_allowed_size:
                         raise R2RException(
                             status_code=413,  # HTTP 413: Payload Too Large
                             message=(
@@ -478,17 +478,26 @@ class DocumentsRouter(BaseRouterV3):
                             ),
                         )
 
-                    file_content = BytesIO(
-                        base64.b64decode(file_data["content"])
-                    )
-
-                    file_data.pop("content", None)
                     document_id = id or generate_document_id(
-                        file_data["filename"], auth_user.id
+                        filename, auth_user.id
                     )
+                    (
+                        content_length,
+                        content_hash,
+                    ) = await files_handler.store_file_stream(
+                        document_id,
+                        filename,
+                        self._iter_upload(file, files_handler.chunk_size),
+                        file.content_type,
+                        max_size=max_allowed_size,
+                    )
+                    file_data = {
+                        "filename": filename,
+                        "content_type": file.content_type,
+                        "content_hash": content_hash,
+                    }
                 elif raw_text:
                     content_length = len(raw_text)
-                    file_content = BytesIO(raw_text.encode("utf-8"))
                     document_id = id or generate_document_id(
                         raw_text, auth_user.id
                     )
@@ -496,6 +505,12 @@ class DocumentsRouter(BaseRouterV3):
                         "filename": "N/A",
                         "content_type": "text/plain",
                     }
+                    await files_handler.store_file(
+                        document_id,
+                        "N/A",
+                        BytesIO(raw_text.encode("utf-8")),
+                        "text/plain",
+                    )
                 else:
                     raise R2RException(
                         status_code=422,
@@ -520,13 +535,6 @@ class DocumentsRouter(BaseRouterV3):
             }
 
             file_name = file_data["filename"]
-            await self.providers.database.files_handler.store_file(
-                document_id,
-                file_name,
-                file_content,
-                file_data["content_type"],
-            )
-
             await self.services.ingestion.ingest_file_ingress(
                 file_data=workflow_input["file_data"],
                 user=auth_user,
@@ -776,7 +784,6 @@ class DocumentsRouter(BaseRouterV3):
         )
         @self.base_endpoint
         async def export_documents(
-            background_tasks: BackgroundTasks,
             columns: Optional[list[str]] = Body(
                 None, description="Specific columns to export"
             ),
@@ -786,9 +793,13 @@ class DocumentsRouter(BaseRouterV3):
             include_header: Optional[bool] = Body(
                 True, description="Whether to include column headers"
             ),
+            export_format: ExportFormat = Body(
+                ExportFormat.CSV,
+                description="The format to export in: `csv`, or `parquet` or `arrow` for columnar output",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
-        ) -> FileResponse:
-            """Export documents as a downloadable CSV file."""
+        ) -> StreamingResponse:
+            """Export documents as a downloadable CSV, Parquet or Arrow file."""
 
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -796,23 +807,21 @@ class DocumentsRouter(BaseRouterV3):
                     403,
                 )
 
-            (
-                csv_file_path,
-                temp_file,
-            ) = await self.services.management.export_documents(
+            export_stream = await self.services.management.export_documents(
                 columns=columns,
                 filters=filters,
                 include_header=include_header
                 if include_header is not None
                 else True,
+                export_format=export_format,
             )
 
-            background_tasks.add_task(temp_file.close)
-
-            return FileResponse(
-                path=csv_file_path,
-                media_type="text/csv",
-                filename="documents_export.csv",
+            return StreamingResponse(
+                export_stream,
+                media_type=export_format.media_type,
+                headers={
+                    "Content-Disposition": f"attachment; filename=documents_export.{export_format.value}",
+                },
             )
 
         @self.router.get(
@@ -890,26 +899,18 @@ class DocumentsRouter(BaseRouterV3):
                         message="Non-superusers must provide document IDs to export.",
                     )
 
-            (
-                zip_name,
-                zip_content,
-                zip_size,
-            ) = await self.services.management.export_files(
+            zip_name, zip_stream = await self.services.management.export_files(
                 document_ids=document_ids,
                 start_date=start_date,
                 end_date=end_date,
             )
             encoded_filename = quote(zip_name)
 
-            async def stream_file():
-                yield zip_content.getvalue()
-
             return StreamingResponse(
-                stream_file(),
+                zip_stream,
                 media_type="application/zip",
                 headers={
                     "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}",
-                    "Content-Length": str(zip_size),
                 },
             )
 
@@ -981,6 +982,14 @@ class DocumentsRouter(BaseRouterV3):
                 False,
                 description="Specifies whether or not to include embeddings of each document summary.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="The `next_cursor` of the previous page. Returns the page after it, which is as fast to fetch as the first page however deep it is.",
+            ),
+            exact_total: bool = Query(
+                False,
+                description="Whether to count `total_entries` exactly. By default it may be an estimate, which is much cheaper for long lists.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedDocumentsResponse:
             """Returns a paginated list of documents the authenticated user has
@@ -1008,6 +1017,8 @@ class DocumentsRouter(BaseRouterV3):
                     document_ids=document_uuids,
                     offset=offset,
                     limit=limit,
+                    cursor=cursor,
+                    exact_total=exact_total,
                 )
             )
             if not include_summary_embeddings:
@@ -1019,7 +1030,8 @@ class DocumentsRouter(BaseRouterV3):
                 {
                     "total_entries": documents_overview_response[
                         "total_entries"
-                    ]
+                    ],
+                    "next_cursor": documents_overview_response["next_cursor"],
                 },
             )
 
@@ -1338,29 +1350,21 @@ class DocumentsRouter(BaseRouterV3):
                         "Not authorized to access this document.", 403
                     )
 
-            file_tuple = await self.services.management.download_file(
+            (
+                file_name,
+                file_stream,
+                file_size,
+            ) = await self.services.management.download_file_stream(
                 document_uuid
             )
-            if not file_tuple:
-                raise R2RException(status_code=404, message="File not found.")
-
-            file_name, file_content, file_size = file_tuple
             encoded_filename = quote(file_name)
 
             mime_type, _ = mimetypes.guess_type(file_name)
             if not mime_type:
                 mime_type = "application/octet-stream"
 
-            async def file_stream():
-                chunk_size = 1024 * 1024  # 1MB
-                while True:
-                    data = file_content.read(chunk_size)
-                    if not data:
-                        break
-                    yield data
-
             return StreamingResponse(
-                file_stream(),
+                file_stream,
                 media_type=mime_type,
                 headers={
                     "Content-Disposition": f"inline; filename*=UTF-8''{encoded_filename}",
@@ -1998,7 +2002,6 @@ class DocumentsRouter(BaseRouterV3):
         )
         @self.base_endpoint
         async def export_entities(
-            background_tasks: BackgroundTasks,
             id: UUID = Path(
                 ...,
                 description="The ID of the document to export entities from.",
@@ -2012,9 +2015,13 @@ class DocumentsRouter(BaseRouterV3):
             include_header: Optional[bool] = Body(
                 True, description="Whether to include column headers"
             ),
+            export_format: ExportFormat = Body(
+                ExportFormat.CSV,
+                description="The format to export in: `csv`, or `parquet` or `arrow` for columnar output",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
-        ) -> FileResponse:
-            """Export documents as a downloadable CSV file."""
+        ) -> StreamingResponse:
+            """Export documents as a downloadable CSV, Parquet or Arrow file."""
 
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -2022,24 +2029,24 @@ class DocumentsRouter(BaseRouterV3):
                     403,
                 )
 
-            (
-                csv_file_path,
-                temp_file,
-            ) = await self.services.management.export_document_entities(
-                id=id,
-                columns=columns,
-                filters=filters,
-                include_header=include_header
-                if include_header is not None
-                else True,
+            export_stream = (
+                await self.services.management.export_document_entities(
+                    id=id,
+                    columns=columns,
+                    filters=filters,
+                    include_header=include_header
+                    if include_header is not None
+                    else True,
+                    export_format=export_format,
+                )
             )
 
-            background_tasks.add_task(temp_file.close)
-
-            return FileResponse(
-                path=csv_file_path,
-                media_type="text/csv",
-                filename="documents_export.csv",
+            return StreamingResponse(
+                export_stream,
+                media_type=export_format.media_type,
+                headers={
+                    "Content-Disposition": f"attachment; filename=documents_export.{export_format.value}",
+                },
             )
 
         @self.router.get(
@@ -2230,7 +2237,6 @@ class DocumentsRouter(BaseRouterV3):
         )
         @self.base_endpoint
         async def export_relationships(
-            background_tasks: BackgroundTasks,
             id: UUID = Path(
                 ...,
                 description="The ID of the document to export entities from.",
@@ -2244,9 +2250,13 @@ class DocumentsRouter(BaseRouterV3):
             include_header: Optional[bool] = Body(
                 True, description="Whether to include column headers"
             ),
+            export_format: ExportFormat = Body(
+                ExportFormat.CSV,
+                description="The format to export in: `csv`, or `parquet` or `arrow` for columnar output",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
-        ) -> FileResponse:
-            """Export documents as a downloadable CSV file."""
+        ) -> StreamingResponse:
+            """Export documents as a downloadable CSV, Parquet or Arrow file."""
 
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -2254,24 +2264,24 @@ class DocumentsRouter(BaseRouterV3):
                     403,
                 )
 
-            (
-                csv_file_path,
-                temp_file,
-            ) = await self.services.management.export_document_relationships(
-                id=id,
-                columns=columns,
-                filters=filters,
-                include_header=include_header
-                if include_header is not None
-                else True,
+            export_stream = (
+                await self.services.management.export_document_relationships(
+                    id=id,
+                    columns=columns,
+                    filters=filters,
+                    include_header=include_header
+                    if include_header is not None
+                    else True,
+                    export_format=export_format,
+                )
             )
 
-            background_tasks.add_task(temp_file.close)
-
-            return FileResponse(
-                path=csv_file_path,
-                media_type="text/csv",
-                filename="documents_export.csv",
+            return StreamingResponse(
+                export_stream,
+                media_type=export_format.media_type,
+                headers={
+                    "Content-Disposition": f"attachment; filename=documents_export.{export_format.value}",
+                },
             )
 
         @self.router.post(
@@ -2327,14 +2337,10 @@ class DocumentsRouter(BaseRouterV3):
             return results  # type: ignore
 
     @staticmethod
-    async def _process_file(file):
-        import base64
-
-        content = await file.read()
-
-        return {
-            "filename": file.filename,
-            "content": base64.b64encode(content).decode("utf-8"),
-            "content_type": file.content_type,
-            "content_length": len(content),
-        }
+    async def _iter_upload(
+        file: UploadFile, chunk_size: int
+    ) -> AsyncGenerator[bytes, None]:
+        """Read an upload chunk by chunk from the request's spool."""
+        await file.seek(0)
+        while chunk := await file.read(chunk_size):
+            yield chunk
@@ -4,11 +4,10 @@ from typing import Optional, cast
 from uuid import UUID
 
 from fastapi import Body, Depends, Path, Query
-from fastapi.background import BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
 from core.base import GraphConstructionStatus, R2RException, Workflow
-from core.base.abstractions import DocumentResponse, StoreType
+from core.base.abstractions import DocumentResponse, ExportFormat, StoreType
 from core.base.api.models import (
     GenericBooleanResponse,
     GenericMessageResponse,
@@ -140,6 +139,14 @@ class GraphRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="The `next_cursor` of the previous page. Returns the page after it, which is as fast to fetch as the first page however deep it is.",
+            ),
+            exact_total: bool = Query(
+                False,
+                description="Whether to count `total_entries` exactly. By default it may be an estimate, which is much cheaper for long lists.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedGraphsResponse:
             """Returns a paginated list of graphs the authenticated user has
@@ -163,11 +170,16 @@ class GraphRouter(BaseRouterV3):
                 graph_ids=graph_uuids,
                 offset=offset,
                 limit=limit,
+                cursor=cursor,
+                exact_total=exact_total,
             )
 
             return (  # type: ignore
                 list_graphs_response["results"],
-                {"total_entries": list_graphs_response["total_entries"]},
+                {
+                    "total_entries": list_graphs_response["total_entries"],
+                    "next_cursor": list_graphs_response["next_cursor"],
+                },
             )
 
         @self.router.get(
@@ -626,7 +638,6 @@ class GraphRouter(BaseRouterV3):
         )
         @self.base_endpoint
         async def export_entities(
-            background_tasks: BackgroundTasks,
             collection_id: UUID = Path(
                 ...,
                 description="The ID of the collection to export entities from.",
@@ -640,9 +651,13 @@ class GraphRouter(BaseRouterV3):
             include_header: Optional[bool] = Body(
                 True, description="Whether to include column headers"
             ),
+            export_format: ExportFormat = Body(
+                ExportFormat.CSV,
+                description="The format to export in: `csv`, or `parquet` or `arrow` for columnar output",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
-        ) -> FileResponse:
-            """Export documents as a downloadable CSV file."""
+        ) -> StreamingResponse:
+            """Export documents as a downloadable CSV, Parquet or Arrow file."""
 
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -650,24 +665,24 @@ class GraphRouter(BaseRouterV3):
                     403,
                 )
 
-            (
-                csv_file_path,
-                temp_file,
-            ) = await self.services.management.export_graph_entities(
-                id=collection_id,
-                columns=columns,
-                filters=filters,
-                include_header=include_header
-                if include_header is not None
-                else True,
+            export_stream = (
+                await self.services.management.export_graph_entities(
+                    id=collection_id,
+                    columns=columns,
+                    filters=filters,
+                    include_header=include_header
+                    if include_header is not None
+                    else True,
+                    export_format=export_format,
+                )
             )
 
-            background_tasks.add_task(temp_file.close)
-
-            return FileResponse(
-                path=csv_file_path,
-                media_type="text/csv",
-                filename="documents_export.csv",
+            return StreamingResponse(
+                export_stream,
+                media_type=export_format.media_type,
+                headers={
+                    "Content-Disposition": f"attachment; filename=documents_export.{export_format.value}",
+                },
             )
 
         @self.router.post(
@@ -834,7 +849,6 @@ class GraphRouter(BaseRouterV3):
         )
         @self.base_endpoint
         async def export_relationships(
-            background_tasks: BackgroundTasks,
             collection_id: UUID = Path(
                 ...,
                 description="The ID of the document to export entities from.",
@@ -848,9 +862,13 @@ class GraphRouter(BaseRouterV3):
             include_header: Optional[bool] = Body(
                 True, description="Whether to include column headers"
             ),
+            export_format: ExportFormat = Body(
+                ExportFormat.CSV,
+                description="The format to export in: `csv`, or `parquet` or `arrow` for columnar output",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
-        ) -> FileResponse:
-            """Export documents as a downloadable CSV file."""
+        ) -> StreamingResponse:
+            """Export documents as a downloadable CSV, Parquet or Arrow file."""
 
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -858,24 +876,24 @@ class GraphRouter(BaseRouterV3):
                     403,
                 )
 
-            (
-                csv_file_path,
-                temp_file,
-            ) = await self.services.management.export_graph_relationships(
-                id=collection_id,
-                columns=columns,
-                filters=filters,
-                include_header=include_header
-                if include_header is not None
-                else True,
+            export_stream = (
+                await self.services.management.export_graph_relationships(
+                    id=collection_id,
+                    columns=columns,
+                    filters=filters,
+                    include_header=include_header
+                    if include_header is not None
+                    else True,
+                    export_format=export_format,
+                )
             )
 
-            background_tasks.add_task(temp_file.close)
-
-            return FileResponse(
-                path=csv_file_path,
-                media_type="text/csv",
-                filename="documents_export.csv",
+            return StreamingResponse(
+                export_stream,
+                media_type=export_format.media_type,
+                headers={
+                    "Content-Disposition": f"attachment; filename=documents_export.{export_format.value}",
+                },
             )
 
         @self.router.get(
@@ -1744,7 +1762,6 @@ class GraphRouter(BaseRouterV3):
         )
         @self.base_endpoint
         async def export_communities(
-            background_tasks: BackgroundTasks,
             collection_id: UUID = Path(
                 ...,
                 description="The ID of the document to export entities from.",
@@ -1758,9 +1775,13 @@ class GraphRouter(BaseRouterV3):
             include_header: Optional[bool] = Body(
                 True, description="Whether to include column headers"
             ),
+            export_format: ExportFormat = Body(
+                ExportFormat.CSV,
+                description="The format to export in: `csv`, or `parquet` or `arrow` for columnar output",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
-        ) -> FileResponse:
-            """Export documents as a downloadable CSV file."""
+        ) -> StreamingResponse:
+            """Export documents as a downloadable CSV, Parquet or Arrow file."""
 
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -1768,24 +1789,24 @@ class GraphRouter(BaseRouterV3):
                     403,
                 )
 
-            (
-                csv_file_path,
-                temp_file,
-            ) = await self.services.management.export_graph_communities(
-                id=collection_id,
-                columns=columns,
-                filters=filters,
-                include_header=include_header
-                if include_header is not None
-                else True,
+            export_stream = (
+                await self.services.management.export_graph_communities(
+                    id=collection_id,
+                    columns=columns,
+                    filters=filters,
+                    include_header=include_header
+                    if include_header is not None
+                    else True,
+                    export_format=export_format,
+                )
             )
 
-            background_tasks.add_task(temp_file.close)
-
-            return FileResponse(
-                path=csv_file_path,
-                media_type="text/csv",
-                filename="documents_export.csv",
+            return StreamingResponse(
+                export_stream,
+                media_type=export_format.media_type,
+                headers={
+                    "Content-Disposition": f"attachment; filename=documents_export.{export_format.value}",
+                },
             )
 
         @self.router.post(
@@ -148,9 +148,28 @@ class PromptsRouter(BaseRouterV3):
         )
         @self.base_endpoint
         async def get_prompts(
+            offset: int = Query(
+                0,
+                ge=0,
+                description="Specifies the number of objects to skip. Defaults to 0.",
+            ),
+            limit: int = Query(
+                100,
+                ge=1,
+                le=1000,
+                description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
+            ),
+            cursor: Optional[str] = Query(
+                None,
+                description="The `next_cursor` of the previous page. Returns the page after it, which is as fast to fetch as the first page however deep it is.",
+            ),
+            exact_total: bool = Query(
+                False,
+                description="Whether to count `total_entries` exactly. By default it may be an estimate, which is much cheaper for long lists.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedPromptsResponse:
-            """List all available prompts.
+            """List all available prompts, ordered by name.
 
             This endpoint retrieves a list of all prompts in the system. Only
             superusers can access this endpoint.
@@ -161,13 +180,19 @@ class PromptsRouter(BaseRouterV3):
                     403,
                 )
             get_prompts_response = (
-                await self.services.management.get_all_prompts()
+                await self.services.management.get_all_prompts(
+                    offset=offset,
+                    limit=limit,
+                    cursor=cursor,
+                    exact_total=exact_total,
+                )
             )
 
             return (  # type: ignore
                 get_prompts_response["results"],
                 {
                     "total_entries": get_prompts_response["total_entries"],
+                    "next_cursor": get_prompts_response["next_cursor"],
                 },
             )
 
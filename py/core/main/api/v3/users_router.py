@@ -7,14 +7,13 @@ from uuid import UUID
 
 import requests
 from fastapi import Body, Depends, HTTPException, Path, Query
-from fastapi.background import BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token
 from pydantic import EmailStr
 
-from core.base import R2RException
+from core.base import ExportFormat, R2RException
 from core.base.api.models import (
     GenericBooleanResponse,
     GenericMessageResponse,
@@ -201,7 +200,6 @@ class UsersRouter(BaseRouterV3):
         )
         @self.base_endpoint
         async def export_users(
-            background_tasks: BackgroundTasks,
             columns: Optional[list[str]] = Body(
                 None, description="Specific columns to export"
             ),
@@ -211,9 +209,13 @@ class UsersRouter(BaseRouterV3):
             include_header: Optional[bool] = Body(
                 True, description="Whether to include column headers"
             ),
+            export_format: ExportFormat = Body(
+                ExportFormat.CSV,
+                description="The format to export in: `csv`, or `parquet` or `arrow` for columnar output",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
-        ) -> FileResponse:
-            """Export users as a CSV file."""
+        ) -> StreamingResponse:
+            """Export users as a CSV, Parquet or Arrow file."""
 
             if not auth_user.is_superuser:
                 raise R2RException(
@@ -221,23 +223,21 @@ class UsersRouter(BaseRouterV3):
                     message="Only a superuser can export data.",
                 )
 
-            (
-                csv_file_path,
-                temp_file,
-            ) = await self.services.management.export_users(
+            export_stream = await self.services.management.export_users(
                 columns=columns,
                 filters=filters,
                 include_header=include_header
                 if include_header is not None
                 else True,
+                export_format=export_format,
             )
 
-            background_tasks.add_task(temp_file.close)
-
-            return FileResponse(
-                path=csv_file_path,
-                media_type="text/csv",
-                filename="users_export.csv",
+            return StreamingResponse(
+                export_stream,
+                media_type=export_format.media_type,
+                headers={
+                    "Content-Disposition": f"attachment; filename=users_export.{export_format.value}",
+                },
             )
 
         @self.router.post(
@@ -767,6 +767,14 @@ class UsersRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            cursor: Optional[str] = Query(
+                None,
+                description="The `next_cursor` of the previous page. Returns the page after it, which is as fast to fetch as the first page however deep it is.",
+            ),
+            exact_total: bool = Query(
+                False,
+                description="Whether to count `total_entries` exactly. By default it may be an estimate, which is much cheaper for long lists.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper()),
         ) -> WrappedUsersResponse:
             """List all users with pagination and filtering options.
@@ -784,11 +792,16 @@ class UsersRouter(BaseRouterV3):
 
             users_overview_response = (
                 await self.services.management.users_overview(
-                    user_ids=user_uuids, offset=offset, limit=limit
+                    user_ids=user_uuids,
+                    offset=offset,
+                    limit=limit,
+                    cursor=cursor,
+                    exact_total=exact_total,
                 )
             )
             return users_overview_response["results"], {  # type: ignore
-                "total_entries": users_overview_response["total_entries"]
+                "total_entries": users_overview_response["total_entries"],
+                "next_cursor": users_overview_response["next_cursor"],
             }
 
         @self.router.get(
@@ -44,6 +44,9 @@ async def lifespan(app: FastAPI):
 
     # # Shutdown
     scheduler.shutdown()
+    providers = r2r_app.services.ingestion.providers
+    providers.ingestion.close()
+    await providers.database.close()
 
 
 async def create_r2r_app(
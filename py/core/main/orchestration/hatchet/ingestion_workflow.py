@@ -100,58 +100,79 @@ def hatchet_ingestion_factory(
                 )
 
                 ingestion_config = parsed_data["ingestion_config"] or {}
-                extractions_generator = self.ingestion_service.parse_file(
-                    document_info, ingestion_config
-                )
-
-                extractions = []
-                async for extraction in extractions_generator:
-                    extractions.append(extraction)
-
-                # 2) Sum tokens
-                total_tokens = 0
-                for chunk in extractions:
-                    text_data = chunk.data
-                    if not isinstance(text_data, str):
-                        text_data = text_data.decode("utf-8", errors="ignore")
-                    total_tokens += count_tokens_for_text(text_data)
-                document_info.total_tokens = total_tokens
-
-                if not ingestion_config.get("skip_document_summary", False):
-                    await service.update_document_status(
-                        document_info, status=IngestionStatus.AUGMENTING
-                    )
-                    await service.augment_document_info(
+                if self.ingestion_service.config.ingestion.pipeline_ingestion:
+                    await self.ingestion_service.parse_embed_store(
                         document_info,
-                        [extraction.to_dict() for extraction in extractions],
+                        ingestion_config,
+                        token_counter=count_tokens_for_text,
+                    )
+                else:
+                    extractions_generator = self.ingestion_service.parse_file(
+                        document_info, ingestion_config
                     )
 
-                await self.ingestion_service.update_document_status(
-                    document_info,
-                    status=IngestionStatus.EMBEDDING,
-                )
+                    extractions = []
+                    async for extraction in extractions_generator:
+                        extractions.append(extraction)
+
+                    # 2) Sum tokens
+                    total_tokens = 0
+                    for chunk in extractions:
+                        text_data = chunk.data
+                        if not isinstance(text_data, str):
+                            text_data = text_data.decode(
+                                "utf-8", errors="ignore"
+                            )
+                        total_tokens += count_tokens_for_text(text_data)
+                    document_info.total_tokens = total_tokens
+
+                    if not ingestion_config.get(
+                        "skip_document_summary", False
+                    ):
+                        await service.update_document_status(
+                            document_info, status=IngestionStatus.AUGMENTING
+                        )
+                        await service.augment_document_info(
+                            document_info,
+                            [
+                                extraction.to_dict()
+                                for extraction in extractions
+                            ],
+                        )
 
-                # extractions = context.step_output("parse")["extractions"]
+                    await self.ingestion_service.update_document_status(
+                        document_info,
+                        status=IngestionStatus.EMBEDDING,
+                    )
 
-                embedding_generator = self.ingestion_service.embed_document(
-                    [extraction.to_dict() for extraction in extractions]
-                )
+                    # extractions = context.step_output("parse")["extractions"]
 
-                embeddings = []
-                async for embedding in embedding_generator:
-                    embeddings.append(embedding)
+                    embedding_generator = (
+                        self.ingestion_service.embed_document(
+                            [
+                                extraction.to_dict()
+                                for extraction in extractions
+                            ]
+                        )
+                    )
 
-                await self.ingestion_service.update_document_status(
-                    document_info,
-                    status=IngestionStatus.STORING,
-                )
+                    embeddings = []
+                    async for embedding in embedding_generator:
+                        embeddings.append(embedding)
 
-                storage_generator = self.ingestion_service.store_embeddings(  # type: ignore
-                    embeddings
-                )
+                    await self.ingestion_service.update_document_status(
+                        document_info,
+                        status=IngestionStatus.STORING,
+                    )
+
+                    storage_generator = (
+                        self.ingestion_service.store_embeddings(  # type: ignore
+                            embeddings
+                        )
+                    )
 
-                async for _ in storage_generator:
-                    pass
+                    async for _ in storage_generator:
+                        pass
 
                 await self.ingestion_service.finalize_ingestion(document_info)
 
@@ -60,44 +60,53 @@ def simple_ingestion_factory(service: IngestionService):
             )
 
             ingestion_config = parsed_data["ingestion_config"]
-            extractions_generator = service.parse_file(
-                document_info, ingestion_config
-            )
-            extractions = [
-                extraction.model_dump()
-                async for extraction in extractions_generator
-            ]
-
-            # 2) Sum tokens
-            total_tokens = 0
-            for chunk_dict in extractions:
-                text_data = chunk_dict["data"]
-                if not isinstance(text_data, str):
-                    text_data = text_data.decode("utf-8", errors="ignore")
-                total_tokens += count_tokens_for_text(text_data)
-            document_info.total_tokens = total_tokens
+            if service.config.ingestion.pipeline_ingestion:
+                await service.parse_embed_store(
+                    document_info,
+                    ingestion_config,
+                    token_counter=count_tokens_for_text,
+                )
+            else:
+                extractions_generator = service.parse_file(
+                    document_info, ingestion_config
+                )
+                extractions = [
+                    extraction.model_dump()
+                    async for extraction in extractions_generator
+                ]
+
+                # 2) Sum tokens
+                total_tokens = 0
+                for chunk_dict in extractions:
+                    text_data = chunk_dict["data"]
+                    if not isinstance(text_data, str):
+                        text_data = text_data.decode("utf-8", errors="ignore")
+                    total_tokens += count_tokens_for_text(text_data)
+                document_info.total_tokens = total_tokens
+
+                if not ingestion_config.get("skip_document_summary", False):
+                    await service.update_document_status(
+                        document_info, status=IngestionStatus.AUGMENTING
+                    )
+                    await service.augment_document_info(
+                        document_info, extractions
+                    )
 
-            if not ingestion_config.get("skip_document_summary", False):
                 await service.update_document_status(
-                    document_info, status=IngestionStatus.AUGMENTING
+                    document_info, status=IngestionStatus.EMBEDDING
                 )
-                await service.augment_document_info(document_info, extractions)
+                embedding_generator = service.embed_document(extractions)
+                embeddings = [
+                    embedding.model_dump()
+                    async for embedding in embedding_generator
+                ]
 
-            await service.update_document_status(
-                document_info, status=IngestionStatus.EMBEDDING
-            )
-            embedding_generator = service.embed_document(extractions)
-            embeddings = [
-                embedding.model_dump()
-                async for embedding in embedding_generator
-            ]
-
-            await service.update_document_status(
-                document_info, status=IngestionStatus.STORING
-            )
-            storage_generator = service.store_embeddings(embeddings)
-            async for _ in storage_generator:
-                pass
+                await service.update_document_status(
+                    document_info, status=IngestionStatus.STORING
+                )
+                storage_generator = service.store_embeddings(embeddings)
+                async for _ in storage_generator:
+                    pass
 
             await service.finalize_ingestion(document_info)
 
@@ -6,7 +6,7 @@ import re
 import time
 import uuid
 import xml.etree.ElementTree as ET
-from typing import Any, AsyncGenerator, Coroutine, Optional
+from typing import Any, AsyncGenerator, Coroutine, Iterable, Optional
 from uuid import UUID
 from xml.etree.ElementTree import Element
 
@@ -44,6 +44,49 @@ async def _collect_async_results(result_gen: AsyncGenerator) -> list[Any]:
     return results
 
 
+class CommunityGraphView:
+    """The entities and relationships of a graph, indexed by entity name so
+    that the slice belonging to a community is found from its nodes alone
+    rather than by scanning the whole graph.
+
+    Slices keep the order of the lists the view was built from.
+    """
+
+    def __init__(
+        self, entities: list[Entity], relationships: list[Relationship]
+    ):
+        self.entities = entities
+        self.relationships = relationships
+        self._entities_by_name: dict[str, list[int]] = {}
+        for i, entity in enumerate(entities):
+            self._entities_by_name.setdefault(entity.name, []).append(i)
+        self._relationships_by_subject: dict[str, list[int]] = {}
+        for i, relationship in enumerate(relationships):
+            self._relationships_by_subject.setdefault(
+                relationship.subject, []
+            ).append(i)
+
+    def community(
+        self, nodes: Iterable[str]
+    ) -> tuple[list[Entity], list[Relationship]]:
+        """Returns the entities named by `nodes` and the relationships
+        whose subject and object are both among them."""
+        members = set(nodes)
+        entity_indices = sorted(
+            i for name in members for i in self._entities_by_name.get(name, ())
+        )
+        relationship_indices = sorted(
+            i
+            for name in members
+            for i in self._relationships_by_subject.get(name, ())
+            if self.relationships[i].object in members
+        )
+        return (
+            [self.entities[i] for i in entity_indices],
+            [self.relationships[i] for i in relationship_indices],
+        )
+
+
 class GraphService(Service):
     def __init__(
         self,
@@ -310,12 +353,16 @@ class GraphService(Service):
         limit: int,
         graph_ids: Optional[list[UUID]] = None,
         collection_id: Optional[UUID] = None,
-    ) -> dict[str, list[GraphResponse] | int]:
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
+    ) -> dict[str, Any]:
         return await self.providers.database.graphs_handler.list_graphs(
             offset=offset,
             limit=limit,
             filter_graph_ids=graph_ids,
             filter_collection_id=collection_id,
+            cursor=cursor,
+            exact_total=exact_total,
         )
 
     async def update_graph(
@@ -362,6 +409,7 @@ class GraphService(Service):
         document_id: UUID,
         max_description_input_length: int,
         batch_size: int = 256,
+        embedding_batch_size: int = 32,
         **kwargs,
     ):
         """A new implementation of the old GraphDescriptionPipe logic inline.
@@ -369,8 +417,10 @@ class GraphService(Service):
 
         We:
          1) Count how many entities are in the document
-         2) Process them in batches of `batch_size`
-         3) For each batch, we retrieve the entity map and possibly call LLM for missing descriptions
+         2) Fetch the document summary once, for every prompt to share
+         3) Process them in batches of `batch_size`
+         4) For each batch, we retrieve the entity map and call LLM for missing descriptions,
+            embedding and storing them `embedding_batch_size` at a time
         """
         start_time = time.time()
         logger.info(
@@ -389,6 +439,16 @@ class GraphService(Service):
             f"GraphService: Found {entity_count} doc-entities to describe."
         )
 
+        # Grab a doc-level summary (optional) to feed into the prompts
+        response = await self.providers.database.documents_handler.get_documents_overview(
+            offset=0,
+            limit=1,
+            filter_document_ids=[document_id],
+        )
+        document_summary = (
+            response["results"][0].summary if response["results"] else None
+        )
+
         all_results = []
         num_batches = math.ceil(entity_count / batch_size)
 
@@ -404,9 +464,11 @@ class GraphService(Service):
             # We'll collect them into a list via an async generator
             gen = self._describe_entities_in_document_batch(
                 document_id=document_id,
+                document_summary=document_summary,
                 offset=offset,
                 limit=limit,
                 max_description_input_length=max_description_input_length,
+                embedding_batch_size=embedding_batch_size,
             )
             batch_results = await _collect_async_results(gen)
             all_results.append(batch_results)
@@ -425,14 +487,16 @@ class GraphService(Service):
     async def _describe_entities_in_document_batch(
         self,
         document_id: UUID,
+        document_summary: Optional[str],
         offset: int,
         limit: int,
         max_description_input_length: int,
+        embedding_batch_size: int,
     ) -> AsyncGenerator[str, None]:
         """Core logic that replaces GraphDescriptionPipe._run_logic for a
         particular document/batch.
 
-        Yields entity-names or some textual result as each entity is updated.
+        Yields entity-names as each entity is described and stored.
         """
         start_time = time.time()
         logger.info(
@@ -451,7 +515,7 @@ class GraphService(Service):
         )
 
         # 2) For each entity name in the map, we gather sub-entities and relationships
-        tasks: list[Coroutine[Any, Any, str]] = []
+        tasks: list[Coroutine[Any, Any, tuple[Entity, Optional[str]]]] = []
         tasks.extend(
             self._process_entity_for_description(
                 entities=[
@@ -464,39 +528,73 @@ class GraphService(Service):
                     else Relationship(**rel)
                     for rel in entity_info["relationships"]
                 ],
-                document_id=document_id,
+                document_summary=document_summary,
                 max_description_input_length=max_description_input_length,
             )
             for entity_name, entity_info in entity_map.items()
         )
 
-        # 3) Wait for all tasks, yield as they complete
+        # 3) Wait for all tasks, embedding and storing new descriptions in
+        # batches, and yield names as they are done
         idx = 0
+        described: list[Entity] = []
         for coro in asyncio.as_completed(tasks):
-            result = await coro
+            entity, new_description = await coro
             idx += 1
             if idx % 100 == 0:
                 logger.info(
                     f"_describe_entities_in_document_batch: {idx}/{total_entities} described for doc={document_id}"
                 )
-            yield result
+            if new_description is None:
+                yield entity.name
+                continue
+
+            entity.description = new_description
+            described.append(entity)
+            if len(described) >= embedding_batch_size:
+                await self._store_entity_descriptions(document_id, described)
+                for stored in described:
+                    yield stored.name
+                described = []
+
+        if described:
+            await self._store_entity_descriptions(document_id, described)
+            for stored in described:
+                yield stored.name
 
         logger.info(
             f"Finished describing doc={document_id} batch offset={offset} in {time.time() - start_time:.2f}s."
         )
 
+    async def _store_entity_descriptions(
+        self, document_id: UUID, entities: list[Entity]
+    ) -> None:
+        """Embeds the new descriptions of `entities` in one request and
+        writes them back in one batch."""
+        embeddings = await self.providers.embedding.async_get_embeddings(
+            [entity.description or "" for entity in entities]
+        )
+        for entity, embedding in zip(entities, embeddings, strict=True):
+            entity.description_embedding = embedding
+
+        await self.providers.database.graphs_handler.entities.update_descriptions(
+            parent_id=document_id,
+            store_type=StoreType.DOCUMENTS,
+            entities=entities,
+        )
+
     async def _process_entity_for_description(
         self,
         entities: list[Entity],
         relationships: list[Relationship],
-        document_id: UUID,
+        document_summary: Optional[str],
         max_description_input_length: int,
-    ) -> str:
+    ) -> tuple[Entity, Optional[str]]:
         """Adapted from the old process_entity function in
         GraphDescriptionPipe.
 
-        If entity has no description, call an LLM to create one, then store it.
-        Returns the name of the top entity (or could store more details).
+        If entity has no description, call an LLM to create one. Returns the
+        top entity with its new description, or None if it needs none.
         """
 
         def truncate_info(info_list: list[str], max_length: int) -> str:
@@ -512,16 +610,6 @@ class GraphService(Service):
                 current_length += len(info)
             return truncated_info
 
-        # Grab a doc-level summary (optional) to feed into the prompt
-        response = await self.providers.database.documents_handler.get_documents_overview(
-            offset=0,
-            limit=1,
-            filter_document_ids=[document_id],
-        )
-        document_summary = (
-            response["results"][0].summary if response["results"] else None
-        )
-
         # Synthesize a minimal “entity info” string + relationship summary
         entity_info = [
             f"{e.name}, {e.description or 'NONE'}" for e in entities
@@ -535,56 +623,41 @@ class GraphService(Service):
         # or you could do them all if needed
         main_entity = entities[0]
 
-        if not main_entity.description:
+        if main_entity.description:
             # We only call LLM if the entity is missing a description
-            messages = await self.providers.database.prompts_handler.get_message_payload(
-                task_prompt_name=self.providers.database.config.graph_creation_settings.graph_entity_description_prompt,
-                task_inputs={
-                    "document_summary": document_summary,
-                    "entity_info": truncate_info(
-                        entity_info, max_description_input_length
-                    ),
-                    "relationships_txt": truncate_info(
-                        relationships_txt, max_description_input_length
-                    ),
-                },
-            )
-
-            # Call the LLM
-            gen_config = (
-                self.providers.database.config.graph_creation_settings.generation_config
-                or GenerationConfig(model=self.config.app.fast_llm)
-            )
-            llm_resp = await self.providers.llm.aget_completion(
-                messages=messages,
-                generation_config=gen_config,
-            )
-            new_description = llm_resp.choices[0].message.content
-
-            if not new_description:
-                logger.error(
-                    f"No LLM description returned for entity={main_entity.name}"
-                )
-                return main_entity.name
-
-            # create embedding
-            embed = (
-                await self.providers.embedding.async_get_embeddings(
-                    [new_description]
-                )
-            )[0]
+            return main_entity, None
+
+        messages = await self.providers.database.prompts_handler.get_message_payload(
+            task_prompt_name=self.providers.database.config.graph_creation_settings.graph_entity_description_prompt,
+            task_inputs={
+                "document_summary": document_summary,
+                "entity_info": truncate_info(
+                    entity_info, max_description_input_length
+                ),
+                "relationships_txt": truncate_info(
+                    relationships_txt, max_description_input_length
+                ),
+            },
+        )
 
-            # update DB
-            main_entity.description = new_description
-            main_entity.description_embedding = embed
+        # Call the LLM
+        gen_config = (
+            self.providers.database.config.graph_creation_settings.generation_config
+            or GenerationConfig(model=self.config.app.fast_llm)
+        )
+        llm_resp = await self.providers.llm.aget_completion(
+            messages=messages,
+            generation_config=gen_config,
+        )
+        new_description = llm_resp.choices[0].message.content
 
-            # Use a method to upsert entity in `documents_entities` or your table
-            await self.providers.database.graphs_handler.add_entities(
-                [main_entity],
-                table_name="documents_entities",
+        if not new_description:
+            logger.error(
+                f"No LLM description returned for entity={main_entity.name}"
             )
+            return main_entity, None
 
-        return main_entity.name
+        return main_entity, new_description
 
     async def graph_search_results_clustering(
         self,
@@ -706,6 +779,19 @@ class GraphService(Service):
             node_name = item["node"]
             clusters.setdefault(cluster_id, []).append(node_name)
 
+        # fetch the collection description (optional)
+        response = await self.providers.database.collections_handler.get_collections_overview(
+            offset=0,
+            limit=1,
+            filter_collection_ids=[collection_id],
+        )
+        collection_description = (
+            response["results"][0].description if response["results"] else None  # type: ignore
+        )
+
+        # index the graph once, rather than scanning it for every community
+        graph_view = CommunityGraphView(all_entities, all_relationships)
+
         # create an async job for each cluster
         tasks: list[Coroutine[Any, Any, dict]] = []
 
@@ -713,8 +799,8 @@ class GraphService(Service):
             self._process_community_summary(
                 community_id=uuid.uuid4(),
                 nodes=nodes,
-                all_entities=all_entities,
-                all_relationships=all_relationships,
+                graph_view=graph_view,
+                collection_description=collection_description,
                 max_summary_input_length=max_summary_input_length,
                 generation_config=generation_config,
                 collection_id=collection_id,
@@ -746,8 +832,8 @@ class GraphService(Service):
         self,
         community_id: UUID,
         nodes: list[str],
-        all_entities: list[Entity],
-        all_relationships: list[Relationship],
+        graph_view: CommunityGraphView,
+        collection_description: Optional[str],
         max_summary_input_length: int,
         generation_config: GenerationConfig,
         collection_id: UUID,
@@ -757,23 +843,8 @@ class GraphService(Service):
         parse it, store the result as a community in DB.
         """
         # (Equivalent to process_community in old code)
-        # fetch the collection description (optional)
-        response = await self.providers.database.collections_handler.get_collections_overview(
-            offset=0,
-            limit=1,
-            filter_collection_ids=[collection_id],
-        )
-        collection_description = (
-            response["results"][0].description if response["results"] else None  # type: ignore
-        )
-
-        # filter out relevant entities / relationships
-        entities = [e for e in all_entities if e.name in nodes]
-        relationships = [
-            r
-            for r in all_relationships
-            if r.subject in nodes and r.object in nodes
-        ]
+        # slice out relevant entities / relationships
+        entities, relationships = graph_view.community(nodes)
         if not entities and not relationships:
             return {
                 "community_id": community_id,
@@ -1248,56 +1319,64 @@ class GraphService(Service):
         self,
         graph_search_results_extractions: list[GraphExtraction],
     ):
-        """Stores a batch of knowledge graph extractions in the DB."""
+        """Stores a batch of knowledge graph extractions in the DB.
+
+        The entities of every extraction are inserted in one batch, then the
+        relationships, with subject and object ids resolved from the names
+        of the entities created for the same extraction.
+        """
+        graphs_handler = self.providers.database.graphs_handler
+        entities: list[Entity] = []
+        extraction_entities: list[list[Entity]] = []
         for extraction in graph_search_results_extractions:
-            # Map name->id after creation
-            entities_id_map = {}
+            extracted = []
             for e in extraction.entities:
                 if e.parent_id is not None:
-                    result = await self.providers.database.graphs_handler.entities.create(
-                        name=e.name,
-                        parent_id=e.parent_id,
-                        store_type=StoreType.DOCUMENTS,
-                        category=e.category,
-                        description=e.description,
-                        description_embedding=e.description_embedding,
-                        chunk_ids=e.chunk_ids,
-                        metadata=e.metadata,
-                    )
-                    entities_id_map[e.name] = result.id
+                    extracted.append(e)
                 else:
                     logger.warning(f"Skipping entity with None parent_id: {e}")
+            entities.extend(extracted)
+            extraction_entities.append(extracted)
+
+        created = iter(
+            await graphs_handler.entities.create_many(
+                entities, store_type=StoreType.DOCUMENTS
+            )
+        )
+
+        relationships: list[Relationship] = []
+        for extraction, extracted in zip(
+            graph_search_results_extractions, extraction_entities, strict=True
+        ):
+            # Map name->id after creation
+            entities_id_map = {
+                entity.name: entity.id
+                for entity in (next(created) for _ in extracted)
+            }
 
-            # Insert relationships
             for rel in extraction.relationships:
                 subject_id = entities_id_map.get(rel.subject)
                 object_id = entities_id_map.get(rel.object)
-                parent_id = rel.parent_id
 
                 if any(
-                    id is None for id in (subject_id, object_id, parent_id)
+                    id is None for id in (subject_id, object_id, rel.parent_id)
                 ):
                     logger.warning(f"Missing ID for relationship: {rel}")
                     continue
 
-                assert isinstance(subject_id, UUID)
-                assert isinstance(object_id, UUID)
-                assert isinstance(parent_id, UUID)
-
-                await self.providers.database.graphs_handler.relationships.create(
-                    subject=rel.subject,
-                    subject_id=subject_id,
-                    predicate=rel.predicate,
-                    object=rel.object,
-                    object_id=object_id,
-                    parent_id=parent_id,
-                    description=rel.description,
-                    description_embedding=rel.description_embedding,
-                    weight=rel.weight,
-                    metadata=rel.metadata,
-                    store_type=StoreType.DOCUMENTS,
+                relationships.append(
+                    rel.model_copy(
+                        update={
+                            "subject_id": subject_id,
+                            "object_id": object_id,
+                        }
+                    )
                 )
 
+        await graphs_handler.relationships.create_many(
+            relationships, store_type=StoreType.DOCUMENTS
+        )
+
     async def deduplicate_document_entities(
         self,
         document_id: UUID,
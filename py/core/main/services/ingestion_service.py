@@ -1,8 +1,17 @@
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime
-from typing import Any, AsyncGenerator, Optional, Sequence
+from typing import (
+    Any,
+    AsyncGenerator,
+    BinaryIO,
+    Callable,
+    Coroutine,
+    Optional,
+    Sequence,
+)
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -226,12 +235,17 @@ class IngestionService:
             )
 
         try:
-            # Pull file from DB
-            retrieved = (
-                await self.providers.database.files_handler.retrieve_file(
+            # Pull file from DB. Providers that accept file objects get a
+            # spooled file read from the large object chunk by chunk, so a
+            # large file is held on disk rather than in memory.
+            files_handler = self.providers.database.files_handler
+            retrieved: Optional[tuple[str, BinaryIO, int]]
+            if self.providers.ingestion.accepts_file_objects:
+                retrieved = await files_handler.retrieve_file_spooled(
                     document_info.id
                 )
-            )
+            else:
+                retrieved = await files_handler.retrieve_file(document_info.id)
             if not retrieved:
                 # No file found in the DB, can't parse
                 raise R2RDocumentProcessingError(
@@ -241,10 +255,6 @@ class IngestionService:
 
             file_name, file_wrapper, file_size = retrieved
 
-            # Read the content
-            with file_wrapper as file_content_stream:
-                file_content = file_content_stream.read()
-
             # Build a barebones Document object
             doc = Document(
                 id=document_info.id,
@@ -257,17 +267,24 @@ class IngestionService:
                 document_type=document_info.document_type,
             )
 
-            # Delegate to the ingestion provider to parse
-            async for extraction in self.providers.ingestion.parse(
-                file_content,  # raw bytes
-                doc,
-                ingestion_config_override,
-            ):
-                # Adjust chunk ID to incorporate version
-                # or any other needed transformations
-                extraction.id = generate_id(f"{extraction.id}_{version}")
-                extraction.metadata["version"] = version
-                yield extraction
+            with file_wrapper as file_content_stream:
+                file_content = (
+                    file_content_stream
+                    if self.providers.ingestion.accepts_file_objects
+                    else file_content_stream.read()
+                )
+
+                # Delegate to the ingestion provider to parse
+                async for extraction in self.providers.ingestion.parse(
+                    file_content,
+                    doc,
+                    ingestion_config_override,
+                ):
+                    # Adjust chunk ID to incorporate version
+                    # or any other needed transformations
+                    extraction.id = generate_id(f"{extraction.id}_{version}")
+                    extraction.metadata["version"] = version
+                    yield extraction
 
         except (PopplerNotFoundError, PDFParsingError) as e:
             raise R2RDocumentProcessingError(
@@ -286,7 +303,7 @@ class IngestionService:
     async def augment_document_info(
         self,
         document_info: DocumentResponse,
-        chunked_documents: list[dict],
+        chunked_documents: Sequence[dict | DocumentChunk],
     ) -> None:
         if not self.config.ingestion.skip_document_summary:
             document = f"Document Title: {document_info.title}\n"
@@ -297,7 +314,16 @@ class IngestionService:
             for chunk in chunked_documents[
                 : self.config.ingestion.chunks_for_document_summary
             ]:
-                document += chunk["data"]
+                data = (
+                    chunk.data
+                    if isinstance(chunk, DocumentChunk)
+                    else chunk["data"]
+                )
+                document += (
+                    data.decode("utf-8", errors="ignore")
+                    if isinstance(data, bytes)
+                    else str(data)
+                )
 
             messages = await self.providers.database.prompts_handler.get_message_payload(
                 system_prompt_name=self.config.ingestion.document_summary_system_prompt,
@@ -330,7 +356,7 @@ class IngestionService:
 
     async def embed_document(
         self,
-        chunked_documents: list[dict],
+        chunked_documents: Sequence[dict | DocumentChunk],
         embedding_batch_size: int = 8,
     ) -> AsyncGenerator[VectorEntry, None]:
         """Inline replacement for the old embedding_pipe.run(...).
@@ -346,54 +372,19 @@ class IngestionService:
         extraction_batch: list[DocumentChunk] = []
         tasks: set[asyncio.Task] = set()
 
-        async def process_batch(
-            batch: list[DocumentChunk],
-        ) -> list[VectorEntry]:
-            # All text from the batch
-            texts = [
-                (
-                    ex.data.decode("utf-8")
-                    if isinstance(ex.data, bytes)
-                    else ex.data
-                )
-                for ex in batch
-            ]
-            # Retrieve embeddings in bulk
-            vectors = await self.providers.embedding.async_get_embeddings(
-                texts,  # list of strings
-            )
-            # Zip them back together
-            results = []
-            for raw_vector, extraction in zip(vectors, batch, strict=False):
-                results.append(
-                    VectorEntry(
-                        id=extraction.id,
-                        document_id=extraction.document_id,
-                        owner_id=extraction.owner_id,
-                        collection_ids=extraction.collection_ids,
-                        vector=Vector(data=raw_vector, type=VectorType.FIXED),
-                        text=(
-                            extraction.data.decode("utf-8")
-                            if isinstance(extraction.data, bytes)
-                            else str(extraction.data)
-                        ),
-                        metadata={**extraction.metadata},
-                    )
-                )
-            return results
-
-        async def run_process_batch(batch: list[DocumentChunk]):
-            return await process_batch(batch)
-
         # Convert each chunk dict to a DocumentChunk
-        for chunk_dict in chunked_documents:
-            extraction = DocumentChunk.from_dict(chunk_dict)
+        for chunk in chunked_documents:
+            extraction = (
+                chunk
+                if isinstance(chunk, DocumentChunk)
+                else DocumentChunk.from_dict(chunk)
+            )
             extraction_batch.append(extraction)
 
             # If we hit a batch threshold, spawn a task
             if len(extraction_batch) >= embedding_batch_size:
                 tasks.add(
-                    asyncio.create_task(run_process_batch(extraction_batch))
+                    asyncio.create_task(self._embed_chunks(extraction_batch))
                 )
                 extraction_batch = []
 
@@ -408,13 +399,51 @@ class IngestionService:
 
         # Handle any leftover items
         if extraction_batch:
-            tasks.add(asyncio.create_task(run_process_batch(extraction_batch)))
+            tasks.add(
+                asyncio.create_task(self._embed_chunks(extraction_batch))
+            )
 
         # Gather remaining tasks
         for future_task in asyncio.as_completed(tasks):
             for vector_entry in await future_task:
                 yield vector_entry
 
+    async def _embed_chunks(
+        self, batch: list[DocumentChunk]
+    ) -> list[VectorEntry]:
+        # All text from the batch
+        texts = [
+            (
+                ex.data.decode("utf-8")
+                if isinstance(ex.data, bytes)
+                else ex.data
+            )
+            for ex in batch
+        ]
+        # Retrieve embeddings in bulk
+        vectors = await self.providers.embedding.async_get_embeddings(
+            texts,  # list of strings
+        )
+        # Zip them back together
+        results = []
+        for raw_vector, extraction in zip(vectors, batch, strict=False):
+            results.append(
+                VectorEntry(
+                    id=extraction.id,
+                    document_id=extraction.document_id,
+                    owner_id=extraction.owner_id,
+                    collection_ids=extraction.collection_ids,
+                    vector=Vector(data=raw_vector, type=VectorType.FIXED),
+                    text=(
+                        extraction.data.decode("utf-8")
+                        if isinstance(extraction.data, bytes)
+                        else str(extraction.data)
+                    ),
+                    metadata={**extraction.metadata},
+                )
+            )
+        return results
+
     async def store_embeddings(
         self,
         embeddings: Sequence[dict | VectorEntry],
@@ -424,6 +453,11 @@ class IngestionService:
 
         Batches up the vector entries, enforces usage limits, stores them, and
         yields a success/error string (or you could yield a StorageResult).
+
+        Each owner's chunk limit is resolved once per call. The limit is
+        checked against the owner's chunk counter in the same transaction as
+        the write, so a batch that would exceed it is rejected as a whole,
+        even when several ingestions for the same user run concurrently.
         """
         if not embeddings:
             return
@@ -435,84 +469,228 @@ class IngestionService:
             else:
                 vector_entries.append(VectorEntry.from_dict(item))
 
-        vector_batch: list[VectorEntry] = []
+        max_chunks = await self._get_max_chunks(
+            {entry.owner_id for entry in vector_entries}
+        )
         document_counts: dict[UUID, int] = {}
 
-        # We'll track usage from the first user we see; if your scenario allows
-        # multiple user owners in a single ingestion, you'd need to refine usage checks.
-        current_usage = None
-        user_id_for_usage_check: UUID | None = None
-
-        count = 0
-
-        for msg in vector_entries:
-            # If we haven't set usage yet, do so on the first chunk
-            if current_usage is None:
-                user_id_for_usage_check = msg.owner_id
-                usage_data = (
-                    await self.providers.database.chunks_handler.list_chunks(
-                        limit=1,
-                        offset=0,
-                        filters={"owner_id": msg.owner_id},
-                    )
+        for i in range(0, len(vector_entries), storage_batch_size):
+            vector_batch = vector_entries[i : i + storage_batch_size]
+            try:
+                await self._upsert_vector_entries(vector_batch, max_chunks)
+            except R2RException as e:
+                logger.error(e.message)
+                yield e.message
+                continue
+            except Exception as e:
+                logger.error(f"Failed to store vector batch: {e}")
+                yield f"Error: {e}"
+                continue
+            for entry in vector_batch:
+                document_counts[entry.document_id] = (
+                    document_counts.get(entry.document_id, 0) + 1
                 )
-                current_usage = usage_data["total_entries"]
 
-            # Figure out the user's limit
+        # Summaries
+        for doc_id, cnt in document_counts.items():
+            info_msg = f"Successful ingestion for document_id: {doc_id}, with vector count: {cnt}"
+            logger.info(info_msg)
+            yield info_msg
+
+    async def _get_max_chunks(
+        self, owner_ids: set[UUID]
+    ) -> dict[UUID, Optional[int]]:
+        """Returns the chunk limit of each owner, honoring per-user
+        overrides."""
+        default_max_chunks = (
+            self.providers.database.config.app.default_max_chunks_per_user
+        )
+        max_chunks: dict[UUID, Optional[int]] = {}
+        for owner_id in owner_ids:
             user = await self.providers.database.users_handler.get_user_by_id(
-                msg.owner_id
-            )
-            max_chunks = (
-                self.providers.database.config.app.default_max_chunks_per_user
+                owner_id
             )
             if user.limits_overrides and "max_chunks" in user.limits_overrides:
-                max_chunks = user.limits_overrides["max_chunks"]
-
-            # Add to our local batch
-            vector_batch.append(msg)
-            document_counts[msg.document_id] = (
-                document_counts.get(msg.document_id, 0) + 1
-            )
-            count += 1
+                max_chunks[owner_id] = user.limits_overrides["max_chunks"]
+            else:
+                max_chunks[owner_id] = default_max_chunks
+        return max_chunks
 
-            # Check usage
-            if (
-                current_usage is not None
-                and (current_usage + len(vector_batch) + count) > max_chunks
+    async def parse_embed_store(
+        self,
+        document_info: DocumentResponse,
+        ingestion_config: dict | None,
+        token_counter: Optional[Callable[[str], int]] = None,
+        embedding_batch_size: int = 8,
+        storage_batch_size: int = 128,
+    ) -> dict[str, float]:
+        """Parses, embeds and stores a document as one pipeline.
+
+        Chunks flow from the parser through bounded queues into embedding
+        batches and then into storage batches, so the stages overlap and
+        only a few batches are held in memory at a time. A full queue pauses
+        the stage feeding it. The document summary is generated alongside,
+        from the first `chunks_for_document_summary` chunks.
+
+        The time spent in each stage is recorded under `ingestion_timings`
+        in the document's metadata and returned. Concurrent embedding
+        requests are summed, so stage times can exceed the total.
+        """
+        ingestion_config = ingestion_config or {}
+        queue_size = self.config.ingestion.pipeline_queue_size
+        chunk_queue: asyncio.Queue[Optional[DocumentChunk]] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        vector_queue: asyncio.Queue[Optional[list[VectorEntry]]] = (
+            asyncio.Queue(maxsize=max(1, queue_size // embedding_batch_size))
+        )
+        concurrency_limit = (
+            self.providers.embedding.config.concurrent_request_limit or 5
+        )
+        summarize = not ingestion_config.get("skip_document_summary", False)
+        summary_chunks: list[DocumentChunk] = []
+        summary_task: Optional[asyncio.Task] = None
+        timings = {"parse": 0.0, "embed": 0.0, "store": 0.0}
+
+        async def summarize_document() -> None:
+            start = time.perf_counter()
+            await self.augment_document_info(document_info, summary_chunks)
+            timings["summary"] = time.perf_counter() - start
+
+        async def parse() -> None:
+            nonlocal summary_task
+            total_tokens = 0
+            start = time.perf_counter()
+            async for chunk in self.parse_file(
+                document_info, ingestion_config
             ):
-                error_message = f"User {msg.owner_id} has exceeded the maximum number of allowed chunks: {max_chunks}"
-                logger.error(error_message)
-                yield error_message
-                continue
-
-            # Once we hit our batch size, store them
-            if len(vector_batch) >= storage_batch_size:
-                try:
-                    await (
-                        self.providers.database.chunks_handler.upsert_entries(
-                            vector_batch
+                if token_counter:
+                    text = chunk.data
+                    if not isinstance(text, str):
+                        text = text.decode("utf-8", errors="ignore")
+                    total_tokens += token_counter(text)
+                if summarize and summary_task is None:
+                    summary_chunks.append(chunk)
+                    if (
+                        len(summary_chunks)
+                        >= self.config.ingestion.chunks_for_document_summary
+                    ):
+                        summary_task = asyncio.create_task(
+                            summarize_document()
                         )
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to store vector batch: {e}")
-                    yield f"Error: {e}"
-                vector_batch.clear()
+                timings["parse"] += time.perf_counter() - start
+                await chunk_queue.put(chunk)
+                start = time.perf_counter()
+            timings["parse"] += time.perf_counter() - start
+            await chunk_queue.put(None)
+
+            if token_counter:
+                document_info.total_tokens = total_tokens
+            if summarize and summary_task is None:
+                summary_task = asyncio.create_task(summarize_document())
+
+        async def embed_batch(
+            batch: list[DocumentChunk], slots: asyncio.Semaphore
+        ) -> None:
+            try:
+                start = time.perf_counter()
+                vector_entries = await self._embed_chunks(batch)
+                timings["embed"] += time.perf_counter() - start
+                await vector_queue.put(vector_entries)
+            finally:
+                slots.release()
+
+        async def embed() -> None:
+            slots = asyncio.Semaphore(concurrency_limit)
+            tasks: set[asyncio.Task] = set()
+
+            async def submit(batch: list[DocumentChunk]) -> None:
+                await slots.acquire()
+                for task in [task for task in tasks if task.done()]:
+                    tasks.discard(task)
+                    task.result()
+                tasks.add(asyncio.create_task(embed_batch(batch, slots)))
 
-        # Store any leftover items
-        if vector_batch:
             try:
-                await self.providers.database.chunks_handler.upsert_entries(
-                    vector_batch
-                )
-            except Exception as e:
-                logger.error(f"Failed to store final vector batch: {e}")
-                yield f"Error: {e}"
+                batch: list[DocumentChunk] = []
+                while (chunk := await chunk_queue.get()) is not None:
+                    batch.append(chunk)
+                    if len(batch) >= embedding_batch_size:
+                        await submit(batch)
+                        batch = []
+                if batch:
+                    await submit(batch)
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+            await vector_queue.put(None)
+
+        async def store_batch(batch: list[VectorEntry]) -> None:
+            start = time.perf_counter()
+            # Failures are logged by `store_embeddings`.
+            async for _ in self.store_embeddings(
+                batch, storage_batch_size=len(batch)
+            ):
+                pass
+            timings["store"] += time.perf_counter() - start
+
+        async def store() -> None:
+            batch: list[VectorEntry] = []
+            while (vector_entries := await vector_queue.get()) is not None:
+                batch.extend(vector_entries)
+                if len(batch) >= storage_batch_size:
+                    await store_batch(batch)
+                    batch = []
+            if batch:
+                await store_batch(batch)
+
+        start = time.perf_counter()
+        try:
+            await self._run_stages(parse(), embed(), store())
+            if summary_task:
+                await summary_task
+        finally:
+            if summary_task:
+                summary_task.cancel()
+        timings["total"] = time.perf_counter() - start
+
+        document_info.metadata = {
+            **document_info.metadata,
+            "ingestion_timings": {
+                stage: round(seconds, 3) for stage, seconds in timings.items()
+            },
+        }
+        return timings
 
-        # Summaries
-        for doc_id, cnt in document_counts.items():
-            info_msg = f"Successful ingestion for document_id: {doc_id}, with vector count: {cnt}"
-            logger.info(info_msg)
-            yield info_msg
+    @staticmethod
+    async def _run_stages(*stages: Coroutine[Any, Any, None]) -> None:
+        """Runs pipeline stages concurrently, cancelling the rest as soon as
+        one fails so none is left blocked on a queue."""
+        tasks = [asyncio.create_task(stage) for stage in stages]
+        try:
+            done, _ = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION
+            )
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _upsert_vector_entries(
+        self,
+        vector_entries: list[VectorEntry],
+        max_chunks: Optional[dict[UUID, Optional[int]]] = None,
+    ) -> None:
+        chunks_handler = self.providers.database.chunks_handler
+        if self.providers.database.config.bulk_load_chunks:
+            await chunks_handler.bulk_upsert_entries(
+                vector_entries, max_chunks
+            )
+        else:
+            await chunks_handler.upsert_entries(vector_entries, max_chunks)
 
     async def finalize_ingestion(
         self, document_info: DocumentResponse
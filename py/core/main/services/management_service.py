@@ -2,7 +2,7 @@ import logging
 import os
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import IO, Any, BinaryIO, Optional, Tuple
+from typing import Any, AsyncGenerator, BinaryIO, Optional, Tuple
 from uuid import UUID
 
 import toml
@@ -11,11 +11,11 @@ from core.base import (
     CollectionResponse,
     ConversationResponse,
     DocumentResponse,
+    ExportFormat,
     GenerationConfig,
     GraphConstructionStatus,
     Message,
     MessageResponse,
-    Prompt,
     R2RException,
     StoreType,
     User,
@@ -28,6 +28,27 @@ from .base import Service
 logger = logging.getLogger()
 
 
+def _transform_chunk_id_to_id(filters: dict[str, Any]) -> dict[str, Any]:
+    """Example transformation function if your filters use `chunk_id`
+    instead of `id`.
+
+    Recursively transform `chunk_id` to `id`.
+    """
+    if isinstance(filters, dict):
+        transformed = {}
+        for key, value in filters.items():
+            if key == "chunk_id":
+                transformed["id"] = value
+            elif key in ["$and", "$or"]:
+                transformed[key] = [
+                    _transform_chunk_id_to_id(item) for item in value
+                ]
+            else:
+                transformed[key] = _transform_chunk_id_to_id(value)
+        return transformed
+    return filters
+
+
 class ManagementService(Service):
     def __init__(
         self,
@@ -60,78 +81,34 @@ class ManagementService(Service):
         offset: int,
         limit: int,
         user_ids: Optional[list[UUID]] = None,
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
     ):
         return await self.providers.database.users_handler.get_users_overview(
             offset=offset,
             limit=limit,
             user_ids=user_ids,
+            cursor=cursor,
+            exact_total=exact_total,
         )
 
     async def delete_documents_and_chunks_by_filter(
         self,
         filters: dict[str, Any],
     ):
-        """Delete chunks matching the given filters. If any documents are now
-        empty (i.e., have no remaining chunks), delete those documents as well.
+        """Delete the documents with chunks matching the given filters, along
+        with their chunks, entities, relationships and files. Use
+        `delete_chunks_by_filter` to delete chunks alone.
 
         Args:
             filters (dict[str, Any]): Filters specifying which chunks to delete.
-            chunks_handler (PostgresChunksHandler): The handler for chunk operations.
-            documents_handler (PostgresDocumentsHandler): The handler for document operations.
-            graphs_handler: Handler for entity and relationship operations in the Graph.
 
         Returns:
             dict: A summary of what was deleted.
         """
 
-        def transform_chunk_id_to_id(
-            filters: dict[str, Any],
-        ) -> dict[str, Any]:
-            """Example transformation function if your filters use `chunk_id`
-            instead of `id`.
-
-            Recursively transform `chunk_id` to `id`.
-            """
-            if isinstance(filters, dict):
-                transformed = {}
-                for key, value in filters.items():
-                    if key == "chunk_id":
-                        transformed["id"] = value
-                    elif key in ["$and", "$or"]:
-                        transformed[key] = [
-                            transform_chunk_id_to_id(item) for item in value
-                        ]
-                    else:
-                        transformed[key] = transform_chunk_id_to_id(value)
-                return transformed
-            return filters
-
         # Transform filters if needed.
-        transformed_filters = transform_chunk_id_to_id(filters)
-
-        # Find chunks that match the filters before deleting
-        interim_results = (
-            await self.providers.database.chunks_handler.list_chunks(
-                filters=transformed_filters,
-                offset=0,
-                limit=1_000,
-                include_vectors=False,
-            )
-        )
-
-        results = interim_results["results"]
-        while interim_results["total_entries"] == 1_000:
-            # If we hit the limit, we need to paginate to get all results
-
-            interim_results = (
-                await self.providers.database.chunks_handler.list_chunks(
-                    filters=transformed_filters,
-                    offset=interim_results["offset"] + 1_000,
-                    limit=1_000,
-                    include_vectors=False,
-                )
-            )
-            results.extend(interim_results["results"])
+        transformed_filters = _transform_chunk_id_to_id(filters)
 
         document_ids = set()
         owner_id = None
@@ -157,66 +134,43 @@ class ManagementService(Service):
                     UUID(value) if isinstance(value, str) else value
                 )
 
-        # Delete matching chunks from the database
-        delete_results = await self.providers.database.chunks_handler.delete(
-            transformed_filters
+        # Resolve the affected documents in SQL and delete them, with their
+        # chunks, graph rows and files, in batches
+        (
+            deleted_document_ids,
+            deleted_chunks_count,
+        ) = await self.providers.database.documents_handler.delete_by_chunk_filter(
+            filters=transformed_filters,
+            document_ids=list(document_ids),
+            owner_id=owner_id,
         )
 
-        # Extract the document_ids that were affected.
-        affected_doc_ids = {
-            UUID(info["document_id"])
-            for info in delete_results.values()
-            if info.get("document_id")
+        return {
+            "success": True,
+            "deleted_chunks_count": deleted_chunks_count,
+            "deleted_documents_count": len(deleted_document_ids),
+            "deleted_document_ids": [str(d) for d in deleted_document_ids],
         }
-        document_ids.update(affected_doc_ids)
-
-        # Check if the document still has any chunks left
-        docs_to_delete = []
-        for doc_id in document_ids:
-            documents_overview_response = await self.providers.database.documents_handler.get_documents_overview(
-                offset=0, limit=1, filter_document_ids=[doc_id]
-            )
-            if not documents_overview_response["results"]:
-                raise R2RException(
-                    status_code=404, message="Document not found"
-                )
-
-            document = documents_overview_response["results"][0]
 
-            for collection_id in document.collection_ids:
-                await self.providers.database.collections_handler.decrement_collection_document_count(
-                    collection_id=collection_id
-                )
-
-            if owner_id and str(document.owner_id) != owner_id:
-                raise R2RException(
-                    status_code=404,
-                    message="Document not found or insufficient permissions",
-                )
-            docs_to_delete.append(doc_id)
-
-        # Delete documents that no longer have associated chunks
-        for doc_id in docs_to_delete:
-            # Delete related entities & relationships if needed:
-            await self.providers.database.graphs_handler.entities.delete(
-                parent_id=doc_id,
-                store_type=StoreType.DOCUMENTS,
-            )
-            await self.providers.database.graphs_handler.relationships.delete(
-                parent_id=doc_id,
-                store_type=StoreType.DOCUMENTS,
-            )
+    async def delete_chunks_by_filter(
+        self,
+        filters: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Delete only the chunks matching the given filters, leaving their
+        documents, other chunks and files in place.
 
-            # Finally, delete the document from documents_overview:
-            await self.providers.database.documents_handler.delete(
-                document_id=doc_id
-            )
+        Args:
+            filters (dict[str, Any]): Filters specifying which chunks to delete.
 
+        Returns:
+            dict: A summary of what was deleted.
+        """
+        deleted = await self.providers.database.chunks_handler.delete(
+            _transform_chunk_id_to_id(filters)
+        )
         return {
             "success": True,
-            "deleted_chunks_count": len(delete_results),
-            "deleted_documents_count": len(docs_to_delete),
-            "deleted_document_ids": [str(d) for d in docs_to_delete],
+            "deleted_chunks_count": len(deleted),
         }
 
     async def download_file(
@@ -228,18 +182,23 @@ class ManagementService(Service):
             return result
         return None
 
+    async def download_file_stream(
+        self, document_id: UUID
+    ) -> tuple[str, AsyncGenerator[bytes, None], int]:
+        return await self.providers.database.files_handler.stream_file(
+            document_id
+        )
+
     async def export_files(
         self,
         document_ids: Optional[list[UUID]] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> tuple[str, BinaryIO, int]:
-        return (
-            await self.providers.database.files_handler.retrieve_files_as_zip(
-                document_ids=document_ids,
-                start_date=start_date,
-                end_date=end_date,
-            )
+    ) -> tuple[str, AsyncGenerator[bytes, None]]:
+        return await self.providers.database.files_handler.stream_files_as_zip(
+            document_ids=document_ids,
+            start_date=start_date,
+            end_date=end_date,
         )
 
     async def export_collections(
@@ -247,11 +206,13 @@ class ManagementService(Service):
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        return await self.providers.database.collections_handler.export_to_csv(
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        return await self.providers.database.collections_handler.export(
             columns=columns,
             filters=filters,
             include_header=include_header,
+            export_format=export_format,
         )
 
     async def export_documents(
@@ -259,11 +220,13 @@ class ManagementService(Service):
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        return await self.providers.database.documents_handler.export_to_csv(
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        return await self.providers.database.documents_handler.export(
             columns=columns,
             filters=filters,
             include_header=include_header,
+            export_format=export_format,
         )
 
     async def export_document_entities(
@@ -272,13 +235,15 @@ class ManagementService(Service):
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        return await self.providers.database.graphs_handler.entities.export_to_csv(
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        return await self.providers.database.graphs_handler.entities.export(
             parent_id=id,
             store_type=StoreType.DOCUMENTS,
             columns=columns,
             filters=filters,
             include_header=include_header,
+            export_format=export_format,
         )
 
     async def export_document_relationships(
@@ -287,13 +252,17 @@ class ManagementService(Service):
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        return await self.providers.database.graphs_handler.relationships.export_to_csv(
-            parent_id=id,
-            store_type=StoreType.DOCUMENTS,
-            columns=columns,
-            filters=filters,
-            include_header=include_header,
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        return (
+            await self.providers.database.graphs_handler.relationships.export(
+                parent_id=id,
+                store_type=StoreType.DOCUMENTS,
+                columns=columns,
+                filters=filters,
+                include_header=include_header,
+                export_format=export_format,
+            )
         )
 
     async def export_conversations(
@@ -301,11 +270,13 @@ class ManagementService(Service):
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        return await self.providers.database.conversations_handler.export_conversations_to_csv(
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        return await self.providers.database.conversations_handler.export_conversations(
             columns=columns,
             filters=filters,
             include_header=include_header,
+            export_format=export_format,
         )
 
     async def export_graph_entities(
@@ -314,13 +285,15 @@ class ManagementService(Service):
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        return await self.providers.database.graphs_handler.entities.export_to_csv(
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        return await self.providers.database.graphs_handler.entities.export(
             parent_id=id,
             store_type=StoreType.GRAPHS,
             columns=columns,
             filters=filters,
             include_header=include_header,
+            export_format=export_format,
         )
 
     async def export_graph_relationships(
@@ -329,13 +302,17 @@ class ManagementService(Service):
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        return await self.providers.database.graphs_handler.relationships.export_to_csv(
-            parent_id=id,
-            store_type=StoreType.GRAPHS,
-            columns=columns,
-            filters=filters,
-            include_header=include_header,
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        return (
+            await self.providers.database.graphs_handler.relationships.export(
+                parent_id=id,
+                store_type=StoreType.GRAPHS,
+                columns=columns,
+                filters=filters,
+                include_header=include_header,
+                export_format=export_format,
+            )
         )
 
     async def export_graph_communities(
@@ -344,13 +321,15 @@ class ManagementService(Service):
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        return await self.providers.database.graphs_handler.communities.export_to_csv(
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        return await self.providers.database.graphs_handler.communities.export(
             parent_id=id,
             store_type=StoreType.GRAPHS,
             columns=columns,
             filters=filters,
             include_header=include_header,
+            export_format=export_format,
         )
 
     async def export_messages(
@@ -358,11 +337,13 @@ class ManagementService(Service):
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        return await self.providers.database.conversations_handler.export_messages_to_csv(
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        return await self.providers.database.conversations_handler.export_messages(
             columns=columns,
             filters=filters,
             include_header=include_header,
+            export_format=export_format,
         )
 
     async def export_users(
@@ -370,11 +351,13 @@ class ManagementService(Service):
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        return await self.providers.database.users_handler.export_to_csv(
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        return await self.providers.database.users_handler.export(
             columns=columns,
             filters=filters,
             include_header=include_header,
+            export_format=export_format,
         )
 
     async def documents_overview(
@@ -384,6 +367,8 @@ class ManagementService(Service):
         user_ids: Optional[list[UUID]] = None,
         collection_ids: Optional[list[UUID]] = None,
         document_ids: Optional[list[UUID]] = None,
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
     ):
         return await self.providers.database.documents_handler.get_documents_overview(
             offset=offset,
@@ -391,6 +376,8 @@ class ManagementService(Service):
             filter_document_ids=document_ids,
             filter_user_ids=user_ids,
             filter_collection_ids=collection_ids,
+            cursor=cursor,
+            exact_total=exact_total,
         )
 
     async def update_document_metadata(
@@ -603,13 +590,17 @@ class ManagementService(Service):
         user_ids: Optional[list[UUID]] = None,
         document_ids: Optional[list[UUID]] = None,
         collection_ids: Optional[list[UUID]] = None,
-    ) -> dict[str, list[CollectionResponse] | int]:
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
+    ) -> dict[str, Any]:
         return await self.providers.database.collections_handler.get_collections_overview(
             offset=offset,
             limit=limit,
             filter_user_ids=user_ids,
             filter_document_ids=document_ids,
             filter_collection_ids=collection_ids,
+            cursor=cursor,
+            exact_total=exact_total,
         )
 
     async def add_user_to_collection(
@@ -726,8 +717,19 @@ class ManagementService(Service):
         except ValueError as e:
             raise R2RException(status_code=404, message=str(e)) from e
 
-    async def get_all_prompts(self) -> dict[str, Prompt]:
-        return await self.providers.database.prompts_handler.get_all_prompts()
+    async def get_all_prompts(
+        self,
+        offset: int = 0,
+        limit: int = -1,
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
+    ) -> dict[str, Any]:
+        return await self.providers.database.prompts_handler.get_all_prompts(
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            exact_total=exact_total,
+        )
 
     async def update_prompt(
         self,
@@ -776,12 +778,16 @@ class ManagementService(Service):
         limit: int,
         conversation_ids: Optional[list[UUID]] = None,
         user_ids: Optional[list[UUID]] = None,
-    ) -> dict[str, list[dict] | int]:
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
+    ) -> dict[str, Any]:
         return await self.providers.database.conversations_handler.get_conversations_overview(
             offset=offset,
             limit=limit,
             filter_user_ids=user_ids,
             conversation_ids=conversation_ids,
+            cursor=cursor,
+            exact_total=exact_total,
         )
 
     async def add_message(
@@ -848,6 +854,11 @@ class ManagementService(Service):
             return user.limits_overrides["max_chunks"]
         return self.config.app.default_max_chunks_per_user
 
+    async def get_user_chunk_count(self, user_id: UUID) -> int:
+        return await self.providers.database.chunks_handler.get_chunk_count(
+            user_id
+        )
+
     async def get_user_max_collections(self, user_id: UUID) -> int | None:
         user = await self.providers.database.users_handler.get_user_by_id(
             user_id
@@ -1028,11 +1039,7 @@ class ManagementService(Service):
             )
         )["total_entries"]
         max_chunks = await self.get_user_max_chunks(user_id)
-        used_chunks = (
-            await self.providers.database.chunks_handler.list_chunks(
-                limit=1, offset=0, filters={"owner_id": user_id}
-            )
-        )["total_entries"]
+        used_chunks = await self.get_user_chunk_count(user_id)
 
         max_collections = await self.get_user_max_collections(user_id)
         used_collections: int = (  # type: ignore
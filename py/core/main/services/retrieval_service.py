@@ -762,6 +762,7 @@ class RetrievalService(Service):
             query_embedding=query_embedding,
             property_names=["name", "description", "id"],
             filters=search_settings.filters,
+            chunk_settings=search_settings.chunk_settings,
         )
         async for ent in entity_cursor:
             score = ent.get("similarity_score")
@@ -810,6 +811,7 @@ class RetrievalService(Service):
                 "object_id",
             ],
             filters=search_settings.filters,
+            chunk_settings=search_settings.chunk_settings,
         )
         async for rel in rel_cursor:
             score = rel.get("similarity_score")
@@ -858,6 +860,7 @@ class RetrievalService(Service):
                 "summary",
             ],
             filters=search_settings.filters,
+            chunk_settings=search_settings.chunk_settings,
         )
         async for comm in comm_cursor:
             score = comm.get("similarity_score")
@@ -15,6 +15,9 @@ from core.base.providers import (
 class DOCXParser(AsyncParser[str | bytes]):
     """A parser for DOCX data."""
 
+    accepts_file_objects = True
+    process_pool_safe = True
+
     def __init__(
         self,
         config: IngestionConfig,
@@ -33,6 +36,6 @@ class DOCXParser(AsyncParser[str | bytes]):
         if isinstance(data, str):
             raise ValueError("DOCX data must be in bytes format.")
 
-        doc = self.Document(BytesIO(data))
+        doc = self.Document(BytesIO(data) if isinstance(data, bytes) else data)
         for paragraph in doc.paragraphs:
             yield paragraph.text
@@ -8,10 +8,15 @@ import string
 import time
 import unicodedata
 from io import BytesIO
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 # Third-party imports
-from pdf2image import convert_from_bytes, convert_from_path
+from pdf2image import (
+    convert_from_bytes,
+    convert_from_path,
+    pdfinfo_from_bytes,
+    pdfinfo_from_path,
+)
 from pdf2image.exceptions import PDFInfoNotInstalledError
 from PIL import Image
 from pypdf import PdfReader
@@ -43,18 +48,43 @@ class VLMPDFParser(AsyncParser[str | bytes]):
         self.config = config
         self.vision_prompt_text = None
 
+    async def count_pdf_pages(self, data: str | bytes) -> int:
+        """Read the page count from the PDF's info without rendering it."""
+        try:
+            if isinstance(data, bytes):
+                info = await asyncio.to_thread(pdfinfo_from_bytes, data)
+            else:
+                info = await asyncio.to_thread(pdfinfo_from_path, data)
+            return int(info["Pages"])
+        except PDFInfoNotInstalledError as e:
+            logger.error(
+                "PDFInfoNotInstalledError encountered while reading PDF info."
+            )
+            raise PopplerNotFoundError() from e
+        except Exception as err:
+            logger.error(f"Error reading PDF info: {err} type: {type(err)}")
+            raise PDFParsingError(
+                f"Failed to process PDF: {str(err)}", err
+            ) from err
+
     async def convert_pdf_to_images(
-        self, data: str | bytes
+        self,
+        data: str | bytes,
+        dpi: Optional[int] = None,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None,
     ) -> list[Image.Image]:
         """Convert PDF pages to images asynchronously using in-memory
-        conversion."""
-        logger.info("Starting PDF conversion to images.")
+        conversion, optionally only pages `first_page` to `last_page`
+        (1-based, inclusive)."""
         start_time = time.perf_counter()
         options = {
-            "dpi": 300,  # You can make this configurable via self.config if needed
+            "dpi": dpi or self.config.vision_pdf_dpi,
             "fmt": "jpeg",
             "thread_count": 4,
             "paths_only": False,  # Return PIL Image objects instead of writing to disk
+            "first_page": first_page,
+            "last_page": last_page,
         }
         try:
             if isinstance(data, bytes):
@@ -66,8 +96,8 @@ class VLMPDFParser(AsyncParser[str | bytes]):
                     convert_from_path, data, **options
                 )
             elapsed = time.perf_counter() - start_time
-            logger.info(
-                f"PDF conversion completed in {elapsed:.2f} seconds, total pages: {len(images)}"
+            logger.debug(
+                f"PDF conversion of pages {first_page or 1}-{last_page or len(images)} completed in {elapsed:.2f} seconds"
             )
             return images
         except PDFInfoNotInstalledError as e:
@@ -83,18 +113,58 @@ class VLMPDFParser(AsyncParser[str | bytes]):
                 f"Failed to process PDF: {str(err)}", err
             ) from err
 
+    async def rasterize_pages(
+        self, data: str | bytes, dpi: int, window_pages: int
+    ) -> AsyncGenerator[tuple[int, Image.Image], None]:
+        """Yield `(page_num, image)` for every page, rendering
+        `window_pages` pages at a time. The next window is rendered while
+        the current one is consumed, so at most two windows are held in
+        memory."""
+        page_count = await self.count_pdf_pages(data)
+        logger.info(
+            f"Rasterizing {page_count} pages at {dpi} DPI, {window_pages} at a time."
+        )
+
+        def render(first_page: int) -> asyncio.Task:
+            return asyncio.create_task(
+                self.convert_pdf_to_images(
+                    data,
+                    dpi=dpi,
+                    first_page=first_page,
+                    last_page=min(first_page + window_pages - 1, page_count),
+                )
+            )
+
+        starts = range(1, page_count + 1, window_pages)
+        next_window = render(starts[0]) if starts else None
+        try:
+            for i, first_page in enumerate(starts):
+                images = await next_window
+                next_window = (
+                    render(starts[i + 1]) if i + 1 < len(starts) else None
+                )
+                for page_num, image in enumerate(images, first_page):
+                    yield page_num, image
+        finally:
+            if next_window is not None:
+                next_window.cancel()
+
+    @staticmethod
+    def encode_image(image: Image.Image) -> str:
+        """Encode an image as a base64 JPEG and release its pixels."""
+        buf = BytesIO()
+        image.save(buf, format="JPEG")
+        image.close()
+        return base64.b64encode(buf.getvalue()).decode("utf-8")
+
     async def process_page(
         self, image: Image.Image, page_num: int
     ) -> dict[str, str]:
         """Process a single PDF page using the vision model."""
         page_start = time.perf_counter()
         try:
-            # Convert PIL image to JPEG bytes in-memory
-            buf = BytesIO()
-            image.save(buf, format="JPEG")
-            buf.seek(0)
-            image_data = buf.read()
-            image_base64 = base64.b64encode(image_data).decode("utf-8")
+            # JPEG encoding is CPU-bound, so keep it off the event loop
+            image_base64 = await asyncio.to_thread(self.encode_image, image)
 
             model = self.config.vision_pdf_model or self.config.app.vlm
 
@@ -178,7 +248,10 @@ class VLMPDFParser(AsyncParser[str | bytes]):
         """Ingest PDF data and yield the text description for each page using
         the vision model.
 
-        (This version yields a string per page rather than a dictionary.)
+        Pages are rasterized in windows of `vision_pdf_window_pages` and at
+        most `vision_pdf_max_concurrent_pages` are sent to the vision model at
+        once. `vision_pdf_dpi` and both limits may be overridden per
+        document through `kwargs`.
         """
         ingest_start = time.perf_counter()
         logger.info("Starting PDF ingestion using VLMPDFParser.")
@@ -190,45 +263,58 @@ class VLMPDFParser(AsyncParser[str | bytes]):
             )
             logger.info("Retrieved vision prompt text from database.")
 
+        dpi = kwargs.get("vision_pdf_dpi") or self.config.vision_pdf_dpi
+        window_pages = max(
+            1,
+            kwargs.get("vision_pdf_window_pages")
+            or self.config.vision_pdf_window_pages,
+        )
+        max_concurrent_pages = max(
+            1,
+            kwargs.get("vision_pdf_max_concurrent_pages")
+            or self.config.vision_pdf_max_concurrent_pages,
+        )
+
+        pages = self.rasterize_pages(data, dpi, window_pages)
+        pending: set[asyncio.Task] = set()
+        results: dict[int, dict[str, str]] = {}
+        next_page = 1
         try:
-            # Convert PDF to images (in-memory)
-            images = await self.convert_pdf_to_images(data)
-
-            # Create asynchronous tasks for processing each page
-            tasks = {
-                asyncio.create_task(
-                    self.process_page(image, page_num)
-                ): page_num
-                for page_num, image in enumerate(images, 1)
-            }
-
-            if maintain_order:
-                pending = set(tasks.keys())
-                results = {}
-                next_page = 1
-                while pending:
-                    done, pending = await asyncio.wait(
-                        pending, return_when=asyncio.FIRST_COMPLETED
+            exhausted = False
+            while not exhausted or pending:
+                # Only rasterize another page once a slot is free, so pages
+                # waiting for the vision model never pile up in memory.
+                while not exhausted and len(pending) < max_concurrent_pages:
+                    try:
+                        page_num, image = await anext(pages)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(
+                        asyncio.create_task(self.process_page(image, page_num))
                     )
-                    for task in done:
-                        result = await task
-                        page_num = int(result["page"])
-                        results[page_num] = result
-                        while next_page in results:
-                            yield {
-                                "content": results[next_page]["content"],
-                                "page_number": next_page,
-                            }
-                            results.pop(next_page)
-                            next_page += 1
-            else:
-                # Yield results as tasks complete
-                for coro in asyncio.as_completed(tasks.keys()):
-                    result = await coro
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = task.result()
+                    results[int(result["page"])] = result
+                if not maintain_order:
+                    for page_num in sorted(results):
+                        yield {
+                            "content": results.pop(page_num)["content"],
+                            "page_number": page_num,
+                        }
+                    continue
+                while next_page in results:
                     yield {
-                        "content": result["content"],
-                        "page_number": int(result["page"]),
+                        "content": results.pop(next_page)["content"],
+                        "page_number": next_page,
                     }
+                    next_page += 1
             total_elapsed = time.perf_counter() - ingest_start
             logger.info(
                 f"Completed PDF ingestion in {total_elapsed:.2f} seconds using VLMPDFParser."
@@ -236,11 +322,42 @@ class VLMPDFParser(AsyncParser[str | bytes]):
         except Exception as e:
             logger.error(f"Error processing PDF: {str(e)}")
             raise
+        finally:
+            for task in pending:
+                task.cancel()
+            await pages.aclose()
+
+
+def _keep_character(x: str) -> bool:
+    return (
+        unicodedata.category(x)
+        in [
+            "Ll",
+            "Lu",
+            "Lt",
+            "Lm",
+            "Lo",
+            "Nl",
+            "No",
+        ]  # Keep letters and numbers
+        or "\u4e00" <= x <= "\u9fff"  # Chinese characters
+        or "\u0600" <= x <= "\u06ff"  # Arabic characters
+        or "\u0400" <= x <= "\u04ff"  # Cyrillic letters
+        or "\u0370" <= x <= "\u03ff"  # Greek letters
+        or "\u0e00" <= x <= "\u0e7f"  # Thai
+        or "\u3040" <= x <= "\u309f"  # Japanese Hiragana
+        or "\u30a0" <= x <= "\u30ff"  # Katakana
+        or x in string.printable
+    )
 
 
 class BasicPDFParser(AsyncParser[str | bytes]):
     """A parser for PDF data."""
 
+    accepts_file_objects = True
+    process_pool_safe = True
+    supports_page_ranges = True
+
     def __init__(
         self,
         config: IngestionConfig,
@@ -252,42 +369,38 @@ class BasicPDFParser(AsyncParser[str | bytes]):
         self.config = config
         self.PdfReader = PdfReader
 
+    @staticmethod
+    def _clean_text(page_text: str) -> str:
+        # Keep characters in common languages ; # Filter out non-printable characters
+        return "".join(filter(_keep_character, page_text))
+
     async def ingest(
         self, data: str | bytes, **kwargs
     ) -> AsyncGenerator[str, None]:
         """Ingest PDF data and yield text from each page."""
         if isinstance(data, str):
             raise ValueError("PDF data must be in bytes format.")
-        pdf = self.PdfReader(BytesIO(data))
+        pdf = self.PdfReader(
+            BytesIO(data) if isinstance(data, bytes) else data
+        )
         for page in pdf.pages:
             page_text = page.extract_text()
             if page_text is not None:
-                page_text = "".join(
-                    filter(
-                        lambda x: (
-                            unicodedata.category(x)
-                            in [
-                                "Ll",
-                                "Lu",
-                                "Lt",
-                                "Lm",
-                                "Lo",
-                                "Nl",
-                                "No",
-                            ]  # Keep letters and numbers
-                            or "\u4e00" <= x <= "\u9fff"  # Chinese characters
-                            or "\u0600" <= x <= "\u06ff"  # Arabic characters
-                            or "\u0400" <= x <= "\u04ff"  # Cyrillic letters
-                            or "\u0370" <= x <= "\u03ff"  # Greek letters
-                            or "\u0e00" <= x <= "\u0e7f"  # Thai
-                            or "\u3040" <= x <= "\u309f"  # Japanese Hiragana
-                            or "\u30a0" <= x <= "\u30ff"  # Katakana
-                            or x in string.printable
-                        ),
-                        page_text,
-                    )
-                )  # Keep characters in common languages ; # Filter out non-printable characters
-                yield page_text
+                yield self._clean_text(page_text)
+
+    @classmethod
+    def count_pages(cls, path: str) -> int:
+        return len(PdfReader(path).pages)
+
+    @classmethod
+    def extract_pages(cls, path: str, start: int, stop: int) -> list[str]:
+        pages = PdfReader(path).pages
+        texts = []
+        for i in range(start, min(stop, len(pages))):
+            page_text = pages[i].extract_text()
+            if page_text is not None:
+                texts.append(cls._clean_text(page_text))
+        return texts
 
 
 class PDFParserUnstructured(AsyncParser[str | bytes]):
@@ -15,6 +15,9 @@ from core.base.providers import (
 class PPTXParser(AsyncParser[str | bytes]):
     """A parser for PPT data."""
 
+    accepts_file_objects = True
+    process_pool_safe = True
+
     def __init__(
         self,
         config: IngestionConfig,
@@ -33,7 +36,9 @@ class PPTXParser(AsyncParser[str | bytes]):
         if isinstance(data, str):
             raise ValueError("PPT data must be in bytes format.")
 
-        prs = self.Presentation(BytesIO(data))
+        prs = self.Presentation(
+            BytesIO(data) if isinstance(data, bytes) else data
+        )
         for slide in prs.slides:
             for shape in slide.shapes:
                 if hasattr(shape, "text"):
@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 class EPUBParser(AsyncParser[str | bytes]):
     """Parser for EPUB electronic book files."""
 
+    process_pool_safe = True
+
     def __init__(
         self,
         config: IngestionConfig,
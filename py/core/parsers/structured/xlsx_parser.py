@@ -17,6 +17,9 @@ from core.base.providers import (
 class XLSXParser(AsyncParser[str | bytes]):
     """A parser for XLSX data."""
 
+    accepts_file_objects = True
+    process_pool_safe = True
+
     def __init__(
         self,
         config: IngestionConfig,
@@ -35,7 +38,9 @@ class XLSXParser(AsyncParser[str | bytes]):
         if isinstance(data, str):
             raise ValueError("XLSX data must be in bytes format.")
 
-        wb = self.load_workbook(filename=BytesIO(data))
+        wb = self.load_workbook(
+            filename=BytesIO(data) if isinstance(data, bytes) else data
+        )
         for sheet in wb.worksheets:
             for row in sheet.iter_rows(values_only=True):
                 yield ", ".join(map(str, row))
@@ -44,6 +49,8 @@ class XLSXParser(AsyncParser[str | bytes]):
 class XLSXParserAdvanced(AsyncParser[str | bytes]):
     """A parser for XLSX data."""
 
+    accepts_file_objects = True
+
     # identifies connected components in the excel graph and extracts data from each component
     def __init__(
         self, config: IngestionConfig, llm_provider: CompletionProvider
@@ -76,7 +83,9 @@ class XLSXParserAdvanced(AsyncParser[str | bytes]):
         if isinstance(data, str):
             raise ValueError("XLSX data must be in bytes format.")
 
-        workbook = self.load_workbook(filename=BytesIO(data))
+        workbook = self.load_workbook(
+            filename=BytesIO(data) if isinstance(data, bytes) else data
+        )
 
         for ws in workbook.worksheets:
             ws_data = self.np.array(
@@ -14,6 +14,8 @@ from core.base.providers import (
 class HTMLParser(AsyncParser[str | bytes]):
     """A parser for HTML data."""
 
+    process_pool_safe = True
+
     def __init__(
         self,
         config: IngestionConfig,
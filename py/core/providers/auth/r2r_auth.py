@@ -110,7 +110,8 @@ class R2RAuthProvider(AuthProvider):
             token = token.split("&tokenType=refresh")[0]
         # First, check if the token is blacklisted
         if await self.database_provider.token_handler.is_token_blacklisted(
-            token=token
+            token=token,
+            max_staleness_seconds=self.config.blacklist_mirror_refresh_seconds,
         ):
             raise R2RException(
                 status_code=401, message="Token has been invalidated"
@@ -552,6 +553,8 @@ class R2RAuthProvider(AuthProvider):
 
     async def logout(self, token: str) -> dict[str, str]:
         await self.database_provider.token_handler.blacklist_token(token=token)
+        if self.credential_cache is not None:
+            self.credential_cache.invalidate(token)
         return {"message": "Logged out successfully"}
 
     async def clean_expired_blacklisted_tokens(self):
@@ -10,6 +10,32 @@ from core.base.providers import DatabaseConnectionManager
 
 logger = logging.getLogger()
 
+# pgvector rejects `hnsw.ef_search` values above this.
+MAX_EF_SEARCH = 1000
+
+
+def vector_search_settings(
+    ef_search: int,
+    probes: int,
+    limit: int,
+    iterative_scan: bool = False,
+) -> dict[str, str]:
+    """Builds the pgvector settings to apply, transaction-locally, to an
+    approximate nearest neighbour query.
+
+    HNSW never returns more than `ef_search` rows, so it is raised to at
+    least `limit`. With `iterative_scan`, the index keeps scanning until
+    enough rows survive the query's filters (pgvector >= 0.8).
+    """
+    settings = {
+        "hnsw.ef_search": str(min(max(ef_search, limit), MAX_EF_SEARCH)),
+        "ivfflat.probes": str(probes),
+    }
+    if iterative_scan:
+        settings["hnsw.iterative_scan"] = "strict_order"
+        settings["ivfflat.iterative_scan"] = "relaxed_order"
+    return settings
+
 
 class SemaphoreConnectionPool:
     def __init__(self, connection_string, postgres_configuration_settings):
@@ -186,12 +212,14 @@ class PostgresConnectionManager(DatabaseConnectionManager):
                 else:
                     return await conn.executemany(query)
 
-    async def fetch_query(self, query, params=None):
+    async def fetch_query(self, query, params=None, settings=None):
         if not self.pool:
             raise ValueError("PostgresConnectionManager is not initialized.")
         try:
             async with self.pool.get_connection() as conn:
                 async with conn.transaction():
+                    if settings:
+                        await self._set_local(conn, settings)
                     return (
                         await conn.fetch(query, *params)
                         if params
@@ -215,6 +243,19 @@ class PostgresConnectionManager(DatabaseConnectionManager):
             """).strip()
             raise ValueError(error_msg) from None
 
+    @staticmethod
+    async def _set_local(conn, settings: dict[str, str]) -> None:
+        """Applies `settings` for the rest of the current transaction in a
+        single round trip."""
+        calls = ", ".join(
+            f"set_config(${2 * i + 1}, ${2 * i + 2}, true)"
+            for i in range(len(settings))
+        )
+        await conn.execute(
+            f"SELECT {calls}",
+            *[item for setting in settings.items() for item in setting],
+        )
+
     async def fetchrow_query(self, query, params=None):
         if not self.pool:
             raise ValueError("PostgresConnectionManager is not initialized.")
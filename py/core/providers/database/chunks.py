@@ -1,12 +1,13 @@
-import copy
+import asyncio
 import json
 import logging
 import math
+import struct
 import time
-import uuid
-from typing import Any, Optional, TypedDict
+from typing import Any, Optional
 from uuid import UUID
 
+import asyncpg
 import numpy as np
 
 from core.base import (
@@ -24,7 +25,7 @@ from core.base import (
 )
 from core.base.utils import _decorate_vector_type
 
-from .base import PostgresConnectionManager
+from .base import PostgresConnectionManager, vector_search_settings
 from .filters import apply_filters
 
 logger = logging.getLogger()
@@ -73,15 +74,62 @@ def quantize_vector_to_binary(
     return binary_string.encode("ascii")
 
 
-class HybridSearchIntermediateResult(TypedDict):
-    semantic_rank: int
-    full_text_rank: int
-    data: ChunkSearchResult
-    rrf_score: float
+def encode_vector_binary(vector: list[float] | np.ndarray) -> bytes:
+    """Encodes a float vector in pgvector's binary wire format.
+
+    The format is a big-endian int16 dimension, an unused int16 and then the
+    components as big-endian float32 values.
+    """
+    array = np.asarray(vector, dtype=">f4")
+    return struct.pack(">HH", array.shape[0], 0) + array.tobytes()
+
+
+def decode_vector_binary(data: bytes) -> list[float]:
+    """Decodes a vector from pgvector's binary wire format."""
+    dimension, _ = struct.unpack_from(">HH", data)
+    return np.frombuffer(data, dtype=">f4", count=dimension, offset=4).tolist()
+
+
+def quantize_vector_to_bitstring(
+    vector: list[float] | np.ndarray,
+    threshold: float = 0.0,
+) -> asyncpg.BitString:
+    """Quantizes a float vector to an `asyncpg.BitString`, the binary
+    counterpart of `quantize_vector_to_binary` used for COPY."""
+    bits = np.asarray(vector) > threshold
+    return asyncpg.BitString.frombytes(
+        np.packbits(bits).tobytes(), bitlength=bits.shape[0]
+    )
+
+
+def delete_chunks_query(
+    chunks_table: str, counts_table: str, condition: str, select: str
+) -> str:
+    """Builds a statement that deletes the chunks matching `condition`,
+    subtracts them from their owners' chunk counters and returns `select`
+    over the deleted rows' `id`, `document_id`, `owner_id`,
+    `collection_ids` and `text`."""
+    return f"""
+    WITH deleted AS (
+        DELETE FROM {chunks_table}
+        WHERE {condition}
+        RETURNING id, document_id, owner_id, collection_ids, text
+    ), counted AS (
+        UPDATE {counts_table} AS counts
+        SET chunk_count = counts.chunk_count - owners.chunk_count
+        FROM (
+            SELECT owner_id, COUNT(*) AS chunk_count FROM deleted
+            GROUP BY owner_id
+        ) AS owners
+        WHERE counts.owner_id = owners.owner_id
+    )
+    SELECT {select} FROM deleted
+    """
 
 
 class PostgresChunksHandler(Handler):
     TABLE_NAME = VectorTableName.CHUNKS
+    COUNTS_TABLE_NAME = "chunk_counts"
 
     def __init__(
         self,
@@ -93,6 +141,7 @@ class PostgresChunksHandler(Handler):
         super().__init__(project_name, connection_manager)
         self.dimension = dimension
         self.quantization_type = quantization_type
+        self._vector_type_schema: Optional[str] = None
 
     async def create_tables(self):
         # Check for old table name first
@@ -145,6 +194,179 @@ class PostgresChunksHandler(Handler):
         """
 
         await self.connection_manager.execute_query(query)
+        await self._create_chunk_counts()
+
+    async def _create_chunk_counts(self) -> None:
+        """Creates the per-owner chunk counters and the statement-level
+        triggers that keep them in step with the chunks table.
+
+        The counters are backfilled once, when the triggers are first
+        installed, with the chunks table locked against writes so that no
+        chunk is missed or counted twice.
+
+        Updates are not tracked, since nothing reassigns a chunk's owner and
+        an update trigger would materialize every upserted row twice. A path
+        that changes `owner_id` must adjust the counters itself. Deletes are
+        counted by the deleting statement, with `delete_chunks_query`, so
+        that only the owner ids of deleted rows are read back rather than
+        the rows themselves.
+        """
+        chunks_table = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        counts_table = self._get_table_name(
+            PostgresChunksHandler.COUNTS_TABLE_NAME
+        )
+        add_counts = f"""
+                ON CONFLICT (owner_id) DO UPDATE
+                SET chunk_count = {counts_table}.chunk_count + EXCLUDED.chunk_count;"""
+        query = f"""
+        CREATE TABLE IF NOT EXISTS {counts_table} (
+            owner_id UUID PRIMARY KEY,
+            chunk_count BIGINT NOT NULL DEFAULT 0
+        );
+
+        CREATE OR REPLACE FUNCTION {self.project_name}.update_chunk_counts()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO {counts_table} (owner_id, chunk_count)
+                SELECT owner_id, COUNT(*) FROM new_rows
+                WHERE owner_id IS NOT NULL
+                GROUP BY owner_id{add_counts}
+            ELSIF TG_OP = 'TRUNCATE' THEN
+                DELETE FROM {counts_table};
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        DROP TRIGGER IF EXISTS chunk_counts_update ON {chunks_table};
+        DROP TRIGGER IF EXISTS chunk_counts_delete ON {chunks_table};
+        """
+        triggers_query = f"""
+        CREATE TRIGGER chunk_counts_insert
+            AFTER INSERT ON {chunks_table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {self.project_name}.update_chunk_counts();
+
+        CREATE TRIGGER chunk_counts_truncate
+            AFTER TRUNCATE ON {chunks_table}
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {self.project_name}.update_chunk_counts();
+
+        DELETE FROM {counts_table};
+        INSERT INTO {counts_table} (owner_id, chunk_count)
+        SELECT owner_id, COUNT(*) FROM {chunks_table}
+        WHERE owner_id IS NOT NULL
+        GROUP BY owner_id;
+        """
+        triggers_exist_query = """
+        SELECT EXISTS (
+            SELECT 1 FROM pg_trigger
+            WHERE tgrelid = $1::regclass AND tgname = 'chunk_counts_insert'
+        );
+        """
+
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                await conn.execute(query)
+                if await conn.fetchval(triggers_exist_query, chunks_table):
+                    return
+                await conn.execute(
+                    f"LOCK TABLE {chunks_table} IN SHARE ROW EXCLUSIVE MODE"
+                )
+                # Another process may have installed them while we waited.
+                if not await conn.fetchval(triggers_exist_query, chunks_table):
+                    await conn.execute(triggers_query)
+
+    async def get_chunk_count(self, owner_id: UUID) -> int:
+        """Returns the number of chunks owned by `owner_id` from its
+        counter, without counting the chunks themselves."""
+        query = f"""
+        SELECT chunk_count FROM {self._get_table_name(PostgresChunksHandler.COUNTS_TABLE_NAME)}
+        WHERE owner_id = $1
+        """
+        result = await self.connection_manager.fetchrow_query(
+            query, [owner_id]
+        )
+        return result["chunk_count"] if result else 0
+
+    async def _enforce_chunk_limits(
+        self,
+        conn: asyncpg.Connection,
+        entries: list[VectorEntry],
+        max_chunks: dict[UUID, Optional[int]],
+    ) -> None:
+        """Locks the chunk counters of the entries' owners until the end of
+        the current transaction and raises if storing the entries would take
+        any owner past its limit in `max_chunks`.
+
+        Holding the locks until the entries are written means concurrent
+        ingestions for the same owner are checked one after another. Entries
+        that replace an existing chunk are not counted.
+        """
+        counts_table = self._get_table_name(
+            PostgresChunksHandler.COUNTS_TABLE_NAME
+        )
+        # Lock in a consistent order so concurrent batches cannot deadlock.
+        owner_ids = sorted({entry.owner_id for entry in entries})
+        await conn.execute(
+            f"""
+            INSERT INTO {counts_table} (owner_id)
+            SELECT unnest($1::uuid[])
+            ON CONFLICT (owner_id) DO NOTHING
+            """,
+            owner_ids,
+        )
+        counts = {
+            row["owner_id"]: row["chunk_count"]
+            for row in await conn.fetch(
+                f"""
+                SELECT owner_id, chunk_count FROM {counts_table}
+                WHERE owner_id = ANY($1::uuid[])
+                ORDER BY owner_id
+                FOR UPDATE
+                """,
+                owner_ids,
+            )
+        }
+        existing_ids = {
+            row["id"]
+            for row in await conn.fetch(
+                f"""
+                SELECT id FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+                WHERE id = ANY($1::uuid[])
+                """,
+                [entry.id for entry in entries],
+            )
+        }
+
+        added: dict[UUID, int] = {}
+        for entry in {entry.id: entry for entry in entries}.values():
+            if entry.id not in existing_ids:
+                added[entry.owner_id] = added.get(entry.owner_id, 0) + 1
+        for owner_id, count in added.items():
+            limit = max_chunks.get(owner_id)
+            if limit is not None and counts[owner_id] + count > limit:
+                raise R2RException(
+                    status_code=403,
+                    message=f"User {owner_id} has exceeded the maximum number of allowed chunks: {limit}",
+                )
+
+    async def _upsert_many(
+        self,
+        query: str,
+        params: list[tuple],
+        entries: list[VectorEntry],
+        max_chunks: Optional[dict[UUID, Optional[int]]],
+    ) -> None:
+        if max_chunks is None:
+            await self.connection_manager.execute_many(query, params)
+            return
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                await self._enforce_chunk_limits(conn, entries, max_chunks)
+                await conn.executemany(query, params)
 
     async def upsert(self, entry: VectorEntry) -> None:
         """Upsert function that handles vector quantization only when
@@ -216,12 +438,18 @@ class PostgresChunksHandler(Handler):
                 ),
             )
 
-    async def upsert_entries(self, entries: list[VectorEntry]) -> None:
+    async def upsert_entries(
+        self,
+        entries: list[VectorEntry],
+        max_chunks: Optional[dict[UUID, Optional[int]]] = None,
+    ) -> None:
         """Batch upsert function that handles vector quantization only when
         quantization_type is INT1.
 
         Matches the table schema where vec_binary column only exists for INT1
-        quantization.
+        quantization. With `max_chunks`, a mapping from owner id to that
+        owner's chunk limit, the batch is rejected with a 403 if it would take
+        an owner past its limit.
         """
         if self.quantization_type == VectorQuantizationType.INT1:
             bit_dim = (
@@ -257,7 +485,7 @@ class PostgresChunksHandler(Handler):
                 )
                 for entry in entries
             ]
-            await self.connection_manager.execute_many(query, bin_params)
+            await self._upsert_many(query, bin_params, entries, max_chunks)
 
         else:
             # For regular vectors, use vec column only
@@ -286,7 +514,131 @@ class PostgresChunksHandler(Handler):
                 for entry in entries
             ]
 
-            await self.connection_manager.execute_many(query, params)
+            await self._upsert_many(query, params, entries, max_chunks)
+
+    async def _get_vector_type_schema(self, conn) -> str:
+        """Returns the schema the pgvector extension was installed into."""
+        if self._vector_type_schema is None:
+            self._vector_type_schema = await conn.fetchval(
+                "SELECT typnamespace::regnamespace::text FROM pg_type WHERE typname = 'vector'"
+            )
+        return self._vector_type_schema or "public"
+
+    async def bulk_upsert_entries(
+        self,
+        entries: list[VectorEntry],
+        max_chunks: Optional[dict[UUID, Optional[int]]] = None,
+    ) -> None:
+        """Bulk upsert that streams entries into a temporary staging table
+        with a binary COPY and merges them into the chunks table with a single
+        statement.
+
+        Vectors are sent in pgvector's binary format rather than being
+        rendered to text and re-parsed, which makes this considerably cheaper
+        than `upsert_entries` for large batches. `max_chunks` is enforced as
+        in `upsert_entries`.
+        """
+        if not entries:
+            return
+
+        # The merge statement cannot update the same row twice, so keep the
+        # last entry for any repeated id, as sequential upserts would.
+        unique_entries = list({entry.id: entry for entry in entries}.values())
+
+        vector_dim = (
+            "" if math.isnan(self.dimension) else f"({self.dimension})"
+        )
+        columns = [
+            "id",
+            "document_id",
+            "owner_id",
+            "collection_ids",
+            "vec",
+            "text",
+            "metadata",
+        ]
+        staging_columns = [
+            "id UUID",
+            "document_id UUID",
+            "owner_id UUID",
+            "collection_ids UUID[]",
+            f"vec vector{vector_dim}",
+            "text TEXT",
+            "metadata JSONB",
+        ]
+        records: list[tuple[Any, ...]]
+        if self.quantization_type == VectorQuantizationType.INT1:
+            columns.insert(5, "vec_binary")
+            staging_columns.insert(5, f"vec_binary bit{vector_dim}")
+            records = [
+                (
+                    entry.id,
+                    entry.document_id,
+                    entry.owner_id,
+                    entry.collection_ids,
+                    entry.vector.data,
+                    quantize_vector_to_bitstring(entry.vector.data),
+                    entry.text,
+                    json.dumps(entry.metadata),
+                )
+                for entry in unique_entries
+            ]
+        else:
+            records = [
+                (
+                    entry.id,
+                    entry.document_id,
+                    entry.owner_id,
+                    entry.collection_ids,
+                    entry.vector.data,
+                    entry.text,
+                    json.dumps(entry.metadata),
+                )
+                for entry in unique_entries
+            ]
+
+        staging_table = "chunks_staging"
+        column_list = ", ".join(columns)
+        update_clause = ",\n            ".join(
+            f"{column} = EXCLUDED.{column}" for column in columns[1:]
+        )
+        create_staging_query = f"""
+        CREATE TEMP TABLE {staging_table} (
+            {", ".join(staging_columns)}
+        ) ON COMMIT DROP;
+        """
+        merge_query = f"""
+        INSERT INTO {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+        ({column_list})
+        SELECT {column_list} FROM {staging_table}
+        ON CONFLICT (id) DO UPDATE SET
+            {update_clause};
+        """
+
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            vector_schema = await self._get_vector_type_schema(conn)
+            await conn.set_type_codec(
+                "vector",
+                schema=vector_schema,
+                encoder=encode_vector_binary,
+                decoder=decode_vector_binary,
+                format="binary",
+            )
+            try:
+                async with conn.transaction():
+                    if max_chunks is not None:
+                        await self._enforce_chunk_limits(
+                            conn, unique_entries, max_chunks
+                        )
+                    await conn.execute(create_staging_query)
+                    await conn.copy_records_to_table(
+                        staging_table, records=records, columns=columns
+                    )
+                    await conn.execute(merge_query)
+            finally:
+                # Pooled connections are shared with code expecting the
+                # default text representation of vectors.
+                await conn.reset_type_codec("vector", schema=vector_schema)
 
     async def semantic_search(
         self, query_vector: list[float], search_settings: SearchSettings
@@ -308,6 +660,8 @@ class PostgresChunksHandler(Handler):
         ]
 
         params: list[str | int | bytes] = []
+        # Number of rows the index scan itself has to produce.
+        candidate_limit = search_settings.limit
 
         # For binary vectors (INT1), implement two-stage search
         if self.quantization_type == VectorQuantizationType.INT1:
@@ -317,6 +671,7 @@ class PostgresChunksHandler(Handler):
             extended_limit = (
                 search_settings.limit * 20
             )  # Get 20x candidates for re-ranking
+            candidate_limit = extended_limit
 
             if (
                 imeasure_obj == IndexMeasure.hamming_distance
@@ -423,7 +778,17 @@ class PostgresChunksHandler(Handler):
             """
             params.extend([search_settings.limit, search_settings.offset])
 
-        results = await self.connection_manager.fetch_query(query, params)
+        results = await self.connection_manager.fetch_query(
+            query,
+            params,
+            settings=vector_search_settings(
+                ef_search=search_settings.chunk_settings.ef_search,
+                probes=search_settings.chunk_settings.probes,
+                limit=candidate_limit + search_settings.offset,
+                iterative_scan=search_settings.chunk_settings.iterative_scan
+                and bool(search_settings.filters),
+            ),
+        )
 
         return [
             ChunkSearchResult(
@@ -520,20 +885,37 @@ class PostgresChunksHandler(Handler):
                 "The `full_text_limit` must be greater than or equal to the `limit`."
             )
 
-        semantic_settings = copy.deepcopy(search_settings)
-        semantic_settings.limit += search_settings.offset
-
-        full_text_settings = copy.deepcopy(search_settings)
-        full_text_settings.hybrid_settings.full_text_limit += (
-            search_settings.offset
+        # Only the limits differ between the two legs, so shallow copies are
+        # enough; nothing downstream mutates the shared settings.
+        semantic_settings = search_settings.model_copy(
+            update={"limit": search_settings.limit + search_settings.offset}
         )
-
-        semantic_results: list[ChunkSearchResult] = await self.semantic_search(
-            query_vector, semantic_settings
+        full_text_settings = search_settings.model_copy(
+            update={
+                "hybrid_settings": search_settings.hybrid_settings.model_copy(
+                    update={
+                        "full_text_limit": search_settings.hybrid_settings.full_text_limit
+                        + search_settings.offset
+                    }
+                )
+            }
         )
-        full_text_results: list[
-            ChunkSearchResult
-        ] = await self.full_text_search(query_text, full_text_settings)
+
+        semantic_results: list[ChunkSearchResult]
+        full_text_results: list[ChunkSearchResult]
+        if search_settings.hybrid_settings.run_concurrently:
+            # Each leg acquires its own pooled connection.
+            semantic_results, full_text_results = await asyncio.gather(
+                self.semantic_search(query_vector, semantic_settings),
+                self.full_text_search(query_text, full_text_settings),
+            )
+        else:
+            semantic_results = await self.semantic_search(
+                query_vector, semantic_settings
+            )
+            full_text_results = await self.full_text_search(
+                query_text, full_text_settings
+            )
 
         semantic_limit = search_settings.limit
         full_text_limit = search_settings.hybrid_settings.full_text_limit
@@ -541,67 +923,67 @@ class PostgresChunksHandler(Handler):
         full_text_weight = search_settings.hybrid_settings.full_text_weight
         rrf_k = search_settings.hybrid_settings.rrf_k
 
-        combined_results: dict[uuid.UUID, HybridSearchIntermediateResult] = {}
+        # Collect the union of both legs, semantic hits first, and record the
+        # rank of every result in each leg. Results missing from a leg get
+        # that leg's limit as their rank.
+        positions: dict[UUID, int] = {}
+        results: list[ChunkSearchResult] = []
+        semantic_ranks: list[int] = []
+        full_text_ranks: list[int] = []
 
         for rank, result in enumerate(semantic_results, 1):
-            combined_results[result.id] = {
-                "semantic_rank": rank,
-                "full_text_rank": full_text_limit,
-                "data": result,
-                "rrf_score": 0.0,  # Initialize with 0, will be calculated later
-            }
+            positions[result.id] = len(results)
+            results.append(result)
+            semantic_ranks.append(rank)
+            full_text_ranks.append(full_text_limit)
 
         for rank, result in enumerate(full_text_results, 1):
-            if result.id in combined_results:
-                combined_results[result.id]["full_text_rank"] = rank
+            position = positions.get(result.id)
+            if position is not None:
+                full_text_ranks[position] = rank
             else:
-                combined_results[result.id] = {
-                    "semantic_rank": semantic_limit,
-                    "full_text_rank": rank,
-                    "data": result,
-                    "rrf_score": 0.0,  # Initialize with 0, will be calculated later
-                }
-
-        combined_results = {
-            k: v
-            for k, v in combined_results.items()
-            if v["semantic_rank"] <= semantic_limit * 2
-            and v["full_text_rank"] <= full_text_limit * 2
-        }
-
-        for hyb_result in combined_results.values():
-            semantic_score = 1 / (rrf_k + hyb_result["semantic_rank"])
-            full_text_score = 1 / (rrf_k + hyb_result["full_text_rank"])
-            hyb_result["rrf_score"] = (
-                semantic_score * semantic_weight
-                + full_text_score * full_text_weight
-            ) / (semantic_weight + full_text_weight)
-
-        sorted_results = sorted(
-            combined_results.values(),
-            key=lambda x: x["rrf_score"],
-            reverse=True,
+                positions[result.id] = len(results)
+                results.append(result)
+                semantic_ranks.append(semantic_limit)
+                full_text_ranks.append(rank)
+
+        semantic_rank_array = np.asarray(semantic_ranks, dtype=np.int64)
+        full_text_rank_array = np.asarray(full_text_ranks, dtype=np.int64)
+        keep = np.flatnonzero(
+            (semantic_rank_array <= semantic_limit * 2)
+            & (full_text_rank_array <= full_text_limit * 2)
+        )
+        rrf_scores = (
+            (1 / (rrf_k + semantic_rank_array[keep])) * semantic_weight
+            + (1 / (rrf_k + full_text_rank_array[keep])) * full_text_weight
+        ) / (semantic_weight + full_text_weight)
+
+        # A stable sort on the negated score keeps ties in insertion order,
+        # matching `sorted(..., reverse=True)`.
+        order = keep[np.argsort(-rrf_scores, kind="stable")]
+        scores_by_position = dict(
+            zip(keep.tolist(), rrf_scores.tolist(), strict=True)
         )
-        offset_results = sorted_results[
+        selected = order[
             search_settings.offset : search_settings.offset
             + search_settings.limit
-        ]
+        ].tolist()
 
         return [
             ChunkSearchResult(
-                id=result["data"].id,
-                document_id=result["data"].document_id,
-                owner_id=result["data"].owner_id,
-                collection_ids=result["data"].collection_ids,
-                text=result["data"].text,
-                score=result["rrf_score"],
+                id=results[position].id,
+                document_id=results[position].document_id,
+                owner_id=results[position].owner_id,
+                collection_ids=results[position].collection_ids,
+                text=results[position].text,
+                score=scores_by_position[position],
                 metadata={
-                    **result["data"].metadata,
-                    "semantic_rank": result["semantic_rank"],
-                    "full_text_rank": result["full_text_rank"],
+                    **results[position].metadata,
+                    "semantic_rank": semantic_ranks[position],
+                    "full_text_rank": full_text_ranks[position],
                 },
             )
-            for result in offset_results
+            for position in selected
         ]
 
     async def delete(
@@ -612,11 +994,7 @@ class PostgresChunksHandler(Handler):
             filters, params, mode="condition_only"
         )
 
-        query = f"""
-        DELETE FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-        WHERE {where_clause}
-        RETURNING id, document_id, text;
-        """
+        query = self._delete_query(where_clause, "id, document_id, text")
 
         results = await self.connection_manager.fetch_query(query, params)
 
@@ -654,20 +1032,21 @@ class PostgresChunksHandler(Handler):
             query, (collection_id, document_id)
         )
 
+    def _delete_query(self, condition: str, select: str) -> str:
+        return delete_chunks_query(
+            self._get_table_name(PostgresChunksHandler.TABLE_NAME),
+            self._get_table_name(PostgresChunksHandler.COUNTS_TABLE_NAME),
+            condition,
+            select,
+        )
+
     async def delete_user_vector(self, owner_id: UUID) -> None:
-        query = f"""
-        DELETE FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-        WHERE owner_id = $1;
-        """
+        query = self._delete_query("owner_id = $1", "COUNT(*)")
         await self.connection_manager.execute_query(query, (owner_id,))
 
     async def delete_collection_vector(self, collection_id: UUID) -> None:
-        query = f"""
-         DELETE FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-         WHERE $1 = ANY(collection_ids)
-         RETURNING collection_ids
-         """
-        await self.connection_manager.fetchrow_query(query, (collection_id,))
+        query = self._delete_query("$1 = ANY(collection_ids)", "COUNT(*)")
+        await self.connection_manager.execute_query(query, (collection_id,))
         return None
 
     async def list_document_chunks(
@@ -1,8 +1,6 @@
-import csv
 import json
 import logging
-import tempfile
-from typing import IO, Any, Optional
+from typing import Any, AsyncGenerator, Optional
 from uuid import UUID, uuid4
 
 from asyncpg.exceptions import UniqueViolationError
@@ -18,11 +16,14 @@ from core.base import (
 from core.base.abstractions import (
     DocumentResponse,
     DocumentType,
+    ExportFormat,
     IngestionStatus,
 )
 from core.base.api.models import CollectionResponse
 
 from .base import PostgresConnectionManager
+from .export import select_columns, stream_export
+from .pagination import CREATED_AT_ID, Keyset, RowCounter, total_from_page
 
 logger = logging.getLogger()
 
@@ -38,6 +39,7 @@ class PostgresCollectionsHandler(Handler):
     ):
         self.config = config
         super().__init__(project_name, connection_manager)
+        self.row_counter = RowCounter(connection_manager)
 
     async def create_tables(self) -> None:
         # 1. Create the table if it does not exist.
@@ -54,6 +56,8 @@ class PostgresCollectionsHandler(Handler):
             user_count INT DEFAULT 0,
             document_count INT DEFAULT 0
         );
+        CREATE INDEX IF NOT EXISTS collections_created_at_id_idx
+        ON {self._get_table_name(PostgresCollectionsHandler.TABLE_NAME)} (created_at, id);
         """
         await self.connection_manager.execute_query(create_table_query)
 
@@ -349,7 +353,15 @@ class PostgresCollectionsHandler(Handler):
         filter_user_ids: Optional[list[UUID]] = None,
         filter_document_ids: Optional[list[UUID]] = None,
         filter_collection_ids: Optional[list[UUID]] = None,
-    ) -> dict[str, list[CollectionResponse] | int]:
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
+    ) -> dict[str, Any]:
+        """Fetch collections ordered by `(created_at, id)`, newest first.
+
+        Passing the `next_cursor` of a page as `cursor` returns the page
+        after it. With `exact_total` off, `total_entries` may be an
+        estimate.
+        """
         conditions = []
         params: list[Any] = []
         param_index = 1
@@ -381,17 +393,29 @@ class PostgresCollectionsHandler(Handler):
             params.append(filter_collection_ids)
             param_index += 1
 
+        table_name = self._get_table_name(
+            PostgresCollectionsHandler.TABLE_NAME
+        )
+        count_query = f"SELECT COUNT(*) FROM {table_name} c"
+        if conditions:
+            count_query += f" WHERE {' AND '.join(conditions)}"
+        count_params = list(params)
+        count_table = None if conditions else table_name
+
+        keyset = Keyset(CREATED_AT_ID, alias="c")
+        if cursor:
+            conditions.append(keyset.condition(cursor, params))
+            param_index = len(params) + 1
+
         where_clause = (
             f"WHERE {' AND '.join(conditions)}" if conditions else ""
         )
 
         query = f"""
-            SELECT
-                c.*,
-                COUNT(*) OVER() as total_entries
+            SELECT c.*
             FROM {self.project_name}.collections c
             {where_clause}
-            ORDER BY created_at DESC
+            ORDER BY {keyset.order_by()}
             OFFSET ${param_index}
         """
         params.append(offset)
@@ -404,14 +428,22 @@ class PostgresCollectionsHandler(Handler):
         try:
             results = await self.connection_manager.fetch_query(query, params)
 
-            if not results:
-                return {"results": [], "total_entries": 0}
-
-            total_entries = results[0]["total_entries"] if results else 0
+            total_entries = total_from_page(results, offset, limit, cursor)
+            if total_entries is None:
+                total_entries = await self.row_counter.count(
+                    count_query,
+                    count_params,
+                    exact=exact_total,
+                    table=count_table,
+                )
 
             collections = [CollectionResponse(**row) for row in results]
 
-            return {"results": collections, "total_entries": total_entries}
+            return {
+                "results": collections,
+                "total_entries": total_entries,
+                "next_cursor": keyset.next_cursor(results, limit),
+            }
         except Exception as e:
             raise HTTPException(
                 status_code=500,
@@ -544,14 +576,14 @@ class PostgresCollectionsHandler(Handler):
             collection_query, [decrement_by, collection_id]
         )
 
-    async def export_to_csv(
+    async def export(
         self,
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        """Creates a CSV file from the PostgreSQL data and returns the path to
-        the temp file."""
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        """Streams the data as CSV, Parquet or Arrow."""
         valid_columns = {
             "id",
             "owner_id",
@@ -617,52 +649,13 @@ class PostgresCollectionsHandler(Handler):
             if conditions:
                 select_stmt = f"{select_stmt} WHERE {' AND '.join(conditions)}"
 
-        select_stmt = f"{select_stmt} ORDER BY created_at DESC"
-
-        temp_file = None
-        try:
-            temp_file = tempfile.NamedTemporaryFile(
-                mode="w", delete=True, suffix=".csv"
-            )
-            writer = csv.writer(temp_file, quoting=csv.QUOTE_ALL)
-
-            async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
-                async with conn.transaction():
-                    cursor = await conn.cursor(select_stmt, *params)
-
-                    if include_header:
-                        writer.writerow(columns)
-
-                    chunk_size = 1000
-                    while True:
-                        rows = await cursor.fetch(chunk_size)
-                        if not rows:
-                            break
-                        for row in rows:
-                            row_dict = {
-                                "id": row[0],
-                                "owner_id": row[1],
-                                "name": row[2],
-                                "description": row[3],
-                                "graph_sync_status": row[4],
-                                "graph_cluster_status": row[5],
-                                "created_at": row[6],
-                                "updated_at": row[7],
-                                "user_count": row[8],
-                                "document_count": row[9],
-                            }
-                            writer.writerow([row_dict[col] for col in columns])
-
-            temp_file.flush()
-            return temp_file.name, temp_file
-
-        except Exception as e:
-            if temp_file:
-                temp_file.close()
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to export data: {str(e)}",
-            ) from e
+        return await stream_export(
+            self.connection_manager.pool,  # type: ignore
+            select_columns(select_stmt, columns, "created_at DESC"),
+            params,
+            export_format,
+            include_header,
+        )
 
     async def get_collection_by_name(
         self, owner_id: UUID, name: str
@@ -1,20 +1,21 @@
-import csv
 import json
 import logging
-import tempfile
 from datetime import datetime
-from typing import IO, Any, Optional
+from typing import Any, AsyncGenerator, Optional
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
 
 from core.base import Handler, Message, R2RException
+from core.base.abstractions import ExportFormat
 from shared.api.models.management.responses import (
     ConversationResponse,
     MessageResponse,
 )
 
 from .base import PostgresConnectionManager
+from .export import select_columns, stream_export
+from .pagination import CREATED_AT_ID, Keyset, RowCounter, total_from_page
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +78,7 @@ class PostgresConversationsHandler(Handler):
     ):
         self.project_name = project_name
         self.connection_manager = connection_manager
+        self.row_counter = RowCounter(connection_manager)
 
     async def create_tables(self):
         create_conversations_query = f"""
@@ -86,6 +88,8 @@ class PostgresConversationsHandler(Handler):
             created_at TIMESTAMPTZ DEFAULT NOW(),
             name TEXT
         );
+        CREATE INDEX IF NOT EXISTS conversations_created_at_id_idx
+        ON {self._get_table_name("conversations")} (created_at, id);
         """
 
         create_messages_query = f"""
@@ -136,7 +140,15 @@ class PostgresConversationsHandler(Handler):
         limit: int,
         filter_user_ids: Optional[list[UUID]] = None,
         conversation_ids: Optional[list[UUID]] = None,
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
     ) -> dict[str, Any]:
+        """Fetch conversations ordered by `(created_at, id)`, newest first.
+
+        Passing the `next_cursor` of a page as `cursor` returns the page
+        after it. With `exact_total` off, `total_entries` may be an
+        estimate.
+        """
         conditions = []
         params: list = []
         param_index = 1
@@ -157,26 +169,31 @@ class PostgresConversationsHandler(Handler):
             params.append(conversation_ids)
             param_index += 1
 
+        table_name = self._get_table_name("conversations")
+        count_query = f"SELECT COUNT(*) FROM {table_name} c"
+        if conditions:
+            count_query += " WHERE " + " AND ".join(conditions)
+        count_params = list(params)
+        count_table = None if conditions else table_name
+
+        keyset = Keyset(CREATED_AT_ID, alias="c")
+        if cursor:
+            conditions.append(keyset.condition(cursor, params))
+            param_index = len(params) + 1
+
         where_clause = (
             "WHERE " + " AND ".join(conditions) if conditions else ""
         )
 
         query = f"""
-            WITH conversation_overview AS (
-                SELECT c.id,
-                    extract(epoch from c.created_at) as created_at_epoch,
-                    c.user_id,
-                    c.name
-                FROM {self._get_table_name("conversations")} c
-                {where_clause}
-            ),
-            counted_overview AS (
-                SELECT *,
-                    COUNT(*) OVER() AS total_entries
-                FROM conversation_overview
-            )
-            SELECT * FROM counted_overview
-            ORDER BY created_at_epoch DESC
+            SELECT c.id,
+                c.created_at,
+                extract(epoch from c.created_at) as created_at_epoch,
+                c.user_id,
+                c.name
+            FROM {table_name} c
+            {where_clause}
+            ORDER BY {keyset.order_by()}
             OFFSET ${param_index}
         """
         params.append(offset)
@@ -188,10 +205,15 @@ class PostgresConversationsHandler(Handler):
 
         results = await self.connection_manager.fetch_query(query, params)
 
-        if not results:
-            return {"results": [], "total_entries": 0}
+        total_entries = total_from_page(results, offset, limit, cursor)
+        if total_entries is None:
+            total_entries = await self.row_counter.count(
+                count_query,
+                count_params,
+                exact=exact_total,
+                table=count_table,
+            )
 
-        total_entries = results[0]["total_entries"]
         conversations = [
             {
                 "id": str(row["id"]),
@@ -202,7 +224,11 @@ class PostgresConversationsHandler(Handler):
             for row in results
         ]
 
-        return {"results": conversations, "total_entries": total_entries}
+        return {
+            "results": conversations,
+            "total_entries": total_entries,
+            "next_cursor": keyset.next_cursor(results, limit),
+        }
 
     async def add_message(
         self,
@@ -566,14 +592,14 @@ class PostgresConversationsHandler(Handler):
             del_conv_query, [conversation_id]
         )
 
-    async def export_conversations_to_csv(
+    async def export_conversations(
         self,
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        """Creates a CSV file from the PostgreSQL data and returns the path to
-        the temp file."""
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        """Streams the data as CSV, Parquet or Arrow."""
         valid_columns = {
             "id",
             "user_id",
@@ -627,61 +653,30 @@ class PostgresConversationsHandler(Handler):
         if conditions:
             select_stmt = f"{select_stmt} WHERE {' AND '.join(conditions)}"
 
-        select_stmt = f"{select_stmt} ORDER BY created_at DESC"
-
-        temp_file = None
-        try:
-            temp_file = tempfile.NamedTemporaryFile(
-                mode="w", delete=True, suffix=".csv"
-            )
-            writer = csv.writer(temp_file, quoting=csv.QUOTE_ALL)
-
-            async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
-                async with conn.transaction():
-                    cursor = await conn.cursor(select_stmt, *params)
-
-                    if include_header:
-                        writer.writerow(columns)
-
-                    chunk_size = 1000
-                    while True:
-                        rows = await cursor.fetch(chunk_size)
-                        if not rows:
-                            break
-                        for row in rows:
-                            row_dict = {
-                                "id": row[0],
-                                "user_id": row[1],
-                                "created_at": row[2],
-                                "name": row[3],
-                            }
-                            writer.writerow([row_dict[col] for col in columns])
-
-            temp_file.flush()
-            return temp_file.name, temp_file
-
-        except Exception as e:
-            if temp_file:
-                temp_file.close()
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to export data: {str(e)}",
-            ) from e
+        return await stream_export(
+            self.connection_manager.pool,  # type: ignore
+            select_columns(select_stmt, columns, "created_at DESC"),
+            params,
+            export_format,
+            include_header,
+        )
 
-    async def export_messages_to_csv(
+    async def export_messages(
         self,
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
+        export_format: ExportFormat = ExportFormat.CSV,
         handle_images: str = "metadata_only",  # Options: "full", "metadata_only", "exclude"
-    ) -> tuple[str, IO]:
+    ) -> AsyncGenerator[bytes, None]:
         """
-        Creates a CSV file from the PostgreSQL data and returns the path to the temp file.
+        Streams the data as CSV, Parquet or Arrow.
 
         Args:
             columns: List of columns to include in export
             filters: Filter criteria for messages
             include_header: Whether to include header row
+            export_format: Format to export the data in
             handle_images: How to handle image data in exports:
                 - "full": Include complete image data (warning: may create large files)
                 - "metadata_only": Replace image data with metadata only
@@ -702,26 +697,41 @@ class PostgresConversationsHandler(Handler):
         elif invalid_cols := set(columns) - valid_columns:
             raise ValueError(f"Invalid columns: {invalid_cols}")
 
-        # Add virtual column for image presence
-        virtual_columns = []
-        has_image_column = False
-
-        if "has_image" in columns:
-            virtual_columns.append(
-                "(content->>'image_url' IS NOT NULL OR content->>'image_data' IS NOT NULL) as has_image"
-            )
-            columns.remove("has_image")
-            has_image_column = True
+        # Image data is replaced or removed by the query itself
+        if handle_images == "metadata_only":
+            content = """
+                CASE WHEN jsonb_typeof(content->'image_data') = 'object'
+                THEN jsonb_set(
+                    content,
+                    '{image_data}',
+                    jsonb_build_object(
+                        'media_type',
+                        COALESCE(
+                            content->'image_data'->>'media_type', 'image/jpeg'
+                        ),
+                        'data',
+                        '[BASE64_DATA_EXCLUDED_FROM_EXPORT]'
+                    )
+                )
+                ELSE content END
+            """
+        elif handle_images == "exclude":
+            content = "content - 'image_data'"
+        else:
+            content = "content"
 
         select_stmt = f"""
             SELECT
                 id::text,
                 conversation_id::text,
                 parent_id::text,
-                content::text,
+                ({content})::text AS content,
                 metadata::text,
-                to_char(created_at, 'YYYY-MM-DD HH24:MI:SS') AS created_at
-                {", " + ", ".join(virtual_columns) if virtual_columns else ""}
+                to_char(created_at, 'YYYY-MM-DD HH24:MI:SS') AS created_at,
+                (
+                    content->>'image_url' IS NOT NULL
+                    OR content->>'image_data' IS NOT NULL
+                )::text AS has_image
             FROM {self._get_table_name("messages")}
         """
 
@@ -764,95 +774,10 @@ class PostgresConversationsHandler(Handler):
         if conditions:
             select_stmt = f"{select_stmt} WHERE {' AND '.join(conditions)}"
 
-        select_stmt = f"{select_stmt} ORDER BY created_at DESC"
-
-        temp_file = None
-        try:
-            temp_file = tempfile.NamedTemporaryFile(
-                mode="w", delete=True, suffix=".csv"
-            )
-            writer = csv.writer(temp_file, quoting=csv.QUOTE_ALL)
-
-            # Prepare export columns
-            export_columns = list(columns)
-            if has_image_column:
-                export_columns.append("has_image")
-
-            if include_header:
-                writer.writerow(export_columns)
-
-            async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
-                async with conn.transaction():
-                    cursor = await conn.cursor(select_stmt, *params)
-
-                    chunk_size = 1000
-                    while True:
-                        rows = await cursor.fetch(chunk_size)
-                        if not rows:
-                            break
-                        for row in rows:
-                            row_dict = {
-                                "id": row[0],
-                                "conversation_id": row[1],
-                                "parent_id": row[2],
-                                "content": row[3],
-                                "metadata": row[4],
-                                "created_at": row[5],
-                            }
-
-                            # Add virtual column if present
-                            if has_image_column:
-                                row_dict["has_image"] = (
-                                    "true" if row[6] else "false"
-                                )
-
-                            # Process image data based on handle_images setting
-                            if (
-                                "content" in columns
-                                and handle_images != "full"
-                            ):
-                                try:
-                                    content_json = json.loads(
-                                        row_dict["content"]
-                                    )
-
-                                    if (
-                                        "image_data" in content_json
-                                        and content_json["image_data"]
-                                    ):
-                                        media_type = content_json[
-                                            "image_data"
-                                        ].get("media_type", "image/jpeg")
-
-                                        if handle_images == "metadata_only":
-                                            content_json["image_data"] = {
-                                                "media_type": media_type,
-                                                "data": "[BASE64_DATA_EXCLUDED_FROM_EXPORT]",
-                                            }
-                                        elif handle_images == "exclude":
-                                            content_json.pop(
-                                                "image_data", None
-                                            )
-
-                                    row_dict["content"] = json.dumps(
-                                        content_json
-                                    )
-                                except (json.JSONDecodeError, TypeError) as e:
-                                    logger.warning(
-                                        f"Error processing message content for export: {e}"
-                                    )
-
-                            writer.writerow(
-                                [row_dict[col] for col in export_columns]
-                            )
-
-            temp_file.flush()
-            return temp_file.name, temp_file
-
-        except Exception as e:
-            if temp_file:
-                temp_file.close()
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to export data: {str(e)}",
-            ) from e
+        return await stream_export(
+            self.connection_manager.pool,  # type: ignore
+            select_columns(select_stmt, columns, "created_at DESC"),
+            params,
+            export_format,
+            include_header,
+        )
@@ -1,11 +1,9 @@
 import asyncio
 import copy
-import csv
 import json
 import logging
 import math
-import tempfile
-from typing import IO, Any, Optional
+from typing import Any, AsyncGenerator, Optional
 from uuid import UUID
 
 import asyncpg
@@ -21,9 +19,13 @@ from core.base import (
     R2RException,
     SearchSettings,
 )
+from core.base.abstractions import ExportFormat
 
 from .base import PostgresConnectionManager
+from .chunks import PostgresChunksHandler, delete_chunks_query
+from .export import select_columns, stream_export
 from .filters import apply_filters
+from .pagination import CREATED_AT_ID, Keyset, RowCounter, total_from_page
 
 logger = logging.getLogger()
 
@@ -78,6 +80,7 @@ class PostgresDocumentsHandler(Handler):
     ):
         self.dimension = dimension
         super().__init__(project_name, connection_manager)
+        self.row_counter = RowCounter(connection_manager)
 
     async def create_tables(self):
         logger.info(
@@ -117,6 +120,9 @@ class PostgresDocumentsHandler(Handler):
             CREATE INDEX IF NOT EXISTS idx_collection_ids_{self.project_name}
             ON {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)} USING GIN (collection_ids);
 
+            CREATE INDEX IF NOT EXISTS idx_documents_created_at_id_{self.project_name}
+            ON {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)} (created_at, id);
+
             -- Full text search index
             CREATE INDEX IF NOT EXISTS idx_doc_search_{self.project_name}
             ON {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)}
@@ -343,6 +349,200 @@ class PostgresDocumentsHandler(Handler):
 
         await self.connection_manager.execute_query(query=query, params=params)
 
+    async def delete_by_chunk_filter(
+        self,
+        filters: dict[str, Any],
+        document_ids: Optional[list[UUID]] = None,
+        owner_id: Optional[str] = None,
+        batch_size: int = 100,
+        chunk_batch_size: int = 10_000,
+    ) -> tuple[list[UUID], int]:
+        """Delete every document with a chunk matching `filters`, along with
+        `document_ids`, and everything stored for them: chunks, entities,
+        relationships, collection counts and files.
+
+        The target documents are resolved once, in SQL, into a temporary
+        table. They are then deleted `batch_size` documents at a time, with
+        their chunks removed in transactions of at most `chunk_batch_size`
+        rows, so no single transaction grows with the size of the deletion.
+
+        Returns the ids of the deleted documents and the number of deleted
+        chunks.
+        """
+        chunks_table = self._get_table_name("chunks")
+        documents_table = self._get_table_name(
+            PostgresDocumentsHandler.TABLE_NAME
+        )
+        targets_table = "pg_temp.document_delete_targets"
+
+        where_clause, params = apply_filters(
+            filters, [], mode="condition_only"
+        )
+        # An empty filter matches no chunks rather than all of them.
+        where_clause = where_clause or "FALSE"
+        document_ids = document_ids or []
+
+        deleted_document_ids: list[UUID] = []
+        deleted_chunks = 0
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            try:
+                await conn.execute(
+                    f"""
+                    DROP TABLE IF EXISTS {targets_table};
+                    CREATE TEMP TABLE document_delete_targets (id UUID PRIMARY KEY);
+                    """
+                )
+                await conn.execute(
+                    f"""
+                    INSERT INTO {targets_table} (id)
+                    SELECT document_id FROM {chunks_table}
+                    WHERE ({where_clause}) AND document_id IS NOT NULL
+                    UNION
+                    SELECT unnest(${len(params) + 1}::uuid[])
+                    """,
+                    *params,
+                    document_ids,
+                )
+
+                missing = await conn.fetchval(
+                    f"""
+                    SELECT COUNT(*) FROM unnest($1::uuid[]) AS t(id)
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM {documents_table} d WHERE d.id = t.id
+                    )
+                    """,
+                    document_ids,
+                )
+                if missing:
+                    raise R2RException(
+                        status_code=404, message="Document not found"
+                    )
+                if owner_id and await conn.fetchval(
+                    f"""
+                    SELECT EXISTS (
+                        SELECT 1 FROM {targets_table} t
+                        JOIN {documents_table} d ON d.id = t.id
+                        WHERE d.owner_id IS DISTINCT FROM $1::uuid
+                    )
+                    """,
+                    owner_id,
+                ):
+                    raise R2RException(
+                        status_code=404,
+                        message="Document not found or insufficient permissions",
+                    )
+
+                total = await conn.fetchval(
+                    f"SELECT COUNT(*) FROM {targets_table}"
+                )
+                logger.info(f"Deleting {total} documents matching {filters}")
+
+                while batch := [
+                    row["id"]
+                    for row in await conn.fetch(
+                        f"""
+                        DELETE FROM {targets_table}
+                        WHERE id IN (
+                            SELECT id FROM {targets_table} LIMIT $1
+                        )
+                        RETURNING id
+                        """,
+                        batch_size,
+                    )
+                ]:
+                    deleted_chunks += await self._delete_chunks_in_batches(
+                        conn, chunks_table, batch, chunk_batch_size
+                    )
+                    deleted_document_ids.extend(
+                        await self._delete_document_rows(conn, batch)
+                    )
+                    logger.info(
+                        f"Deleted {len(deleted_document_ids)}/{total} documents "
+                        f"and {deleted_chunks} chunks"
+                    )
+            finally:
+                if not conn.is_closed():
+                    await conn.execute(f"DROP TABLE IF EXISTS {targets_table}")
+
+        return deleted_document_ids, deleted_chunks
+
+    async def _delete_chunks_in_batches(
+        self,
+        conn,
+        chunks_table: str,
+        document_ids: list[UUID],
+        batch_size: int,
+    ) -> int:
+        query = delete_chunks_query(
+            chunks_table,
+            self._get_table_name(PostgresChunksHandler.COUNTS_TABLE_NAME),
+            f"""id IN (
+                SELECT id FROM {chunks_table}
+                WHERE document_id = ANY($1::uuid[])
+                LIMIT $2
+            )""",
+            "COUNT(*)",
+        )
+        deleted = 0
+        while True:
+            async with conn.transaction():
+                count = await conn.fetchval(query, document_ids, batch_size)
+            deleted += count
+            if count < batch_size:
+                return deleted
+
+    async def _delete_document_rows(
+        self, conn, document_ids: list[UUID]
+    ) -> list[UUID]:
+        """Delete the graph rows, collection counts, files and overview rows
+        of `document_ids` in one transaction."""
+        async with conn.transaction():
+            for table in ("documents_entities", "documents_relationships"):
+                await conn.execute(
+                    f"""
+                    DELETE FROM {self._get_table_name(table)}
+                    WHERE parent_id = ANY($1::uuid[])
+                    """,
+                    document_ids,
+                )
+            await conn.execute(
+                f"""
+                UPDATE {self._get_table_name("collections")} c
+                SET document_count = c.document_count - counts.documents
+                FROM (
+                    SELECT collection_id, COUNT(*) AS documents
+                    FROM {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)},
+                        unnest(collection_ids) AS collection_id
+                    WHERE id = ANY($1::uuid[])
+                    GROUP BY collection_id
+                ) counts
+                WHERE c.id = counts.collection_id
+                """,
+                document_ids,
+            )
+            await conn.execute(
+                f"""
+                WITH deleted AS (
+                    DELETE FROM {self._get_table_name("files")}
+                    WHERE document_id = ANY($1::uuid[])
+                    RETURNING oid
+                )
+                SELECT COUNT(lo_unlink(oid)) FROM deleted
+                """,
+                document_ids,
+            )
+            return [
+                row["id"]
+                for row in await conn.fetch(
+                    f"""
+                    DELETE FROM {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)}
+                    WHERE id = ANY($1::uuid[])
+                    RETURNING id
+                    """,
+                    document_ids,
+                )
+            ]
+
     async def _get_status_from_table(
         self,
         ids: list[UUID],
@@ -514,6 +714,8 @@ class PostgresDocumentsHandler(Handler):
         include_summary_embedding: Optional[bool] = True,
         filters: Optional[dict[str, Any]] = None,
         sort_order: str = "DESC",  # Add this parameter with a default of DESC
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
     ) -> dict[str, Any]:
         """Fetch overviews of documents with optional offset/limit pagination.
 
@@ -523,6 +725,11 @@ class PostgresDocumentsHandler(Handler):
 
         If both the `filters` dict and any of the traditional filter arguments are provided,
         this method will raise an error.
+
+        Documents are ordered by `(created_at, id)`. Passing the `next_cursor`
+        of a page as `cursor` returns the page after it, which stays as fast
+        as the first however deep it is. With `exact_total` off,
+        `total_entries` may be an estimate.
         """
 
         filters = copy.deepcopy(filters)
@@ -592,14 +799,23 @@ class PostgresDocumentsHandler(Handler):
         # -------------------------
         # Build the full query
         # -------------------------
-        base_query = (
-            f"FROM {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)}"
-        )
+        table_name = self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)
+        count_query = f"SELECT COUNT(*) FROM {table_name}"
+        if conditions:
+            count_query += " WHERE " + " AND ".join(conditions)
+        count_params = list(params)
+        count_table = None if conditions else table_name
+
+        keyset = Keyset(CREATED_AT_ID, descending=sort_order.upper() == "DESC")
+        if cursor:
+            conditions.append(keyset.condition(cursor, params))
+            param_index = len(params) + 1
+
+        base_query = f"FROM {table_name}"
         if conditions:
             # Combine everything with AND
             base_query += " WHERE " + " AND ".join(conditions)
 
-        # Construct SELECT fields (including total_entries via window function)
         select_fields = """
             SELECT
                 id,
@@ -616,14 +832,13 @@ class PostgresDocumentsHandler(Handler):
                 updated_at,
                 summary,
                 summary_embedding,
-                total_tokens,
-                COUNT(*) OVER() AS total_entries
+                total_tokens
         """
 
         query = f"""
             {select_fields}
             {base_query}
-            ORDER BY created_at {sort_order}
+            ORDER BY {keyset.order_by()}
             OFFSET ${param_index}
         """
         params.append(offset)
@@ -636,7 +851,14 @@ class PostgresDocumentsHandler(Handler):
 
         try:
             results = await self.connection_manager.fetch_query(query, params)
-            total_entries = results[0]["total_entries"] if results else 0
+            total_entries = total_from_page(results, offset, limit, cursor)
+            if total_entries is None:
+                total_entries = await self.row_counter.count(
+                    count_query,
+                    count_params,
+                    exact=exact_total,
+                    table=count_table,
+                )
 
             documents = []
             for row in results:
@@ -687,7 +909,11 @@ class PostgresDocumentsHandler(Handler):
                         total_tokens=row["total_tokens"],
                     )
                 )
-            return {"results": documents, "total_entries": total_entries}
+            return {
+                "results": documents,
+                "total_entries": total_entries,
+                "next_cursor": keyset.next_cursor(results, limit),
+            }
         except Exception as e:
             logger.error(f"Error in get_documents_overview: {str(e)}")
             raise HTTPException(
@@ -1037,14 +1263,14 @@ class PostgresDocumentsHandler(Handler):
         else:
             return await self.full_text_document_search(query_text, settings)
 
-    async def export_to_csv(
+    async def export(
         self,
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        """Creates a CSV file from the PostgreSQL data and returns the path to
-        the temp file."""
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        """Streams the data as CSV, Parquet or Arrow."""
         valid_columns = {
             "id",
             "collection_ids",
@@ -1120,53 +1346,10 @@ class PostgresDocumentsHandler(Handler):
         if conditions:
             select_stmt = f"{select_stmt} WHERE {' AND '.join(conditions)}"
 
-        select_stmt = f"{select_stmt} ORDER BY created_at DESC"
-
-        temp_file = None
-        try:
-            temp_file = tempfile.NamedTemporaryFile(
-                mode="w", delete=True, suffix=".csv"
-            )
-            writer = csv.writer(temp_file, quoting=csv.QUOTE_ALL)
-
-            async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
-                async with conn.transaction():
-                    cursor = await conn.cursor(select_stmt, *params)
-
-                    if include_header:
-                        writer.writerow(columns)
-
-                    chunk_size = 1000
-                    while True:
-                        rows = await cursor.fetch(chunk_size)
-                        if not rows:
-                            break
-                        for row in rows:
-                            row_dict = {
-                                "id": row[0],
-                                "collection_ids": row[1],
-                                "owner_id": row[2],
-                                "type": row[3],
-                                "metadata": row[4],
-                                "title": row[5],
-                                "summary": row[6],
-                                "version": row[7],
-                                "size_in_bytes": row[8],
-                                "ingestion_status": row[9],
-                                "extraction_status": row[10],
-                                "created_at": row[11],
-                                "updated_at": row[12],
-                                "total_tokens": row[13],
-                            }
-                            writer.writerow([row_dict[col] for col in columns])
-
-            temp_file.flush()
-            return temp_file.name, temp_file
-
-        except Exception as e:
-            if temp_file:
-                temp_file.close()
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to export data: {str(e)}",
-            ) from e
+        return await stream_export(
+            self.connection_manager.pool,  # type: ignore
+            select_columns(select_stmt, columns, "created_at DESC"),
+            params,
+            export_format,
+            include_header,
+        )
@@ -0,0 +1,224 @@
+"""Streams the results of export queries as CSV, Parquet or Arrow."""
+
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Optional
+
+from fastapi import HTTPException
+
+from core.base import R2RException
+from core.base.abstractions import ExportFormat
+
+logger = logging.getLogger()
+
+# Chunks of COPY output buffered between the connection and the response.
+COPY_QUEUE_SIZE = 16
+# Rows per Arrow record batch, and per Parquet row group.
+ARROW_BATCH_SIZE = 10_000
+
+
+def select_columns(select_stmt: str, columns: list[str], order_by: str) -> str:
+    """Narrows an export query to `columns`, in order, with its rows sorted
+    by `order_by`, which may refer to any column of `select_stmt`."""
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    return (
+        f"SELECT {column_list} FROM ({select_stmt}) AS export_rows "
+        f"ORDER BY {order_by}"
+    )
+
+
+async def stream_export(
+    pool,
+    query: str,
+    params: list[Any],
+    export_format: ExportFormat = ExportFormat.CSV,
+    include_header: bool = True,
+) -> AsyncGenerator[bytes, None]:
+    """Returns the output of `query` in `export_format` as an async
+    iterator of chunks.
+
+    CSV is produced by `COPY ... TO STDOUT` and passed on as the server
+    sends it. Parquet and Arrow are built from record batches read with a
+    cursor, encoded off the event loop. The first chunk is read before
+    returning, so that a failing query is reported as an error rather than
+    as a truncated response.
+    """
+    if export_format == ExportFormat.CSV:
+        chunks = _copy_csv(pool, query, params, include_header)
+    else:
+        chunks = _arrow_batches(pool, query, params, export_format)
+
+    try:
+        first = await anext(chunks, b"")
+    except R2RException:
+        raise
+    except Exception as e:
+        await chunks.aclose()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to export data: {str(e)}",
+        ) from e
+
+    async def stream() -> AsyncGenerator[bytes, None]:
+        try:
+            yield first
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    return stream()
+
+
+async def _copy_csv(
+    pool, query: str, params: list[Any], include_header: bool
+) -> AsyncGenerator[bytes, None]:
+    queue: asyncio.Queue[Optional[bytes | Exception]] = asyncio.Queue(
+        maxsize=COPY_QUEUE_SIZE
+    )
+
+    async def copy() -> None:
+        try:
+            async with pool.get_connection() as conn:
+                # The bounded queue pauses COPY while the client catches up.
+                await conn.copy_from_query(
+                    query,
+                    *params,
+                    output=queue.put,
+                    format="csv",
+                    header=include_header,
+                    force_quote=True,
+                )
+            await queue.put(None)
+        except Exception as e:
+            await queue.put(e)
+
+    task = asyncio.create_task(copy())
+    try:
+        while (chunk := await queue.get()) is not None:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        task.cancel()
+
+
+class _ChunkSink:
+    """A write-only file that collects what is written to it."""
+
+    closed = False
+
+    def __init__(self):
+        self.chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _arrow_type(pa, type_name: str):
+    # Postgres names array types after their element type with a leading
+    # underscore, e.g. `_uuid` for `uuid[]`.
+    if type_name.startswith("_"):
+        return pa.list_(_arrow_type(pa, type_name[1:]))
+    if type_name in ("int2", "int4", "int8"):
+        return pa.int64()
+    if type_name in ("float4", "float8"):
+        return pa.float64()
+    if type_name == "bool":
+        return pa.bool_()
+    if type_name == "timestamptz":
+        return pa.timestamp("us", tz="UTC")
+    if type_name == "timestamp":
+        return pa.timestamp("us")
+    # Everything else, including `numeric`, which has no fixed precision
+    # to map to a decimal type, is exported as its text representation.
+    return pa.string()
+
+
+def _to_arrow_values(pa, arrow_type, values: list) -> list:
+    if pa.types.is_list(arrow_type):
+        return [
+            None
+            if v is None
+            else _to_arrow_values(pa, arrow_type.value_type, list(v))
+            for v in values
+        ]
+    if pa.types.is_string(arrow_type):
+        return [None if v is None else str(v) for v in values]
+    if pa.types.is_floating(arrow_type):
+        return [None if v is None else float(v) for v in values]
+    return values
+
+
+def _to_record_batch(pa, schema, rows: list) -> Any:
+    arrays = [
+        pa.array(
+            _to_arrow_values(pa, field.type, [row[i] for row in rows]),
+            type=field.type,
+        )
+        for i, field in enumerate(schema)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _write_rows(pa, writer, schema, rows: list) -> None:
+    writer.write_batch(_to_record_batch(pa, schema, rows))
+
+
+async def _arrow_batches(
+    pool, query: str, params: list[Any], export_format: ExportFormat
+) -> AsyncGenerator[bytes, None]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise R2RException(
+            status_code=400,
+            message=(
+                f"{export_format.value.capitalize()} exports require pyarrow. "
+                "Please install it using `pip install pyarrow`."
+            ),
+        ) from None
+
+    sink = _ChunkSink()
+    writer = None
+    try:
+        async with pool.get_connection() as conn:
+            async with conn.transaction():
+                statement = await conn.prepare(query)
+                schema = pa.schema(
+                    [
+                        (attribute.name, _arrow_type(pa, attribute.type.name))
+                        for attribute in statement.get_attributes()
+                    ]
+                )
+                output = pa.PythonFile(sink, mode="w")
+                writer = (
+                    pq.ParquetWriter(output, schema)
+                    if export_format == ExportFormat.PARQUET
+                    else pa.ipc.new_stream(output, schema)
+                )
+                cursor = await statement.cursor(*params)
+                while rows := await cursor.fetch(ARROW_BATCH_SIZE):
+                    await asyncio.to_thread(
+                        _write_rows, pa, writer, schema, rows
+                    )
+                    if data := sink.drain():
+                        yield data
+
+        writer.close()
+        writer = None
+        if data := sink.drain():
+            yield data
+    finally:
+        if writer is not None:
+            writer.close()
@@ -1,15 +1,17 @@
+import asyncio
+import hashlib
 import io
 import logging
+import tempfile
 from datetime import datetime
-from io import BytesIO
-from typing import BinaryIO, Optional
+from typing import AsyncGenerator, AsyncIterable, BinaryIO, Optional
 from uuid import UUID
-from zipfile import ZipFile
 
 import asyncpg
 from fastapi import HTTPException
 
 from core.base import Handler, R2RException
+from core.utils import ZipStreamWriter
 
 from .base import PostgresConnectionManager
 
@@ -20,9 +22,24 @@ class PostgresFilesHandler(Handler):
     """PostgreSQL implementation of the FileHandler."""
 
     TABLE_NAME = "files"
+    # Files retrieved with `retrieve_file_spooled` are kept in memory up to
+    # this size and spill over to a temporary file beyond it.
+    SPOOL_MAX_MEMORY_BYTES = 32 * 1024 * 1024
+    DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
 
     connection_manager: PostgresConnectionManager
 
+    def __init__(
+        self,
+        project_name: str,
+        connection_manager: PostgresConnectionManager,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        super().__init__(project_name, connection_manager)
+        # Size of each large object read and write. Files no larger than this
+        # are written with a single `lo_from_bytea` call.
+        self.chunk_size = chunk_size
+
     async def create_tables(self) -> None:
         """Create the necessary tables for file storage."""
         query = f"""
@@ -32,10 +49,14 @@ class PostgresFilesHandler(Handler):
             oid OID NOT NULL,
             size BIGINT NOT NULL,
             type TEXT,
+            content_hash TEXT,
             created_at TIMESTAMPTZ DEFAULT NOW(),
             updated_at TIMESTAMPTZ DEFAULT NOW()
         );
 
+        ALTER TABLE {self._get_table_name(PostgresFilesHandler.TABLE_NAME)}
+        ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
         -- Create trigger for updating the updated_at timestamp
         CREATE OR REPLACE FUNCTION {self.project_name}.update_files_updated_at()
         RETURNS TRIGGER AS $$
@@ -62,21 +83,31 @@ class PostgresFilesHandler(Handler):
         file_oid: int,
         file_size: int,
         file_type: Optional[str] = None,
+        content_hash: Optional[str] = None,
     ) -> None:
         """Add or update a file entry in storage."""
         query = f"""
         INSERT INTO {self._get_table_name(PostgresFilesHandler.TABLE_NAME)}
-        (document_id, name, oid, size, type)
-        VALUES ($1, $2, $3, $4, $5)
+        (document_id, name, oid, size, type, content_hash)
+        VALUES ($1, $2, $3, $4, $5, $6)
         ON CONFLICT (document_id) DO UPDATE SET
             name = EXCLUDED.name,
             oid = EXCLUDED.oid,
             size = EXCLUDED.size,
             type = EXCLUDED.type,
+            content_hash = EXCLUDED.content_hash,
             updated_at = NOW();
         """
         await self.connection_manager.execute_query(
-            query, [document_id, file_name, file_oid, file_size, file_type]
+            query,
+            [
+                document_id,
+                file_name,
+                file_oid,
+                file_size,
+                file_type,
+                content_hash,
+            ],
         )
 
     async def store_file(
@@ -88,16 +119,101 @@ class PostgresFilesHandler(Handler):
     ) -> None:
         """Store a new file in the database."""
         size = file_content.getbuffer().nbytes
+        content_hash = hashlib.sha256(file_content.getbuffer()).hexdigest()
+
+        async with (
+            self.connection_manager.pool.get_connection() as conn  # type: ignore
+        ):
+            async with conn.transaction():
+                if size <= self.chunk_size:
+                    oid = await self._create_lobject_from_bytes(
+                        conn, file_content.read()
+                    )
+                else:
+                    oid = await conn.fetchval("SELECT lo_create(0)")
+                    await self._write_lobject(conn, oid, file_content)
+                await self.upsert_file(
+                    document_id, file_name, oid, size, file_type, content_hash
+                )
+
+    async def store_file_stream(
+        self,
+        document_id: UUID,
+        file_name: str,
+        chunks: AsyncIterable[bytes],
+        file_type: Optional[str] = None,
+        max_size: Optional[int] = None,
+    ) -> tuple[int, str]:
+        """Store a file read from `chunks`, returning its size and SHA-256
+        hex digest.
+
+        Content is written to the large object `chunk_size` bytes at a time
+        as it arrives and hashed alongside, so memory use does not grow with
+        the file. Files no larger than `chunk_size` are still written with a
+        single `lo_from_bytea` call. A file larger than `max_size` bytes is
+        rejected with a 413 as soon as the limit is crossed, and the partial
+        large object is rolled back.
+        """
+        digest = hashlib.sha256()
+        buffer = bytearray()
+        size = 0
 
         async with (
             self.connection_manager.pool.get_connection() as conn  # type: ignore
         ):
             async with conn.transaction():
-                oid = await conn.fetchval("SELECT lo_create(0)")
-                await self._write_lobject(conn, oid, file_content)
+                lobject: Optional[int] = None
+                oid: Optional[int] = None
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise R2RException(
+                            status_code=413,
+                            message=f"File size exceeds maximum of {max_size} bytes.",
+                        )
+                    buffer += chunk
+                    if len(buffer) < self.chunk_size:
+                        continue
+                    if oid is None:
+                        oid = await conn.fetchval("SELECT lo_create(0)")
+                        lobject = await conn.fetchval(
+                            "SELECT lo_open($1, $2)", oid, 0x20000
+                        )
+                    # Hash in a thread while the chunk is written.
+                    data = bytes(buffer)
+                    buffer.clear()
+                    await asyncio.gather(
+                        asyncio.to_thread(digest.update, data),
+                        conn.execute("SELECT lowrite($1, $2)", lobject, data),
+                    )
+
+                digest.update(buffer)
+                if oid is None:
+                    oid = await self._create_lobject_from_bytes(
+                        conn, bytes(buffer)
+                    )
+                else:
+                    if buffer:
+                        await conn.execute(
+                            "SELECT lowrite($1, $2)", lobject, bytes(buffer)
+                        )
+                    await conn.execute("SELECT lo_close($1)", lobject)
+
+                content_hash = digest.hexdigest()
                 await self.upsert_file(
-                    document_id, file_name, oid, size, file_type
+                    document_id, file_name, oid, size, file_type, content_hash
                 )
+        return size, content_hash
+
+    async def _create_lobject_from_bytes(self, conn, content: bytes) -> int:
+        """Create a large object holding `content` in one round trip."""
+        try:
+            return await conn.fetchval("SELECT lo_from_bytea(0, $1)", content)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to write to large object: {e}",
+            ) from e
 
     async def _write_lobject(
         self, conn, oid: int, file_content: io.BytesIO
@@ -106,9 +222,8 @@ class PostgresFilesHandler(Handler):
         lobject = await conn.fetchval("SELECT lo_open($1, $2)", oid, 0x20000)
 
         try:
-            chunk_size = 8192  # 8 KB chunks
             while True:
-                if chunk := file_content.read(chunk_size):
+                if chunk := file_content.read(self.chunk_size):
                     await conn.execute(
                         "SELECT lowrite($1, $2)", lobject, chunk
                     )
@@ -124,10 +239,7 @@ class PostgresFilesHandler(Handler):
                 detail=f"Failed to write to large object: {e}",
             ) from e
 
-    async def retrieve_file(
-        self, document_id: UUID
-    ) -> Optional[tuple[str, BinaryIO, int]]:
-        """Retrieve a file from storage."""
+    async def _get_file_record(self, document_id: UUID):
         query = f"""
         SELECT name, oid, size
         FROM {self._get_table_name(PostgresFilesHandler.TABLE_NAME)}
@@ -142,7 +254,13 @@ class PostgresFilesHandler(Handler):
                 status_code=404,
                 message=f"File for document {document_id} not found",
             )
+        return result
 
+    async def retrieve_file(
+        self, document_id: UUID
+    ) -> Optional[tuple[str, BinaryIO, int]]:
+        """Retrieve a file from storage."""
+        result = await self._get_file_record(document_id)
         file_name, oid, size = (
             result["name"],
             result["oid"],
@@ -153,16 +271,83 @@ class PostgresFilesHandler(Handler):
             file_content = await self._read_lobject(conn, oid)
             return file_name, io.BytesIO(file_content), size
 
-    async def retrieve_files_as_zip(
+    async def stream_file(
+        self, document_id: UUID
+    ) -> tuple[str, AsyncGenerator[bytes, None], int]:
+        """Retrieve a file as an async iterator over its content.
+
+        Each chunk is fetched with `lo_get` on a briefly held pooled
+        connection, so a slow consumer does not pin a connection or keep a
+        transaction open for the whole download.
+        """
+        result = await self._get_file_record(document_id)
+        oid, size = result["oid"], result["size"]
+
+        lo_exists = await self.connection_manager.fetchrow_query(
+            "SELECT 1 FROM pg_catalog.pg_largeobject_metadata WHERE oid = $1",
+            [oid],
+        )
+        if not lo_exists:
+            raise R2RException(
+                status_code=404,
+                message=f"Large object {oid} not found.",
+            )
+
+        return result["name"], self._get_lobject_chunks(oid, size), size
+
+    async def _get_lobject_chunks(
+        self, oid: int, size: int
+    ) -> AsyncGenerator[bytes, None]:
+        """Read a large object with `lo_get`, one pooled query per chunk."""
+        for offset in range(0, size, self.chunk_size):
+            row = await self.connection_manager.fetchrow_query(
+                "SELECT lo_get($1, $2, $3) AS data",
+                [oid, offset, self.chunk_size],
+            )
+            if not row or not row["data"]:
+                break
+            yield row["data"]
+
+    async def retrieve_file_spooled(
+        self, document_id: UUID
+    ) -> tuple[str, BinaryIO, int]:
+        """Retrieve a file into a spooled temporary file.
+
+        The large object is read chunk by chunk, so only one copy of the file
+        is held, and files larger than `SPOOL_MAX_MEMORY_BYTES` are kept on
+        disk rather than in memory. The caller should close the returned file.
+        """
+        result = await self._get_file_record(document_id)
+        spool = tempfile.SpooledTemporaryFile(
+            max_size=self.SPOOL_MAX_MEMORY_BYTES
+        )
+        try:
+            async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+                async for chunk in self._iter_lobject(conn, result["oid"]):
+                    # The spool rolls over to disk, so write off the loop.
+                    await asyncio.to_thread(spool.write, chunk)
+        except BaseException:
+            spool.close()
+            raise
+
+        spool.seek(0)
+        return result["name"], spool, result["size"]  # type: ignore
+
+    async def stream_files_as_zip(
         self,
         document_ids: Optional[list[UUID]] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> tuple[str, BinaryIO, int]:
-        """Retrieve multiple files and return them as a zip file."""
+    ) -> tuple[str, AsyncGenerator[bytes, None]]:
+        """Stream multiple files as a zip archive.
+
+        Each file is read chunk by chunk with `lo_get` and written as a
+        stored zip entry as it is read, so memory use does not depend on the
+        size of the export and the first bytes are available immediately.
+        """
 
         query = f"""
-        SELECT document_id, name, oid, size
+        SELECT document_id, name, oid, size, created_at
         FROM {self._get_table_name(PostgresFilesHandler.TABLE_NAME)}
         WHERE 1=1
         """
@@ -190,31 +375,39 @@ class PostgresFilesHandler(Handler):
                 message="No files found matching the specified criteria",
             )
 
-        zip_buffer = BytesIO()
-        total_size = 0
-
-        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
-            with ZipFile(zip_buffer, "w") as zip_file:
-                for record in results:
-                    file_content = await self._read_lobject(
-                        conn, record["oid"]
-                    )
-
-                    zip_file.writestr(record["name"], file_content)
-                    total_size += record["size"]
+        async def chunks() -> AsyncGenerator[bytes, None]:
+            writer = ZipStreamWriter()
+            for record in results:
+                yield writer.start_entry(
+                    record["name"], record["size"], record["created_at"]
+                )
+                async for chunk in self._get_lobject_chunks(
+                    record["oid"], record["size"]
+                ):
+                    yield writer.write(chunk)
+                yield writer.end_entry()
+            yield writer.close()
 
-        zip_buffer.seek(0)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         zip_filename = f"files_export_{timestamp}.zip"
 
-        return zip_filename, zip_buffer, zip_buffer.getbuffer().nbytes
+        return zip_filename, chunks()
 
     async def _read_lobject(self, conn, oid: int) -> bytes:
         """Read content from a large object."""
         file_data = io.BytesIO()
-        chunk_size = 8192
+        async for chunk in self._iter_lobject(conn, oid):
+            file_data.write(chunk)
+        return file_data.getvalue()
+
+    async def _iter_lobject(
+        self, conn, oid: int, chunk_size: Optional[int] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """Read a large object chunk by chunk."""
+        chunk_size = chunk_size or self.chunk_size
 
         async with conn.transaction():
+            lobject = None
             try:
                 lo_exists = await conn.fetchval(
                     "SELECT EXISTS(SELECT 1 FROM pg_catalog.pg_largeobject_metadata WHERE oid = $1);",
@@ -242,16 +435,15 @@ class PostgresFilesHandler(Handler):
                     )
                     if not chunk:
                         break
-                    file_data.write(chunk)
+                    yield chunk
             except asyncpg.exceptions.UndefinedObjectError:
                 raise R2RException(
                     status_code=404,
                     message=f"Failed to read large object {oid}",
                 ) from None
             finally:
-                await conn.execute("SELECT lo_close($1)", lobject)
-
-        return file_data.getvalue()
+                if lobject is not None:
+                    await conn.execute("SELECT lo_close($1)", lobject)
 
     async def delete_file(self, document_id: UUID) -> bool:
         """Delete a file from storage."""
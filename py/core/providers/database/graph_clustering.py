@@ -0,0 +1,158 @@
+"""Runs hierarchical Leiden clustering in a local worker process."""
+
+import asyncio
+import multiprocessing
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+from core.base.abstractions import Relationship
+
+# The defaults of the clustering service, so that both backends produce the
+# same communities for the same parameters.
+LEIDEN_DEFAULTS: dict[str, Any] = {
+    "resolution": 1.0,
+    "randomness": 0.001,
+    "max_cluster_size": 1000,
+    "extra_forced_iterations": 0,
+    "use_modularity": True,
+    "random_seed": 7272,
+    "weight_attribute": "weight",
+}
+
+
+class EdgeList:
+    """Relationships as integer node ids, with the names the ids stand for.
+
+    Only the subject, object and weight of each relationship are kept, which
+    is all that clustering needs.
+    """
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self._node_ids: dict[str, int] = {}
+        self._sources = array("i")
+        self._targets = array("i")
+        self._weights = array("d")
+
+    @classmethod
+    def from_relationships(
+        cls, relationships: Iterable[Relationship]
+    ) -> "EdgeList":
+        edges = cls()
+        for relationship in relationships:
+            edges.add(
+                relationship.subject, relationship.object, relationship.weight
+            )
+        return edges
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def _node_id(self, name: str) -> int:
+        node_id = self._node_ids.get(name)
+        if node_id is None:
+            node_id = self._node_ids[name] = len(self.names)
+            self.names.append(name)
+        return node_id
+
+    def add(self, subject: str, object: str, weight: Optional[float]) -> None:
+        self._sources.append(self._node_id(subject))
+        self._targets.append(self._node_id(object))
+        self._weights.append(1.0 if weight is None else weight)
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the sources, targets and weights of the edges."""
+        return (
+            np.array(self._sources, dtype=np.intc),
+            np.array(self._targets, dtype=np.intc),
+            np.array(self._weights, dtype=np.float64),
+        )
+
+
+def _hierarchical_leiden(
+    sources: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+    leiden_params: dict[str, Any],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Clusters an edge list in a worker process, returning the node id,
+    cluster and level of every assignment."""
+    try:
+        import networkx as nx
+        from graspologic.partition import hierarchical_leiden
+    except ImportError:
+        raise ImportError(
+            "Local graph clustering requires graspologic. "
+            "Please install it using `pip install graspologic`."
+        ) from None
+
+    graph = nx.Graph()
+    graph.add_weighted_edges_from(
+        zip(sources.tolist(), targets.tolist(), weights.tolist(), strict=True)
+    )
+    communities = hierarchical_leiden(graph, **leiden_params)
+
+    count = len(communities)
+    return (
+        np.fromiter((c.node for c in communities), np.intc, count),
+        np.fromiter((c.cluster for c in communities), np.intc, count),
+        np.fromiter((c.level for c in communities), np.intc, count),
+    )
+
+
+class GraphClusteringPool:
+    """Clusters graphs with graspologic's `hierarchical_leiden` in worker
+    processes, so that clustering never blocks the event loop.
+
+    Graphs are sent to the workers as integer edge arrays rather than as
+    relationships, and assignments come back the same way. Workers are
+    started with `spawn` on first use, because forking a process that runs
+    an event loop and threads is unsafe.
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def cluster(
+        self, edges: EdgeList, leiden_params: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Returns the community assignments of `edges`, in the format of
+        the clustering service."""
+        params = {
+            key: leiden_params.get(key, default)
+            for key, default in LEIDEN_DEFAULTS.items()
+        }
+        (
+            nodes,
+            clusters,
+            levels,
+        ) = await asyncio.get_running_loop().run_in_executor(
+            self._get_executor(),
+            _hierarchical_leiden,
+            *edges.arrays(),
+            params,
+        )
+        names = edges.names
+        return [
+            {"node": names[node], "cluster": cluster, "level": level}
+            for node, cluster, level in zip(
+                nodes.tolist(), clusters.tolist(), levels.tolist(), strict=True
+            )
+        ]
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -1,14 +1,12 @@
 import asyncio
 import contextlib
-import csv
 import datetime
 import json
 import logging
 import os
-import tempfile
 import time
-from typing import IO, Any, AsyncGenerator, Optional, Tuple
-from uuid import UUID
+from typing import Any, AsyncGenerator, Optional, Tuple
+from uuid import UUID, uuid4
 
 import asyncpg
 import httpx
@@ -16,8 +14,10 @@ from asyncpg.exceptions import UniqueViolationError
 from fastapi import HTTPException
 
 from core.base.abstractions import (
+    ChunkSearchSettings,
     Community,
     Entity,
+    ExportFormat,
     Graph,
     GraphExtractionStatus,
     R2RException,
@@ -32,8 +32,11 @@ from core.base.utils import (
     generate_entity_document_id,
 )
 
-from .base import PostgresConnectionManager
+from .base import PostgresConnectionManager, vector_search_settings
 from .collections import PostgresCollectionsHandler
+from .export import select_columns, stream_export
+from .graph_clustering import EdgeList, GraphClusteringPool
+from .pagination import CREATED_AT_ID, Keyset, RowCounter, total_from_page
 
 logger = logging.getLogger()
 
@@ -163,6 +166,72 @@ class PostgresEntitiesHandler(Handler):
             metadata=result["metadata"],
         )
 
+    async def create_many(
+        self, entities: list[Entity], store_type: StoreType
+    ) -> list[Entity]:
+        """Create entities in the specified store in one transaction.
+
+        Ids are assigned before inserting, so the rows are sent as a single
+        pipelined batch rather than one round trip per entity. Returns the
+        entities with their ids set, in the order given.
+        """
+        table_name = self._get_entity_table_for_store(store_type)
+        query = f"""
+            INSERT INTO {self._get_table_name(table_name)}
+            (id, name, category, description, parent_id, description_embedding, chunk_ids, metadata)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+        """
+
+        created = [
+            entity.model_copy(update={"id": entity.id or uuid4()})
+            for entity in entities
+        ]
+        params = [
+            (
+                entity.id,
+                entity.name,
+                entity.category,
+                entity.description,
+                entity.parent_id,
+                _embedding_param(entity.description_embedding),
+                entity.chunk_ids,
+                _metadata_param(entity.metadata),
+            )
+            for entity in created
+        ]
+        if params:
+            await self.connection_manager.execute_many(query, params)
+        return created
+
+    async def update_descriptions(
+        self,
+        parent_id: UUID,
+        store_type: StoreType,
+        entities: list[Entity],
+    ) -> None:
+        """Set the description and description embedding of the entities
+        under `parent_id` that share a name with one of `entities` and have
+        no description yet, in one transaction."""
+        table_name = self._get_entity_table_for_store(store_type)
+        query = f"""
+            UPDATE {self._get_table_name(table_name)}
+            SET description = $3, description_embedding = $4, updated_at = NOW()
+            WHERE parent_id = $1 AND name = $2
+                AND (description IS NULL OR description = '')
+        """
+
+        params = [
+            (
+                parent_id,
+                entity.name,
+                entity.description,
+                _embedding_param(entity.description_embedding),
+            )
+            for entity in entities
+        ]
+        if params:
+            await self.connection_manager.execute_many(query, params)
+
     async def get(
         self,
         parent_id: UUID,
@@ -560,16 +629,16 @@ class PostgresEntitiesHandler(Handler):
             metadata=merged_metadata or None,
         )
 
-    async def export_to_csv(
+    async def export(
         self,
         parent_id: UUID,
         store_type: StoreType,
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        """Creates a CSV file from the PostgreSQL data and returns the path to
-        the temp file."""
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        """Streams the data as CSV, Parquet or Arrow."""
         valid_columns = {
             "id",
             "name",
@@ -633,51 +702,13 @@ class PostgresEntitiesHandler(Handler):
         if conditions:
             select_stmt = f"{select_stmt} WHERE {' AND '.join(conditions)}"
 
-        select_stmt = f"{select_stmt} ORDER BY created_at DESC"
-
-        temp_file = None
-        try:
-            temp_file = tempfile.NamedTemporaryFile(
-                mode="w", delete=True, suffix=".csv"
-            )
-            writer = csv.writer(temp_file, quoting=csv.QUOTE_ALL)
-
-            async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
-                async with conn.transaction():
-                    cursor = await conn.cursor(select_stmt, *params)
-
-                    if include_header:
-                        writer.writerow(columns)
-
-                    chunk_size = 1000
-                    while True:
-                        rows = await cursor.fetch(chunk_size)
-                        if not rows:
-                            break
-                        for row in rows:
-                            row_dict = {
-                                "id": row[0],
-                                "name": row[1],
-                                "category": row[2],
-                                "description": row[3],
-                                "parent_id": row[4],
-                                "chunk_ids": row[5],
-                                "metadata": row[6],
-                                "created_at": row[7],
-                                "updated_at": row[8],
-                            }
-                            writer.writerow([row_dict[col] for col in columns])
-
-            temp_file.flush()
-            return temp_file.name, temp_file
-
-        except Exception as e:
-            if temp_file:
-                temp_file.close()
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to export data: {str(e)}",
-            ) from e
+        return await stream_export(
+            self.connection_manager.pool,
+            select_columns(select_stmt, columns, "created_at DESC"),
+            params,
+            export_format,
+            include_header,
+        )
 
 
 class PostgresRelationshipsHandler(Handler):
@@ -752,6 +783,8 @@ class PostgresRelationshipsHandler(Handler):
                     ON {self._get_table_name(table_name)} (predicate);
                 CREATE INDEX IF NOT EXISTS {table_name}_parent_id_idx
                     ON {self._get_table_name(table_name)} (parent_id);
+                CREATE INDEX IF NOT EXISTS {table_name}_parent_id_id_idx
+                    ON {self._get_table_name(table_name)} (parent_id, id);
                 CREATE INDEX IF NOT EXISTS {table_name}_subject_id_idx
                     ON {self._get_table_name(table_name)} (subject_id);
                 CREATE INDEX IF NOT EXISTS {table_name}_object_id_idx
@@ -825,6 +858,78 @@ class PostgresRelationshipsHandler(Handler):
             metadata=result["metadata"],
         )
 
+    async def create_many(
+        self, relationships: list[Relationship], store_type: StoreType
+    ) -> list[Relationship]:
+        """Create relationships in the specified store in one transaction,
+        sent as a single pipelined batch. Returns the relationships with
+        their ids set, in the order given."""
+        table_name = self._get_relationship_table_for_store(store_type)
+        query = f"""
+            INSERT INTO {self._get_table_name(table_name)}
+            (id, subject, predicate, object, description, subject_id, object_id,
+             weight, chunk_ids, parent_id, description_embedding, metadata)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+        """
+
+        created = [
+            relationship.model_copy(update={"id": relationship.id or uuid4()})
+            for relationship in relationships
+        ]
+        params = [
+            (
+                relationship.id,
+                relationship.subject,
+                relationship.predicate,
+                relationship.object,
+                relationship.description,
+                relationship.subject_id,
+                relationship.object_id,
+                relationship.weight,
+                relationship.chunk_ids,
+                relationship.parent_id,
+                _embedding_param(relationship.description_embedding),
+                _metadata_param(relationship.metadata),
+            )
+            for relationship in created
+        ]
+        if params:
+            await self.connection_manager.execute_many(query, params)
+        return created
+
+    async def get_edge_list(
+        self,
+        parent_id: UUID,
+        store_type: StoreType,
+        page_size: int = 10_000,
+    ) -> EdgeList:
+        """Load the subject, object and weight of every relationship of a
+        parent into an `EdgeList`.
+
+        Pages are read in id order, each starting after the last id of the
+        one before, so that every page is an index range scan however far
+        into the relationships it is.
+        """
+        table_name = self._get_relationship_table_for_store(store_type)
+        QUERY = f"""
+            SELECT id, subject, object, weight
+            FROM {self._get_table_name(table_name)}
+            WHERE parent_id = $1 AND id > $2
+            ORDER BY id
+            LIMIT $3
+        """
+        edges = EdgeList()
+        last_id = UUID(int=0)
+        while True:
+            rows = await self.connection_manager.fetch_query(
+                QUERY, [parent_id, last_id, page_size]
+            )
+            for row in rows:
+                edges.add(row["subject"], row["object"], row["weight"])
+            if len(rows) < page_size:
+                return edges
+            last_id = rows[-1]["id"]
+
     async def get(
         self,
         parent_id: UUID,
@@ -1078,16 +1183,16 @@ class PostgresRelationshipsHandler(Handler):
                     404,
                 )
 
-    async def export_to_csv(
+    async def export(
         self,
         parent_id: UUID,
         store_type: StoreType,
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        """Creates a CSV file from the PostgreSQL data and returns the path to
-        the temp file."""
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        """Streams the data as CSV, Parquet or Arrow."""
         valid_columns = {
             "id",
             "subject",
@@ -1159,40 +1264,13 @@ class PostgresRelationshipsHandler(Handler):
         if conditions:
             select_stmt = f"{select_stmt} WHERE {' AND '.join(conditions)}"
 
-        select_stmt = f"{select_stmt} ORDER BY created_at DESC"
-
-        temp_file = None
-        try:
-            temp_file = tempfile.NamedTemporaryFile(
-                mode="w", delete=True, suffix=".csv"
-            )
-            writer = csv.writer(temp_file, quoting=csv.QUOTE_ALL)
-
-            async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
-                async with conn.transaction():
-                    cursor = await conn.cursor(select_stmt, *params)
-
-                    if include_header:
-                        writer.writerow(columns)
-
-                    chunk_size = 1000
-                    while True:
-                        rows = await cursor.fetch(chunk_size)
-                        if not rows:
-                            break
-                        for row in rows:
-                            writer.writerow(row)
-
-            temp_file.flush()
-            return temp_file.name, temp_file
-
-        except Exception as e:
-            if temp_file:
-                temp_file.close()
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to export data: {str(e)}",
-            ) from e
+        return await stream_export(
+            self.connection_manager.pool,
+            select_columns(select_stmt, columns, "created_at DESC"),
+            params,
+            export_format,
+            include_header,
+        )
 
 
 class PostgresCommunitiesHandler(Handler):
@@ -1483,16 +1561,16 @@ class PostgresCommunitiesHandler(Handler):
 
         return communities, count
 
-    async def export_to_csv(
+    async def export(
         self,
         parent_id: UUID,
         store_type: StoreType,
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        """Creates a CSV file from the PostgreSQL data and returns the path to
-        the temp file."""
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        """Streams the data as CSV, Parquet or Arrow."""
         valid_columns = {
             "id",
             "collection_id",
@@ -1564,40 +1642,13 @@ class PostgresCommunitiesHandler(Handler):
         if conditions:
             select_stmt = f"{select_stmt} WHERE {' AND '.join(conditions)}"
 
-        select_stmt = f"{select_stmt} ORDER BY created_at DESC"
-
-        temp_file = None
-        try:
-            temp_file = tempfile.NamedTemporaryFile(
-                mode="w", delete=True, suffix=".csv"
-            )
-            writer = csv.writer(temp_file, quoting=csv.QUOTE_ALL)
-
-            async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
-                async with conn.transaction():
-                    cursor = await conn.cursor(select_stmt, *params)
-
-                    if include_header:
-                        writer.writerow(columns)
-
-                    chunk_size = 1000
-                    while True:
-                        rows = await cursor.fetch(chunk_size)
-                        if not rows:
-                            break
-                        for row in rows:
-                            writer.writerow(row)
-
-            temp_file.flush()
-            return temp_file.name, temp_file
-
-        except Exception as e:
-            if temp_file:
-                temp_file.close()
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to export data: {str(e)}",
-            ) from e
+        return await stream_export(
+            self.connection_manager.pool,
+            select_columns(select_stmt, columns, "created_at DESC"),
+            params,
+            export_format,
+            include_header,
+        )
 
 
 class PostgresGraphsHandler(Handler):
@@ -1621,6 +1672,15 @@ class PostgresGraphsHandler(Handler):
         self.collections_handler: PostgresCollectionsHandler = kwargs.get(
             "collections_handler"
         )  # type: ignore
+        self.clustering_backend: str = kwargs.get(
+            "clustering_backend", "service"
+        )
+        self.clustering_pool: Optional[GraphClusteringPool] = (
+            GraphClusteringPool()
+            if self.clustering_backend == "local"
+            else None
+        )
+        self.row_counter = RowCounter(self.connection_manager)
 
         self.entities = PostgresEntitiesHandler(*args, **kwargs)
         self.relationships = PostgresRelationshipsHandler(*args, **kwargs)
@@ -1649,6 +1709,12 @@ class PostgresGraphsHandler(Handler):
 
             CREATE INDEX IF NOT EXISTS graph_collection_id_idx
                 ON {self._get_table_name("graphs")} (collection_id);
+
+            CREATE INDEX IF NOT EXISTS graph_created_at_id_idx
+                ON {self._get_table_name("graphs")} (created_at, id);
+
+            CREATE INDEX IF NOT EXISTS graph_collection_id_created_at_id_idx
+                ON {self._get_table_name("graphs")} (collection_id, created_at, id);
         """
 
         await self.connection_manager.execute_query(QUERY)
@@ -1731,42 +1797,73 @@ class PostgresGraphsHandler(Handler):
         # filter_user_ids: Optional[list[UUID]] = None,
         filter_graph_ids: Optional[list[UUID]] = None,
         filter_collection_id: Optional[UUID] = None,
-    ) -> dict[str, list[GraphResponse] | int]:
-        conditions = []
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
+    ) -> dict[str, Any]:
+        """List the latest graph of each collection, ordered by
+        `(created_at, id)`, newest first.
+
+        Passing the `next_cursor` of a page as `cursor` returns the page
+        after it. With `exact_total` off, `total_entries` may be an
+        estimate.
+        """
+        # Filters are rendered once per alias, as the check for a newer
+        # graph in the same collection must see the same set of graphs.
+        filters: list[str] = []
         params: list[Any] = []
-        param_index = 1
 
         if filter_graph_ids:
-            conditions.append(f"id = ANY(${param_index})")
             params.append(filter_graph_ids)
-            param_index += 1
+            filters.append(f"{{alias}}id = ANY(${len(params)})")
 
         # if filter_user_ids:
-        #     conditions.append(f"user_id = ANY(${param_index})")
         #     params.append(filter_user_ids)
-        #     param_index += 1
+        #     filters.append(f"{{alias}}user_id = ANY(${len(params)})")
 
         if filter_collection_id:
-            conditions.append(f"collection_id = ${param_index}")
             params.append(filter_collection_id)
-            param_index += 1
+            filters.append(f"{{alias}}collection_id = ${len(params)}")
 
-        where_clause = (
-            f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        )
+        def render(alias: str) -> list[str]:
+            return [f.format(alias=alias) for f in filters]
+
+        table_name = self._get_table_name(PostgresGraphsHandler.TABLE_NAME)
+        where_clause = f"WHERE {' AND '.join(render(''))}" if filters else ""
+        count_query = f"""
+            SELECT COUNT(DISTINCT collection_id) FROM {table_name}
+            {where_clause}
+        """
+        count_params = list(params)
+
+        # The latest graph of a collection is one with no later
+        # `(created_at, id)` in the same collection. Unlike a ROW_NUMBER()
+        # window over the whole table, this lets the cursor condition seek
+        # the `(created_at, id)` index, with each candidate checked against
+        # the `(collection_id, created_at, id)` index.
+        newer_conditions = [
+            "newer.collection_id = g.collection_id",
+            "(newer.created_at, newer.id) > (g.created_at, g.id)",
+            *render("newer."),
+        ]
+        keyset = Keyset(CREATED_AT_ID, alias="g")
+        page_conditions = [
+            f"""NOT EXISTS (
+                SELECT 1 FROM {table_name} AS newer
+                WHERE {" AND ".join(newer_conditions)}
+            )""",
+            *render("g."),
+        ]
+        if cursor:
+            page_conditions.append(keyset.condition(cursor, params))
+        param_index = len(params) + 1
 
         query = f"""
-            WITH RankedGraphs AS (
-                SELECT
-                    id, collection_id, name, description, status, created_at, updated_at, document_ids,
-                    COUNT(*) OVER() as total_entries,
-                    ROW_NUMBER() OVER (PARTITION BY collection_id ORDER BY created_at DESC) as rn
-                FROM {self._get_table_name(PostgresGraphsHandler.TABLE_NAME)}
-                {where_clause}
-            )
-            SELECT * FROM RankedGraphs
-            WHERE rn = 1
-            ORDER BY created_at DESC
+            SELECT
+                g.id, g.collection_id, g.name, g.description, g.status,
+                g.created_at, g.updated_at, g.document_ids
+            FROM {table_name} AS g
+            WHERE {" AND ".join(page_conditions)}
+            ORDER BY {keyset.order_by()}
             OFFSET ${param_index} LIMIT ${param_index + 1}
         """
 
@@ -1774,10 +1871,14 @@ class PostgresGraphsHandler(Handler):
 
         try:
             results = await self.connection_manager.fetch_query(query, params)
-            if not results:
-                return {"results": [], "total_entries": 0}
 
-            total_entries = results[0]["total_entries"] if results else 0
+            total_entries = total_from_page(results, offset, limit, cursor)
+            if total_entries is None:
+                total_entries = await self.row_counter.count(
+                    count_query,
+                    count_params,
+                    exact=exact_total,
+                )
 
             graphs = [
                 GraphResponse(
@@ -1793,7 +1894,11 @@ class PostgresGraphsHandler(Handler):
                 for row in results
             ]
 
-            return {"results": graphs, "total_entries": total_entries}
+            return {
+                "results": graphs,
+                "total_entries": total_entries,
+                "next_cursor": keyset.next_cursor(results, limit),
+            }
         except Exception as e:
             raise HTTPException(
                 status_code=500,
@@ -2335,45 +2440,29 @@ class PostgresGraphsHandler(Handler):
         collection_id: UUID,
         leiden_params: dict[str, Any],
     ) -> Tuple[int, Any]:
-        """Calls the external clustering service to cluster the graph."""
-
-        offset = 0
-        page_size = 1000
-        all_relationships = []
-        while True:
-            relationships, count = await self.relationships.get(
-                parent_id=collection_id,
-                store_type=StoreType.GRAPHS,
-                offset=offset,
-                limit=page_size,
-            )
-
-            if not relationships:
-                break
+        """Clusters the graph with the configured clustering backend."""
 
-            all_relationships.extend(relationships)
-            offset += len(relationships)
-
-            if offset >= count:
-                break
+        edges = await self.relationships.get_edge_list(
+            parent_id=collection_id, store_type=StoreType.GRAPHS
+        )
 
         logger.info(
-            f"Clustering over {len(all_relationships)} relationships for {collection_id} with settings: {leiden_params}"
+            f"Clustering over {len(edges)} relationships for {collection_id} with settings: {leiden_params}"
         )
-        if len(all_relationships) == 0:
+        if len(edges) == 0:
             raise R2RException(
                 message="No relationships found for clustering",
                 status_code=400,
             )
 
-        return await self._cluster_and_add_community_info(
-            relationships=all_relationships,
+        return await self._cluster_edge_list(
+            edges=edges,
             leiden_params=leiden_params,
             collection_id=collection_id,
         )
 
     async def _call_clustering_service(
-        self, relationships: list[Relationship], leiden_params: dict[str, Any]
+        self, edges: EdgeList, leiden_params: dict[str, Any]
     ) -> list[dict]:
         """Calls the external Graspologic clustering service, sending
         relationships and parameters.
@@ -2381,16 +2470,24 @@ class PostgresGraphsHandler(Handler):
         Expects a response with 'communities' field.
         """
         # Convert relationships to a JSON-friendly format
-        rel_data = []
-        for r in relationships:
-            rel_data.append(
-                {
-                    "id": str(r.id),
-                    "subject": r.subject,
-                    "object": r.object,
-                    "weight": r.weight if r.weight is not None else 1.0,
-                }
+        names = edges.names
+        sources, targets, weights = edges.arrays()
+        rel_data = [
+            {
+                "id": str(i),
+                "subject": names[source],
+                "object": names[target],
+                "weight": weight,
+            }
+            for i, (source, target, weight) in enumerate(
+                zip(
+                    sources.tolist(),
+                    targets.tolist(),
+                    weights.tolist(),
+                    strict=True,
+                )
             )
+        ]
 
         endpoint = os.environ.get("CLUSTERING_SERVICE_URL")
         if not endpoint:
@@ -2409,14 +2506,14 @@ class PostgresGraphsHandler(Handler):
 
     async def _create_graph_and_cluster(
         self,
-        relationships: list[Relationship],
+        edges: EdgeList,
         leiden_params: dict[str, Any],
     ) -> Any:
         """Create a graph and cluster it."""
 
-        return await self._call_clustering_service(
-            relationships, leiden_params
-        )
+        if self.clustering_pool is not None:
+            return await self.clustering_pool.cluster(edges, leiden_params)
+        return await self._call_clustering_service(edges, leiden_params)
 
     async def _cluster_and_add_community_info(
         self,
@@ -2424,13 +2521,27 @@ class PostgresGraphsHandler(Handler):
         leiden_params: dict[str, Any],
         collection_id: UUID,
     ) -> Tuple[int, Any]:
-        logger.info(f"Creating graph and clustering for {collection_id}")
+        return await self._cluster_edge_list(
+            edges=EdgeList.from_relationships(relationships),
+            leiden_params=leiden_params,
+            collection_id=collection_id,
+        )
+
+    async def _cluster_edge_list(
+        self,
+        edges: EdgeList,
+        leiden_params: dict[str, Any],
+        collection_id: UUID,
+    ) -> Tuple[int, Any]:
+        logger.info(
+            f"Creating graph and clustering for {collection_id} with the {self.clustering_backend} backend"
+        )
 
         await asyncio.sleep(0.1)
         start_time = time.time()
 
         hierarchical_communities = await self._create_graph_and_cluster(
-            relationships=relationships,
+            edges=edges,
             leiden_params=leiden_params,
         )
 
@@ -2451,6 +2562,10 @@ class PostgresGraphsHandler(Handler):
 
         return num_communities, hierarchical_communities
 
+    def close(self) -> None:
+        if self.clustering_pool is not None:
+            self.clustering_pool.shutdown()
+
     async def get_entity_map(
         self, offset: int, limit: int, document_id: UUID
     ) -> dict[str, dict[str, list[dict[str, Any]]]]:
@@ -2543,6 +2658,7 @@ class PostgresGraphsHandler(Handler):
         limit = kwargs.get("limit", 10)
         use_fulltext_search = kwargs.get("use_fulltext_search", True)
         use_hybrid_search = kwargs.get("use_hybrid_search", True)
+        chunk_settings = kwargs.get("chunk_settings", ChunkSearchSettings())
 
         if use_hybrid_search or use_fulltext_search:
             logger.warning(
@@ -2576,7 +2692,15 @@ class PostgresGraphsHandler(Handler):
         """
 
         results = await self.connection_manager.fetch_query(
-            QUERY, tuple(params)
+            QUERY,
+            tuple(params),
+            settings=vector_search_settings(
+                ef_search=chunk_settings.ef_search,
+                probes=chunk_settings.probes,
+                limit=limit,
+                iterative_scan=chunk_settings.iterative_scan
+                and bool(conditions_clause),
+            ),
         )
 
         for result in results:
@@ -2780,6 +2904,17 @@ class PostgresGraphsHandler(Handler):
         await self.connection_manager.execute_many(query, inputs)  # type: ignore
 
 
+def _embedding_param(embedding: Optional[list[float] | str]) -> Optional[str]:
+    return str(embedding) if isinstance(embedding, list) else embedding
+
+
+def _metadata_param(metadata: Optional[dict[str, Any] | str]) -> Optional[str]:
+    if isinstance(metadata, str):
+        with contextlib.suppress(json.JSONDecodeError):
+            metadata = json.loads(metadata)
+    return json.dumps(metadata) if metadata else None
+
+
 def _json_serialize(obj):
     if isinstance(obj, UUID):
         return str(obj)
@@ -1,6 +1,9 @@
+import asyncio
 import logging
+import time
+from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
 from core.base import Handler
@@ -12,6 +15,83 @@ from .base import PostgresConnectionManager
 logger = logging.getLogger(__name__)
 
 
+class InMemoryRequestCounter:
+    """Sliding-window request counters kept in process memory.
+
+    Timestamps are retained for `retention`, which must exceed the longest
+    window that is queried, and counted per user and per (user, route).
+    Counts are local to the process, so deployments running several workers
+    enforce per-minute limits per worker. A shared store can be substituted
+    by providing an object with the same `record` and `count` methods.
+    """
+
+    def __init__(self, retention: timedelta = timedelta(minutes=2)):
+        self.retention = retention.total_seconds()
+        self._user_requests: defaultdict[UUID, deque[float]] = defaultdict(
+            deque
+        )
+        self._route_requests: defaultdict[tuple[UUID, str], deque[float]] = (
+            defaultdict(deque)
+        )
+        self._last_sweep = time.time()
+
+    def _prune(self, timestamps: deque[float], now: float) -> None:
+        cutoff = now - self.retention
+        while timestamps and timestamps[0] < cutoff:
+            timestamps.popleft()
+
+    def _sweep(self, now: float) -> None:
+        """Prune every window and drop the keys of users that went idle."""
+        self._drop_idle(self._user_requests, now)
+        self._drop_idle(self._route_requests, now)
+        self._last_sweep = now
+
+    def _drop_idle(self, store: dict[Any, deque[float]], now: float) -> None:
+        for key in list(store):
+            self._prune(store[key], now)
+            if not store[key]:
+                del store[key]
+
+    def record(
+        self, user_id: UUID, route: str, timestamp: Optional[float] = None
+    ) -> None:
+        now = time.time() if timestamp is None else timestamp
+        # Windows are otherwise only pruned when their key is touched, so
+        # sweep all keys once per retention period to bound memory.
+        if now - self._last_sweep >= self.retention:
+            self._sweep(now)
+        for timestamps in (
+            self._user_requests[user_id],
+            self._route_requests[(user_id, route)],
+        ):
+            timestamps.append(now)
+            self._prune(timestamps, now)
+
+    def covers(self, since: datetime) -> bool:
+        """Whether counts since `since` can be answered from memory."""
+        return time.time() - since.timestamp() <= self.retention
+
+    def count(
+        self, user_id: UUID, route: Optional[str], since: datetime
+    ) -> int:
+        timestamps = (
+            self._route_requests.get((user_id, route))
+            if route
+            else self._user_requests.get(user_id)
+        )
+        if not timestamps:
+            return 0
+        self._prune(timestamps, time.time())
+        cutoff = since.timestamp()
+        # Timestamps are appended in order, so count from the newest end.
+        count = 0
+        for timestamp in reversed(timestamps):
+            if timestamp < cutoff:
+                break
+            count += 1
+        return count
+
+
 class PostgresLimitsHandler(Handler):
     TABLE_NAME = "request_log"
 
@@ -20,13 +100,33 @@ class PostgresLimitsHandler(Handler):
         project_name: str,
         connection_manager: PostgresConnectionManager,
         config: DatabaseConfig,
+        request_counter: Optional[InMemoryRequestCounter] = None,
     ):
         """
         :param config: The global DatabaseConfig with default rate limits.
+        :param request_counter: Optional per-minute counter store used by the
+            "memory" limits backend. Defaults to an `InMemoryRequestCounter`.
         """
         super().__init__(project_name, connection_manager)
         self.config = config
 
+        self.use_memory_backend = config.limits_backend == "memory"
+        self.request_counter = request_counter or InMemoryRequestCounter()
+        # Rows waiting to be written to `request_log` in the next batch.
+        self._pending_logs: list[tuple[datetime, UUID, str]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        # Monthly totals read from Postgres, plus requests logged since.
+        self._monthly_counts: dict[
+            tuple[UUID, Optional[str]], tuple[float, datetime, int]
+        ] = {}
+        self._monthly_local: defaultdict[tuple[UUID, Optional[str]], int] = (
+            defaultdict(int)
+        )
+        # Keys whose Postgres count is being refreshed, which the sweep must
+        # not drop from `_monthly_local`.
+        self._monthly_refreshing: set[tuple[UUID, Optional[str]]] = set()
+        self._last_monthly_sweep = time.monotonic()
+
         logger.debug(
             f"Initialized PostgresLimitsHandler with project: {project_name}"
         )
@@ -38,6 +138,10 @@ class PostgresLimitsHandler(Handler):
             user_id UUID NOT NULL,
             route TEXT NOT NULL
         );
+        CREATE INDEX IF NOT EXISTS idx_request_log_user_time
+        ON {self._get_table_name(PostgresLimitsHandler.TABLE_NAME)} (user_id, time);
+        CREATE INDEX IF NOT EXISTS idx_request_log_user_route_time
+        ON {self._get_table_name(PostgresLimitsHandler.TABLE_NAME)} (user_id, route, time);
         """
         logger.debug("Creating request_log table if not exists")
         await self.connection_manager.execute_query(query)
@@ -50,6 +154,9 @@ class PostgresLimitsHandler(Handler):
     ) -> int:
         """Count how many requests a user (optionally for a specific route) has
         made since the given datetime."""
+        if self.use_memory_backend and self.request_counter.covers(since):
+            return self.request_counter.count(user_id, route, since)
+
         if route:
             query = f"""
             SELECT COUNT(*)::int
@@ -89,9 +196,57 @@ class PostgresLimitsHandler(Handler):
         start_of_month = now.replace(
             day=1, hour=0, minute=0, second=0, microsecond=0
         )
-        return await self._count_requests(
-            user_id, route=route, since=start_of_month
+        if not self.use_memory_backend:
+            return await self._count_requests(
+                user_id, route=route, since=start_of_month
+            )
+
+        # Serve the total from a periodically refreshed Postgres count plus
+        # the requests this process has logged since that count was taken.
+        key = (user_id, route)
+        cached = self._monthly_counts.get(key)
+        if (
+            cached is None
+            or cached[1] != start_of_month
+            or time.monotonic() - cached[0]
+            > self.config.monthly_count_refresh_seconds
+        ):
+            # Reset before flushing so requests logged while we await are
+            # counted locally rather than lost.
+            self._monthly_local[key] = 0
+            self._monthly_refreshing.add(key)
+            try:
+                await self.flush_request_logs()
+                db_count = await self._count_requests(
+                    user_id, route=route, since=start_of_month
+                )
+            finally:
+                self._monthly_refreshing.discard(key)
+            cached = (time.monotonic(), start_of_month, db_count)
+            self._monthly_counts[key] = cached
+        return cached[2] + self._monthly_local[key]
+
+    def _sweep_monthly_counts(self, now: float) -> None:
+        """Drop monthly counts from a past month or idle past their refresh
+        interval, and local tallies that no longer have a count to add to.
+
+        A dropped key is recounted from Postgres when it is next checked, so
+        its local tally is not needed.
+        """
+        start_of_month = datetime.now(timezone.utc).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
         )
+        refresh = self.config.monthly_count_refresh_seconds
+        for key, (counted_at, month, _) in list(self._monthly_counts.items()):
+            if month != start_of_month or now - counted_at > refresh:
+                del self._monthly_counts[key]
+        for key in list(self._monthly_local):
+            if (
+                key not in self._monthly_counts
+                and key not in self._monthly_refreshing
+            ):
+                del self._monthly_local[key]
+        self._last_monthly_sweep = now
 
     def determine_effective_limits(
         self, user: User, route: str
@@ -210,13 +365,65 @@ class PostgresLimitsHandler(Handler):
                 raise ValueError("Monthly rate limit exceeded")
 
     async def log_request(self, user_id: UUID, route: str):
-        """Log a successful request to the request_log table."""
+        """Log a successful request to the request_log table.
+
+        With the "memory" backend the request is counted in memory right away
+        and written to Postgres in the next periodic batch.
+        """
+        if not self.use_memory_backend:
+            query = f"""
+            INSERT INTO {self._get_table_name(PostgresLimitsHandler.TABLE_NAME)}
+            (time, user_id, route)
+            VALUES (CURRENT_TIMESTAMP AT TIME ZONE 'UTC', $1, $2)
+            """
+            await self.connection_manager.execute_query(
+                query, [user_id, route]
+            )
+            return
+
+        self.request_counter.record(user_id, route)
+        now = time.monotonic()
+        if (
+            now - self._last_monthly_sweep
+            >= self.config.monthly_count_refresh_seconds
+        ):
+            self._sweep_monthly_counts(now)
+        self._monthly_local[(user_id, route)] += 1
+        self._monthly_local[(user_id, None)] += 1
+        self._pending_logs.append((datetime.now(timezone.utc), user_id, route))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while self._pending_logs:
+            await asyncio.sleep(self.config.request_log_flush_interval_seconds)
+            try:
+                await self.flush_request_logs()
+            except Exception as e:
+                logger.error(f"Failed to flush request logs: {e}")
+
+    async def flush_request_logs(self) -> None:
+        """Write buffered request log rows to Postgres in one batch."""
+        if not self._pending_logs:
+            return
+        pending, self._pending_logs = self._pending_logs, []
         query = f"""
         INSERT INTO {self._get_table_name(PostgresLimitsHandler.TABLE_NAME)}
         (time, user_id, route)
-        VALUES (CURRENT_TIMESTAMP AT TIME ZONE 'UTC', $1, $2)
+        VALUES ($1, $2, $3)
         """
-        await self.connection_manager.execute_query(query, [user_id, route])
+        try:
+            await self.connection_manager.execute_many(query, pending)
+        except BaseException:
+            # Keep the rows for the next attempt, including on cancellation.
+            self._pending_logs = pending + self._pending_logs
+            raise
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush_request_logs()
 
 
 # import logging
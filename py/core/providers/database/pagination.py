@@ -0,0 +1,178 @@
+"""Keyset pagination and cheap row counts for list queries."""
+
+import base64
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence
+from uuid import UUID
+
+from core.base import R2RException
+
+from .base import PostgresConnectionManager
+
+KeyColumn = tuple[str, Callable[[str], Any]]
+
+CREATED_AT_ID: Sequence[KeyColumn] = (
+    ("created_at", datetime.fromisoformat),
+    ("id", UUID),
+)
+
+
+class Keyset:
+    """Pages a list query by a unique sort key, such as `(created_at, id)`.
+
+    Each page carries a cursor that encodes the key of its last row. The
+    page after it selects the rows past that key with a row comparison,
+    which an index on the key columns can seek to, so a deep page costs no
+    more than the first one rather than counting past every row before it
+    with OFFSET.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[KeyColumn],
+        descending: bool = True,
+        alias: Optional[str] = None,
+    ):
+        self.columns = columns
+        self.descending = descending
+        self._prefix = f"{alias}." if alias else ""
+
+    def order_by(self) -> str:
+        direction = "DESC" if self.descending else "ASC"
+        return ", ".join(
+            f"{self._prefix}{name} {direction}" for name, _ in self.columns
+        )
+
+    def condition(self, cursor: str, params: list[Any]) -> str:
+        """Appends the key of `cursor` to `params` and returns a condition
+        selecting the rows that follow it."""
+        values = self._decode(cursor)
+        start = len(params) + 1
+        params.extend(values)
+        columns = ", ".join(
+            f"{self._prefix}{name}" for name, _ in self.columns
+        )
+        placeholders = ", ".join(
+            f"${start + i}" for i in range(len(self.columns))
+        )
+        operator = "<" if self.descending else ">"
+        return f"({columns}) {operator} ({placeholders})"
+
+    def next_cursor(self, rows: Sequence[Any], limit: int) -> Optional[str]:
+        """Returns the cursor of the page after `rows`, or None if `rows`
+        is the last page."""
+        if limit == -1 or len(rows) < limit:
+            return None
+        last = rows[-1]
+        values = [
+            value.isoformat() if isinstance(value, datetime) else str(value)
+            for value in (last[name] for name, _ in self.columns)
+        ]
+        return (
+            base64.urlsafe_b64encode(json.dumps(values).encode())
+            .rstrip(b"=")
+            .decode()
+        )
+
+    def _decode(self, cursor: str) -> list[Any]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded))
+            if len(values) != len(self.columns):
+                raise ValueError("Cursor does not match the sort key.")
+            return [
+                parse(value)
+                for (_, parse), value in zip(self.columns, values, strict=True)
+            ]
+        except (ValueError, TypeError) as e:
+            raise R2RException(
+                status_code=400, message="Invalid pagination cursor."
+            ) from e
+
+
+def total_from_page(
+    rows: Sequence[Any], offset: int, limit: int, cursor: Optional[str]
+) -> Optional[int]:
+    """Returns the number of rows a list query matches if its page holds
+    all of them, so that no count is needed."""
+    if offset == 0 and not cursor and (limit == -1 or len(rows) < limit):
+        return len(rows)
+    return None
+
+
+class RowCounter:
+    """Counts the rows that list queries match.
+
+    Exact counts run the count query every time. Otherwise, a query that
+    counts a whole table is answered from the planner's statistics in
+    `pg_class`, scaled to the table's current size as the planner does, and
+    any other query is counted exactly and cached for `ttl` seconds, so that
+    paging through a filtered list counts it once rather than once a page.
+    """
+
+    def __init__(
+        self,
+        connection_manager: PostgresConnectionManager,
+        ttl: float = 30.0,
+        max_entries: int = 1024,
+    ):
+        self.connection_manager = connection_manager
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._counts: OrderedDict[str, tuple[int, float]] = OrderedDict()
+
+    async def count(
+        self,
+        query: str,
+        params: Sequence[Any],
+        exact: bool = True,
+        table: Optional[str] = None,
+    ) -> int:
+        """Runs `query`, a `SELECT COUNT(*)` with `params`, or estimates its
+        result. `table` names the table when the query counts all of it."""
+        if exact:
+            return await self._count(query, params)
+
+        if table is not None:
+            estimate = await self._estimate(table)
+            if estimate is not None:
+                return estimate
+
+        key = json.dumps([query, list(params)], default=str)
+        cached = self._counts.get(key)
+        now = time.monotonic()
+        if cached is not None and cached[1] > now:
+            self._counts.move_to_end(key)
+            return cached[0]
+
+        count = await self._count(query, params)
+        self._counts[key] = (count, now + self.ttl)
+        self._counts.move_to_end(key)
+        while len(self._counts) > self.max_entries:
+            self._counts.popitem(last=False)
+        return count
+
+    async def _count(self, query: str, params: Sequence[Any]) -> int:
+        row = await self.connection_manager.fetchrow_query(query, list(params))
+        return row[0] if row else 0
+
+    async def _estimate(self, table: str) -> Optional[int]:
+        # `reltuples` is -1 for tables that were never analyzed, and an
+        # empty table may be small enough for an exact count anyway.
+        query = """
+            SELECT CASE
+                WHEN c.reltuples < 0 OR c.relpages = 0 THEN NULL
+                ELSE (
+                    c.reltuples / c.relpages
+                    * (pg_relation_size(c.oid)
+                       / current_setting('block_size')::int)
+                )::bigint
+            END AS estimate
+            FROM pg_class c
+            WHERE c.oid = $1::text::regclass
+        """
+        row = await self.connection_manager.fetchrow_query(query, [table])
+        return row["estimate"] if row else None
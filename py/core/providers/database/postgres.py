@@ -183,12 +183,15 @@ class PostgresDatabaseProvider(DatabaseProvider):
             collections_handler=self.collections_handler,
             dimension=self.dimension,
             quantization_type=self.quantization_type,
+            clustering_backend=self.config.graph_clustering_backend,
         )
         self.prompts_handler = PostgresPromptsHandler(
             self.project_name, self.connection_manager
         )
         self.files_handler = PostgresFilesHandler(
-            self.project_name, self.connection_manager
+            self.project_name,
+            self.connection_manager,
+            chunk_size=self.config.file_chunk_size,
         )
 
         self.limits_handler = PostgresLimitsHandler(
@@ -275,6 +278,8 @@ class PostgresDatabaseProvider(DatabaseProvider):
         return settings
 
     async def close(self):
+        await self.limits_handler.close()
+        self.graphs_handler.close()
         if self.pool:
             await self.pool.close()
 
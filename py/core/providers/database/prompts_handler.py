@@ -1,22 +1,30 @@
 import json
 import logging
 import os
+import sys
 from abc import abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Generic, Optional, TypeVar
+from string import Formatter
+from typing import Any, Callable, Generic, Optional, TypeVar
+from uuid import UUID
 
 import yaml
 
 from core.base import Handler, generate_default_prompt_id
 
 from .base import PostgresConnectionManager
+from .pagination import Keyset, RowCounter, total_from_page
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Prompt names are unique, so they alone are a stable sort key.
+PROMPTS_BY_NAME = (("name", str),)
+
 
 @dataclass
 class CacheEntry(Generic[T]):
@@ -26,59 +34,98 @@ class CacheEntry(Generic[T]):
     created_at: datetime
     last_accessed: datetime
     access_count: int = 0
+    size: int = 0
 
 
 class Cache(Generic[T]):
-    """A generic cache implementation with TTL and LRU-like features."""
+    """A generic LRU cache with an optional TTL, bounded by its number of
+    entries and by the total size of its values as measured by `size_of`."""
 
     def __init__(
         self,
         ttl: Optional[timedelta] = None,
         max_size: Optional[int] = 1000,
         cleanup_interval: timedelta = timedelta(hours=1),
+        max_bytes: Optional[int] = None,
+        size_of: Callable[[T], int] = sys.getsizeof,
     ):
-        self._cache: dict[str, CacheEntry[T]] = {}
+        self._cache: OrderedDict[str, CacheEntry[T]] = OrderedDict()
         self._ttl = ttl
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._size_of = size_of
+        self._bytes = 0
         self._cleanup_interval = cleanup_interval
         self._last_cleanup = datetime.now()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def get(self, key: str) -> Optional[T]:
         """Retrieve an item from cache."""
         self._maybe_cleanup()
 
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
             return None
 
-        entry = self._cache[key]
-
         if self._ttl and datetime.now() - entry.created_at > self._ttl:
-            del self._cache[key]
+            self._remove(key)
+            self.misses += 1
             return None
 
+        self._cache.move_to_end(key)
         entry.last_accessed = datetime.now()
         entry.access_count += 1
+        self.hits += 1
         return entry.value
 
     def set(self, key: str, value: T) -> None:
         """Store an item in cache."""
         self._maybe_cleanup()
 
+        self._remove(key)
         now = datetime.now()
-        self._cache[key] = CacheEntry(
-            value=value, created_at=now, last_accessed=now
+        entry = CacheEntry(
+            value=value,
+            created_at=now,
+            last_accessed=now,
+            size=self._size_of(value),
         )
+        self._cache[key] = entry
+        self._bytes += entry.size
 
-        if self._max_size and len(self._cache) > self._max_size:
+        while self._cache and (
+            (self._max_size and len(self._cache) > self._max_size)
+            or (self._max_bytes and self._bytes > self._max_bytes)
+        ):
             self._evict_lru()
 
     def invalidate(self, key: str) -> None:
         """Remove an item from cache."""
-        self._cache.pop(key, None)
+        self._remove(key)
 
     def clear(self) -> None:
         """Clear all cached items."""
         self._cache.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
 
     def _maybe_cleanup(self) -> None:
         """Periodically clean up expired entries."""
@@ -97,42 +144,119 @@ class Cache(Generic[T]):
             k for k, v in self._cache.items() if now - v.created_at > self._ttl
         ]
         for k in expired:
-            del self._cache[k]
+            self._remove(k)
 
     def _evict_lru(self) -> None:
         """Remove least recently used item."""
         if not self._cache:
             return
 
-        lru_key = min(
-            self._cache.keys(), key=lambda k: self._cache[k].last_accessed
+        _, entry = self._cache.popitem(last=False)
+        self._bytes -= entry.size
+        self.evictions += 1
+
+
+_CONVERSIONS: dict[str, Callable[[Any], str]] = {
+    "r": repr,
+    "s": str,
+    "a": ascii,
+}
+
+
+class PromptTemplate:
+    """A prompt template whose fields are parsed once, so that rendering
+    only joins its literal text with the formatted inputs.
+
+    Templates using positional or indexed fields are rendered with
+    `str.format` instead.
+    """
+
+    def __init__(
+        self,
+        template: str,
+        input_types: dict[str, str],
+        version: Optional[Any] = None,
+        id: Optional[UUID] = None,
+    ):
+        self.template = template
+        self.input_types = input_types
+        self.version = version
+        self.id = id
+        self._segments = self._compile(template)
+
+    @staticmethod
+    def _compile(
+        template: str,
+    ) -> Optional[list[tuple[str, Optional[str], str, Optional[str]]]]:
+        try:
+            parsed = list(Formatter().parse(template))
+        except ValueError:
+            return None
+
+        segments = []
+        for literal, field, spec, conversion in parsed:
+            if field is not None and (
+                not field.isidentifier()
+                or "{" in (spec or "")
+                or (conversion is not None and conversion not in _CONVERSIONS)
+            ):
+                return None
+            segments.append((literal, field, spec or "", conversion))
+        return segments
+
+    def format(self, inputs: Optional[dict[str, Any]] = None) -> str:
+        if not inputs:
+            return self.template
+
+        for k in inputs:
+            if k not in self.input_types:
+                raise ValueError(
+                    f"Unexpected input '{k}' for prompt with input types {self.input_types}"
+                )
+        if self._segments is None:
+            return self.template.format(**inputs)
+
+        parts = []
+        for literal, field, spec, conversion in self._segments:
+            parts.append(literal)
+            if field is not None:
+                value = inputs[field]
+                if conversion is not None:
+                    value = _CONVERSIONS[conversion](value)
+                parts.append(format(value, spec))
+        return "".join(parts)
+
+    def size(self) -> int:
+        """Approximate memory held by the template, in bytes."""
+        return sys.getsizeof(self.template) + sum(
+            sys.getsizeof(literal) for literal, *_ in self._segments or ()
         )
-        del self._cache[lru_key]
 
 
 class CacheablePromptHandler(Handler):
     """Abstract base class that adds caching capabilities to prompt
-    handlers."""
+    handlers.
+
+    Only templates are cached, keyed by prompt name and carrying the version
+    they were read at. Rendered prompts embed request-specific context and
+    are never cached.
+    """
 
     def __init__(
         self,
         cache_ttl: Optional[timedelta] = timedelta(hours=1),
-        max_cache_size: Optional[int] = 1000,
+        max_cache_bytes: Optional[int] = 16 * 2**20,
     ):
-        self._prompt_cache = Cache[str](ttl=cache_ttl, max_size=max_cache_size)
-        self._template_cache = Cache[dict](
-            ttl=cache_ttl, max_size=max_cache_size
+        self._template_cache = Cache[PromptTemplate](
+            ttl=cache_ttl,
+            max_size=None,
+            max_bytes=max_cache_bytes,
+            size_of=PromptTemplate.size,
         )
 
-    def _cache_key(
-        self, prompt_name: str, inputs: Optional[dict] = None
-    ) -> str:
-        """Generate a cache key for a prompt request."""
-        if inputs:
-            # Sort dict items for consistent keys
-            sorted_inputs = sorted(inputs.items())
-            return f"{prompt_name}:{sorted_inputs}"
-        return prompt_name
+    def cache_stats(self) -> dict[str, Any]:
+        """Hit, miss and eviction counts of the template cache."""
+        return self._template_cache.stats()
 
     async def get_cached_prompt(
         self,
@@ -150,24 +274,9 @@ class CacheablePromptHandler(Handler):
                     return prompt_override
             return prompt_override
 
-        cache_key = self._cache_key(prompt_name, inputs)
-
-        # If not bypassing, try returning from the prompt-level cache
-        if not bypass_cache:
-            cached = self._prompt_cache.get(cache_key)
-            if cached is not None:
-                logger.debug(f"Prompt cache hit: {cache_key}")
-                return cached
-
-        logger.debug(
-            "Prompt cache miss or bypass. Retrieving from DB or template cache."
-        )
-        # Notice the new parameter `bypass_template_cache` below
-        result = await self._get_prompt_impl(
+        return await self._get_prompt_impl(
             prompt_name, inputs, bypass_template_cache=bypass_cache
         )
-        self._prompt_cache.set(cache_key, result)
-        return result
 
     async def get_prompt(  # type: ignore
         self,
@@ -198,22 +307,6 @@ class CacheablePromptHandler(Handler):
             "updated_at": result["updated_at"],
         }
 
-    def _format_prompt(
-        self,
-        template: str,
-        inputs: Optional[dict[str, Any]],
-        input_types: dict[str, str],
-    ) -> str:
-        if inputs:
-            # optional input validation if needed
-            for k, _v in inputs.items():
-                if k not in input_types:
-                    raise ValueError(
-                        f"Unexpected input '{k}' for prompt with input types {input_types}"
-                    )
-            return template.format(**inputs)
-        return template
-
     async def update_prompt(
         self,
         name: str,
@@ -221,15 +314,8 @@ class CacheablePromptHandler(Handler):
         input_types: Optional[dict[str, str]] = None,
     ) -> None:
         """Public method to update a prompt with proper cache invalidation."""
-        # First invalidate all caches for this prompt
+        # First invalidate the cached template for this prompt
         self._template_cache.invalidate(name)
-        cache_keys_to_invalidate = [
-            key
-            for key in self._prompt_cache._cache.keys()
-            if key.startswith(f"{name}:") or key == name
-        ]
-        for key in cache_keys_to_invalidate:
-            self._prompt_cache.invalidate(key)
 
         # Perform the update
         await self._update_prompt_impl(name, template, input_types)
@@ -250,7 +336,9 @@ class CacheablePromptHandler(Handler):
         pass
 
     @abstractmethod
-    async def _get_template_info(self, prompt_name: str) -> Optional[dict]:
+    async def _get_template_info(
+        self, prompt_name: str
+    ) -> Optional[PromptTemplate]:
         """Get template info with caching."""
         pass
 
@@ -282,6 +370,7 @@ class PostgresPromptsHandler(CacheablePromptHandler):
         self.connection_manager = connection_manager
         self.project_name = project_name
         self.prompts: dict[str, dict[str, str | dict[str, str]]] = {}
+        self.row_counter = RowCounter(connection_manager)
 
     async def _load_prompts(self) -> None:
         """Load prompts from both database and YAML files."""
@@ -317,11 +406,12 @@ class PostgresPromptsHandler(CacheablePromptHandler):
                 # Pre-populate the template cache
                 self._template_cache.set(
                     row["name"],
-                    {
-                        "id": row["id"],
-                        "template": row["template"],
-                        "input_types": input_types,
-                    },
+                    PromptTemplate(
+                        row["template"],
+                        input_types,
+                        version=row["updated_at"],
+                        id=row["id"],
+                    ),
                 )
             logger.debug(f"Loaded {len(results)} prompts from database")
         except Exception as e:
@@ -406,72 +496,61 @@ class PostgresPromptsHandler(CacheablePromptHandler):
         """Implementation of database prompt retrieval."""
         # If we're bypassing the template cache, skip the cache lookup
         if not bypass_template_cache:
-            template_info = self._template_cache.get(prompt_name)
-            if template_info is not None:
+            prompt_template = self._template_cache.get(prompt_name)
+            if prompt_template is not None:
                 logger.debug(f"Template cache hit: {prompt_name}")
                 # use that
-                return self._format_prompt(
-                    template_info["template"],
-                    inputs,
-                    template_info["input_types"],
-                )
+                return prompt_template.format(inputs)
 
         # If we get here, either no cache was found or bypass_cache is True
-        query = f"""
-        SELECT template, input_types
-        FROM {self._get_table_name("prompts")}
-        WHERE name = $1;
-        """
-        result = await self.connection_manager.fetchrow_query(
-            query, [prompt_name]
-        )
-
-        if not result:
+        prompt_template = await self._fetch_template(prompt_name)
+        if prompt_template is None:
             raise ValueError(f"Prompt template '{prompt_name}' not found")
 
-        template = result["template"]
-        input_types = result["input_types"]
-        if isinstance(input_types, str):
-            input_types = json.loads(input_types)
-
         # Update template cache if not bypassing it
         if not bypass_template_cache:
-            self._template_cache.set(
-                prompt_name, {"template": template, "input_types": input_types}
-            )
+            self._template_cache.set(prompt_name, prompt_template)
 
-        return self._format_prompt(template, inputs, input_types)
+        return prompt_template.format(inputs)
 
-    async def _get_template_info(self, prompt_name: str) -> Optional[dict]:  # type: ignore
+    async def _get_template_info(  # type: ignore
+        self, prompt_name: str
+    ) -> Optional[PromptTemplate]:
         """Get template info with caching."""
         cached = self._template_cache.get(prompt_name)
         if cached is not None:
             return cached
 
+        prompt_template = await self._fetch_template(prompt_name)
+        if prompt_template is not None:
+            self._template_cache.set(prompt_name, prompt_template)
+        return prompt_template
+
+    async def _fetch_template(
+        self, prompt_name: str
+    ) -> Optional[PromptTemplate]:
         query = f"""
-        SELECT template, input_types
+        SELECT id, template, input_types, updated_at
         FROM {self._get_table_name("prompts")}
         WHERE name = $1;
         """
-
         result = await self.connection_manager.fetchrow_query(
             query, [prompt_name]
         )
+        if not result:
+            return None
 
-        if result:
-            # Ensure input_types is a dictionary
-            input_types = result["input_types"]
-            if isinstance(input_types, str):
-                input_types = json.loads(input_types)
-
-            template_info = {
-                "template": result["template"],
-                "input_types": input_types,
-            }
-            self._template_cache.set(prompt_name, template_info)
-            return template_info
+        # Ensure input_types is a dictionary
+        input_types = result["input_types"]
+        if isinstance(input_types, str):
+            input_types = json.loads(input_types)
 
-        return None
+        return PromptTemplate(
+            result["template"],
+            input_types,
+            version=result["updated_at"],
+            id=result["id"],
+        )
 
     async def _update_prompt_impl(
         self,
@@ -484,11 +563,8 @@ class PostgresPromptsHandler(CacheablePromptHandler):
         if not template and not input_types:
             return
 
-        # Clear caches first
+        # Clear the cached template first
         self._template_cache.invalidate(name)
-        for key in list(self._prompt_cache._cache.keys()):
-            if key.startswith(f"{name}:"):
-                self._prompt_cache.invalidate(key)
 
         # Build update query
         set_clauses = []
@@ -646,30 +722,54 @@ class PostgresPromptsHandler(CacheablePromptHandler):
         # Update template cache
         self._template_cache.set(
             name,
-            {
-                "id": prompt_id,
-                "template": template,
-                "input_types": input_types,
-            },
+            PromptTemplate(
+                template,
+                input_types,
+                version=result["updated_at"],
+                id=prompt_id,
+            ),
         )
 
-        # Invalidate any cached formatted prompts
-        for key in list(self._prompt_cache._cache.keys()):
-            if key.startswith(f"{name}:"):
-                self._prompt_cache.invalidate(key)
-
-    async def get_all_prompts(self) -> dict[str, Any]:
-        """Retrieve all stored prompts."""
+    async def get_all_prompts(
+        self,
+        offset: int = 0,
+        limit: int = -1,
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
+    ) -> dict[str, Any]:
+        """Retrieve stored prompts, ordered by name.
+
+        Passing the `next_cursor` of a page as `cursor` returns the page
+        after it. With `exact_total` off, `total_entries` may be an
+        estimate.
+        """
+        table_name = self._get_table_name("prompts")
+        keyset = Keyset(PROMPTS_BY_NAME, descending=False)
+        params: list[Any] = []
+        where_clause = ""
+        if cursor:
+            where_clause = f"WHERE {keyset.condition(cursor, params)}"
+        params.append(offset)
         query = f"""
-        SELECT id, name, template, input_types, created_at, updated_at, COUNT(*) OVER() AS total_entries
-        FROM {self._get_table_name("prompts")};
+        SELECT id, name, template, input_types, created_at, updated_at
+        FROM {table_name}
+        {where_clause}
+        ORDER BY {keyset.order_by()}
+        OFFSET ${len(params)}
         """
-        results = await self.connection_manager.fetch_query(query)
-
-        if not results:
-            return {"results": [], "total_entries": 0}
-
-        total_entries = results[0]["total_entries"] if results else 0
+        if limit != -1:
+            params.append(limit)
+            query += f" LIMIT ${len(params)}"
+        results = await self.connection_manager.fetch_query(query, params)
+
+        total_entries = total_from_page(results, offset, limit, cursor)
+        if total_entries is None:
+            total_entries = await self.row_counter.count(
+                f"SELECT COUNT(*) FROM {table_name}",
+                [],
+                exact=exact_total,
+                table=table_name,
+            )
 
         prompts = [
             {
@@ -687,7 +787,11 @@ class PostgresPromptsHandler(CacheablePromptHandler):
             for row in results
         ]
 
-        return {"results": prompts, "total_entries": total_entries}
+        return {
+            "results": prompts,
+            "total_entries": total_entries,
+            "next_cursor": keyset.next_cursor(results, limit),
+        }
 
     async def delete_prompt(self, name: str) -> None:
         """Delete a prompt template."""
@@ -699,11 +803,8 @@ class PostgresPromptsHandler(CacheablePromptHandler):
         if result == "DELETE 0":
             raise ValueError(f"Prompt template '{name}' not found")
 
-        # Invalidate caches
+        # Invalidate the cached template
         self._template_cache.invalidate(name)
-        for key in list(self._prompt_cache._cache.keys()):
-            if key.startswith(f"{name}:"):
-                self._prompt_cache.invalidate(key)
 
     async def get_message_payload(
         self,
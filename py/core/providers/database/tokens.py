@@ -1,3 +1,6 @@
+import asyncio
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -13,6 +16,15 @@ class PostgresTokensHandler(Handler):
         self, project_name: str, connection_manager: PostgresConnectionManager
     ):
         super().__init__(project_name, connection_manager)
+        # SHA-256 digests of every blacklisted token, as of `_mirror_loaded_at`
+        # plus any tokens blacklisted by this process since.
+        self._blacklist_mirror: set[bytes] = set()
+        self._mirror_loaded_at: Optional[float] = None
+        self._mirror_lock = asyncio.Lock()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
 
     async def create_tables(self):
         query = f"""
@@ -41,8 +53,48 @@ class PostgresTokensHandler(Handler):
         await self.connection_manager.execute_query(
             query, [token, current_time]
         )
+        self._blacklist_mirror.add(self._digest(token))
+
+    async def refresh_blacklist_mirror(self) -> None:
+        """Reloads the in-memory mirror of the blacklisted tokens table."""
+        query = f"""
+        SELECT token FROM {self._get_table_name(PostgresTokensHandler.TABLE_NAME)}
+        """
+        loaded_at = time.monotonic()
+        results = await self.connection_manager.fetch_query(query)
+        self._blacklist_mirror = {
+            self._digest(row["token"]) for row in results
+        }
+        self._mirror_loaded_at = loaded_at
+
+    def _mirror_is_stale(self, max_staleness_seconds: float) -> bool:
+        return (
+            self._mirror_loaded_at is None
+            or time.monotonic() - self._mirror_loaded_at
+            > max_staleness_seconds
+        )
+
+    async def is_token_blacklisted(
+        self, token: str, max_staleness_seconds: Optional[float] = None
+    ) -> bool:
+        """Checks whether a token has been blacklisted.
+
+        When `max_staleness_seconds` is given the check is answered from the
+        in-memory mirror, reloaded first if it is older than that. Tokens
+        blacklisted by other processes are then only seen after the next
+        reload.
+        """
+        digest = self._digest(token)
+        if digest in self._blacklist_mirror:
+            return True
+
+        if max_staleness_seconds is not None:
+            if self._mirror_is_stale(max_staleness_seconds):
+                async with self._mirror_lock:
+                    if self._mirror_is_stale(max_staleness_seconds):
+                        await self.refresh_blacklist_mirror()
+            return digest in self._blacklist_mirror
 
-    async def is_token_blacklisted(self, token: str) -> bool:
         query = f"""
         SELECT 1 FROM {self._get_table_name(PostgresTokensHandler.TABLE_NAME)}
         WHERE token = $1
@@ -65,3 +117,6 @@ class PostgresTokensHandler(Handler):
         WHERE blacklisted_at < $1
         """
         await self.connection_manager.execute_query(query, [expiry_time])
+        # Drop the removed tokens from the mirror on its next use.
+        self._blacklist_mirror = set()
+        self._mirror_loaded_at = None
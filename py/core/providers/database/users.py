@@ -1,19 +1,22 @@
-import csv
 import json
-import tempfile
 from datetime import datetime
-from typing import IO, Optional
+from typing import Any, AsyncGenerator, Callable, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
 
 from core.base import CryptoProvider, Handler
-from core.base.abstractions import R2RException
+from core.base.abstractions import ExportFormat, R2RException
 from core.utils import generate_user_id
 from shared.abstractions import User
 
 from .base import PostgresConnectionManager, QueryBuilder
 from .collections import PostgresCollectionsHandler
+from .export import select_columns, stream_export
+from .pagination import Keyset, RowCounter, total_from_page
+
+# Emails are unique, so they alone are a stable sort key.
+USERS_BY_EMAIL = (("email", str),)
 
 
 def _merge_metadata(
@@ -61,6 +64,17 @@ class PostgresUserHandler(Handler):
     ):
         super().__init__(project_name, connection_manager)
         self.crypto_provider = crypto_provider
+        self.row_counter = RowCounter(connection_manager)
+        self._invalidation_hooks: list[Callable[[UUID], None]] = []
+
+    def add_invalidation_hook(self, hook: Callable[[UUID], None]) -> None:
+        """Registers a callback run with a user's id whenever that user, their
+        collection memberships or their API keys change."""
+        self._invalidation_hooks.append(hook)
+
+    def _invalidate_user(self, id: UUID) -> None:
+        for hook in self._invalidation_hooks:
+            hook(id)
 
     async def create_tables(self):
         user_table_query = f"""
@@ -477,6 +491,7 @@ class PostgresUserHandler(Handler):
                 status_code=500,
                 detail="Failed to update user",
             )
+        self._invalidate_user(user.id)
 
         return User(
             id=result["id"],
@@ -545,6 +560,7 @@ class PostgresUserHandler(Handler):
 
         if not result:
             raise R2RException(status_code=404, message="User not found")
+        self._invalidate_user(id)
 
     async def update_user_password(self, id: UUID, new_hashed_password: str):
         query = f"""
@@ -555,6 +571,7 @@ class PostgresUserHandler(Handler):
         await self.connection_manager.execute_query(
             query, [new_hashed_password, id]
         )
+        self._invalidate_user(id)
 
     async def get_all_users(self) -> list[User]:
         """Get all users with minimal information."""
@@ -637,6 +654,7 @@ class PostgresUserHandler(Handler):
             raise R2RException(
                 status_code=400, message="Invalid or expired verification code"
             )
+        self._invalidate_user(result["id"])
 
     async def remove_verification_code(self, verification_code: str):
         query = f"""
@@ -693,6 +711,7 @@ class PostgresUserHandler(Handler):
             WHERE id = $1
         """
         await self.connection_manager.execute_query(query, [id])
+        self._invalidate_user(id)
 
     async def add_user_to_collection(
         self, id: UUID, collection_id: UUID
@@ -718,6 +737,7 @@ class PostgresUserHandler(Handler):
             raise R2RException(
                 status_code=400, message="User already in collection"
             )
+        self._invalidate_user(id)
 
         update_collection_query = f"""
             UPDATE {self._get_table_name("collections")}
@@ -751,6 +771,7 @@ class PostgresUserHandler(Handler):
                 status_code=400,
                 message="User is not a member of the specified collection",
             )
+        self._invalidate_user(id)
         return True
 
     async def get_users_in_collection(
@@ -831,6 +852,7 @@ class PostgresUserHandler(Handler):
             WHERE id = $1
         """
         await self.connection_manager.execute_query(query, [id])
+        self._invalidate_user(id)
 
     async def get_user_id_by_verification_code(
         self, verification_code: str
@@ -859,24 +881,51 @@ class PostgresUserHandler(Handler):
             WHERE id = $1
         """
         await self.connection_manager.execute_query(query, [id])
+        self._invalidate_user(id)
 
     async def get_users_overview(
         self,
         offset: int,
         limit: int,
         user_ids: Optional[list[UUID]] = None,
-    ) -> dict[str, list[User] | int]:
-        """Return users with document usage and total entries."""
+        cursor: Optional[str] = None,
+        exact_total: bool = True,
+    ) -> dict[str, Any]:
+        """Return users with document usage and total entries.
+
+        Users are ordered by email. Passing the `next_cursor` of a page as
+        `cursor` returns the page after it. With `exact_total` off,
+        `total_entries` may be an estimate.
+        """
+        table_name = self._get_table_name(PostgresUserHandler.TABLE_NAME)
+        conditions = []
+        params: list[Any] = []
+        if user_ids:
+            conditions.append("u.id = ANY($1::uuid[])")
+            params.append(user_ids)
+
+        count_query = f"SELECT COUNT(*) FROM {table_name} u"
+        if conditions:
+            count_query += " WHERE " + " AND ".join(conditions)
+        count_params = list(params)
+        count_table = None if conditions else table_name
+
+        keyset = Keyset(USERS_BY_EMAIL, descending=False, alias="u")
+        if cursor:
+            conditions.append(keyset.condition(cursor, params))
+
+        where_clause = (
+            "WHERE " + " AND ".join(conditions) if conditions else ""
+        )
+        params.append(offset)
+        page_clause = f"OFFSET ${len(params)}"
+        if limit != -1:
+            params.append(limit)
+            page_clause += f" LIMIT ${len(params)}"
+
+        # Documents are aggregated for the users of the page only.
         query = f"""
-            WITH user_document_ids AS (
-                SELECT
-                    u.id as user_id,
-                    ARRAY_AGG(d.id) FILTER (WHERE d.id IS NOT NULL) AS doc_ids
-                FROM {self._get_table_name(PostgresUserHandler.TABLE_NAME)} u
-                LEFT JOIN {self._get_table_name("documents")} d ON u.id = d.owner_id
-                GROUP BY u.id
-            ),
-            user_docs AS (
+            WITH page AS (
                 SELECT
                     u.id,
                     u.email,
@@ -888,34 +937,29 @@ class PostgresUserHandler(Handler):
                     u.profile_picture,
                     u.collection_ids,
                     u.created_at,
-                    u.updated_at,
-                    COUNT(d.id) AS num_files,
-                    COALESCE(SUM(d.size_in_bytes), 0) AS total_size_in_bytes,
-                    ud.doc_ids as document_ids
-                FROM {self._get_table_name(PostgresUserHandler.TABLE_NAME)} u
-                LEFT JOIN {self._get_table_name("documents")} d ON u.id = d.owner_id
-                LEFT JOIN user_document_ids ud ON u.id = ud.user_id
-                {" WHERE u.id = ANY($3::uuid[])" if user_ids else ""}
-                GROUP BY u.id, u.email, u.is_superuser, u.is_active, u.is_verified,
-                         u.created_at, u.updated_at, u.collection_ids, ud.doc_ids
+                    u.updated_at
+                FROM {table_name} u
+                {where_clause}
+                ORDER BY {keyset.order_by()}
+                {page_clause}
             )
             SELECT
-                user_docs.*,
-                COUNT(*) OVER() AS total_entries
-            FROM user_docs
-            ORDER BY email
-            OFFSET $1
+                u.*,
+                docs.num_files,
+                docs.total_size_in_bytes,
+                docs.document_ids
+            FROM page u
+            LEFT JOIN LATERAL (
+                SELECT
+                    COUNT(d.id) AS num_files,
+                    COALESCE(SUM(d.size_in_bytes), 0) AS total_size_in_bytes,
+                    ARRAY_AGG(d.id) FILTER (WHERE d.id IS NOT NULL) AS document_ids
+                FROM {self._get_table_name("documents")} d
+                WHERE d.owner_id = u.id
+            ) docs ON TRUE
+            ORDER BY {keyset.order_by()}
         """
 
-        params: list = [offset]
-
-        if limit != -1:
-            query += " LIMIT $2"
-            params.append(limit)
-
-        if user_ids:
-            params.append(user_ids)
-
         results = await self.connection_manager.fetch_query(query, params)
         if not results:
             raise R2RException(status_code=404, message="No users found")
@@ -945,8 +989,19 @@ class PostgresUserHandler(Handler):
                 )
             )
 
-        total_entries = results[0]["total_entries"]
-        return {"results": users_list, "total_entries": total_entries}
+        total_entries = total_from_page(results, offset, limit, cursor)
+        if total_entries is None:
+            total_entries = await self.row_counter.count(
+                count_query,
+                count_params,
+                exact=exact_total,
+                table=count_table,
+            )
+        return {
+            "results": users_list,
+            "total_entries": total_entries,
+            "next_cursor": keyset.next_cursor(results, limit),
+        }
 
     async def _collection_exists(self, collection_id: UUID) -> bool:
         """Check if a collection exists."""
@@ -1077,6 +1132,7 @@ class PostgresUserHandler(Handler):
         if result is None:
             raise R2RException(status_code=404, message="API key not found")
 
+        self._invalidate_user(user_id)
         return True
 
     async def update_api_key_name(
@@ -1096,14 +1152,14 @@ class PostgresUserHandler(Handler):
             raise R2RException(status_code=404, message="API key not found")
         return True
 
-    async def export_to_csv(
+    async def export(
         self,
         columns: Optional[list[str]] = None,
         filters: Optional[dict] = None,
         include_header: bool = True,
-    ) -> tuple[str, IO]:
-        """Creates a CSV file from the PostgreSQL data and returns the path to
-        the temp file."""
+        export_format: ExportFormat = ExportFormat.CSV,
+    ) -> AsyncGenerator[bytes, None]:
+        """Streams the data as CSV, Parquet or Arrow."""
         valid_columns = {
             "id",
             "email",
@@ -1169,52 +1225,13 @@ class PostgresUserHandler(Handler):
             if conditions:
                 select_stmt = f"{select_stmt} WHERE {' AND '.join(conditions)}"
 
-        select_stmt = f"{select_stmt} ORDER BY created_at DESC"
-
-        temp_file = None
-        try:
-            temp_file = tempfile.NamedTemporaryFile(
-                mode="w", delete=True, suffix=".csv"
-            )
-            writer = csv.writer(temp_file, quoting=csv.QUOTE_ALL)
-
-            async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
-                async with conn.transaction():
-                    cursor = await conn.cursor(select_stmt, *params)
-
-                    if include_header:
-                        writer.writerow(columns)
-
-                    chunk_size = 1000
-                    while True:
-                        rows = await cursor.fetch(chunk_size)
-                        if not rows:
-                            break
-                        for row in rows:
-                            row_dict = {
-                                "id": row[0],
-                                "email": row[1],
-                                "is_superuser": row[2],
-                                "is_active": row[3],
-                                "is_verified": row[4],
-                                "name": row[5],
-                                "bio": row[6],
-                                "collection_ids": row[7],
-                                "created_at": row[8],
-                                "updated_at": row[9],
-                            }
-                            writer.writerow([row_dict[col] for col in columns])
-
-            temp_file.flush()
-            return temp_file.name, temp_file
-
-        except Exception as e:
-            if temp_file:
-                temp_file.close()
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to export data: {str(e)}",
-            ) from e
+        return await stream_export(
+            self.connection_manager.pool,  # type: ignore
+            select_columns(select_stmt, columns, "created_at DESC"),
+            params,
+            export_format,
+            include_header,
+        )
 
     async def get_user_by_google_id(self, google_id: str) -> Optional[User]:
         """Return a User if the google_id is found; otherwise None."""
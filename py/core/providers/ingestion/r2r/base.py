@@ -1,7 +1,7 @@
 # type: ignore
 import logging
 import time
-from typing import Any, AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, BinaryIO, Optional
 
 from core import parsers
 from core.base import (
@@ -12,6 +12,7 @@ from core.base import (
     DocumentType,
     IngestionConfig,
     IngestionProvider,
+    ParserProcessPool,
     R2RDocumentProcessingError,
     RecursiveCharacterTextSplitter,
     TextSplitter,
@@ -37,6 +38,8 @@ class R2RIngestionConfig(IngestionConfig):
 
 
 class R2RIngestionProvider(IngestionProvider):
+    accepts_file_objects = True
+
     DEFAULT_PARSERS = {
         DocumentType.BMP: parsers.BMPParser,
         DocumentType.CSV: parsers.CSVParser,
@@ -110,11 +113,22 @@ class R2RIngestionProvider(IngestionProvider):
         self.parsers: dict[DocumentType, AsyncParser] = {}
         self.text_splitter = self._build_text_splitter()
         self._initialize_parsers()
+        self.process_pool: Optional[ParserProcessPool] = None
+        if self.config.parser_process_pool_workers > 0:
+            self.process_pool = ParserProcessPool(
+                max_workers=self.config.parser_process_pool_workers,
+                timeout=self.config.parser_timeout_seconds,
+                pages_per_task=self.config.parser_pages_per_task,
+            )
 
         logger.info(
             f"R2RIngestionProvider initialized with config: {self.config}"
         )
 
+    def close(self) -> None:
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
+
     def _initialize_parsers(self):
         for doc_type, parser in self.DEFAULT_PARSERS.items():
             # will choose the first parser in the list
@@ -216,10 +230,15 @@ class R2RIngestionProvider(IngestionProvider):
 
     async def parse(  # type: ignore
         self,
-        file_content: bytes,
+        file_content: bytes | BinaryIO,
         document: Document,
         ingestion_config_override: dict,
     ) -> AsyncGenerator[DocumentChunk, None]:
+        """Parse a file and chunk its content as each piece is parsed.
+
+        `file_content` may be a binary file object, which is handed straight
+        to parsers that accept one and read into memory for the rest.
+        """
         if document.document_type not in self.parsers:
             raise R2RDocumentProcessingError(
                 document_id=document.id,
@@ -227,11 +246,11 @@ class R2RIngestionProvider(IngestionProvider):
             )
         else:
             t0 = time.time()
-            contents = []
             parser_overrides = ingestion_config_override.get(
                 "parser_overrides", {}
             )
-            if document.document_type.value in parser_overrides:
+            use_zerox = document.document_type.value in parser_overrides
+            if use_zerox:
                 logger.info(
                     f"Using parser_override for {document.document_type} with input value {parser_overrides[document.document_type.value]}"
                 )
@@ -243,30 +262,42 @@ class R2RIngestionProvider(IngestionProvider):
                     raise ValueError(
                         "Only Zerox PDF parser override is available."
                     )
-                async for chunk in self.parsers[
-                    f"zerox_{DocumentType.PDF.value}"
-                ].ingest(file_content, **ingestion_config_override):
-                    if isinstance(chunk, dict) and chunk.get("content"):
-                        contents.append(chunk)
-                    elif (
-                        chunk
-                    ):  # Handle string output for backward compatibility
-                        contents.append({"content": chunk})
+                parser = self.parsers[f"zerox_{DocumentType.PDF.value}"]
             else:
-                async for text in self.parsers[document.document_type].ingest(
-                    file_content, **ingestion_config_override
-                ):
-                    if text is not None:
-                        contents.append({"content": text})
+                parser = self.parsers[document.document_type]
 
-            if not contents:
-                logging.warning(
-                    "No valid text content was extracted during parsing"
+            if not isinstance(file_content, bytes) and not getattr(
+                parser, "accepts_file_objects", False
+            ):
+                file_content = file_content.read()
+
+            if self.process_pool and parser.process_pool_safe:
+                parsed = self.process_pool.ingest(
+                    parser, file_content, **ingestion_config_override
+                )
+            else:
+                parsed = parser.ingest(
+                    file_content, **ingestion_config_override
                 )
-                return
 
+            async def contents() -> AsyncGenerator[dict, None]:
+                async for chunk in parsed:
+                    if use_zerox:
+                        if isinstance(chunk, dict) and chunk.get("content"):
+                            yield chunk
+                        elif chunk:
+                            # Handle string output for backward compatibility
+                            yield {"content": chunk}
+                    elif chunk is not None:
+                        yield {"content": chunk}
+
+            # Chunk each piece of content as soon as it is parsed, so that
+            # later pages are still being parsed while earlier chunks are
+            # processed downstream.
+            has_contents = False
             iteration = 0
-            for content_item in contents:
+            async for content_item in contents():
+                has_contents = True
                 chunk_text = content_item["content"]
                 chunks = self.chunk(chunk_text, ingestion_config_override)
 
@@ -286,6 +317,12 @@ class R2RIngestionProvider(IngestionProvider):
                     iteration += 1
                     yield extraction
 
+            if not has_contents:
+                logging.warning(
+                    "No valid text content was extracted during parsing"
+                )
+                return
+
             logger.debug(
                 f"Parsed document with id={document.id}, title={document.metadata.get('title', None)}, "
                 f"user_id={document.metadata.get('user_id', None)}, metadata={document.metadata} "
@@ -203,25 +203,22 @@ class UnstructuredIngestionProvider(IngestionProvider):
         ingestion_config: dict,
         parser_name: str,
     ) -> AsyncGenerator[FallbackElement, None]:
-        contents = []
-        async for chunk in self.parsers[parser_name].ingest(  # type: ignore
-            file_content, **ingestion_config
-        ):  # type: ignore
-            if isinstance(chunk, dict) and chunk.get("content"):
-                contents.append(chunk)
-            elif chunk:  # Handle string output for backward compatibility
-                contents.append({"content": chunk})
-
-        if not contents:
-            logging.warning(
-                "No valid text content was extracted during parsing"
-            )
-            return
+        async def contents() -> AsyncGenerator[dict, None]:
+            async for chunk in self.parsers[parser_name].ingest(  # type: ignore
+                file_content, **ingestion_config
+            ):  # type: ignore
+                if isinstance(chunk, dict) and chunk.get("content"):
+                    yield chunk
+                elif chunk:  # Handle string output for backward compatibility
+                    yield {"content": chunk}
 
         logging.info(f"Fallback ingestion with config = {ingestion_config}")
 
+        # Split each piece of content as soon as it is parsed.
+        has_contents = False
         iteration = 0
-        for content_item in contents:
+        async for content_item in contents():
+            has_contents = True
             text = content_item["content"]
 
             loop = asyncio.get_event_loop()
@@ -245,6 +242,11 @@ class UnstructuredIngestionProvider(IngestionProvider):
                 iteration += 1
                 await asyncio.sleep(0)
 
+        if not has_contents:
+            logging.warning(
+                "No valid text content was extracted during parsing"
+            )
+
     async def parse(
         self,
         file_content: bytes,
@@ -27,15 +27,18 @@ from shared.utils.splitter.text import (
     TextSplitter,
 )
 
+from .zip_stream import ZipStreamWriter
+
+CITATION_PATTERN = re.compile(r"\[([A-Za-z0-9]{7,8})\]")
+# The longest possible citation, e.g. "[abcd1234]".
+MAX_CITATION_LENGTH = 10
+
 
 def extract_citations(text: str) -> list[str]:
     """
     Extract citation IDs enclosed in brackets like [abc1234].
     Returns a list of citation IDs.
     """
-    # Direct pattern to match IDs inside brackets with alphanumeric pattern
-    CITATION_PATTERN = re.compile(r"\[([A-Za-z0-9]{7,8})\]")
-
     sids = []
     for match in CITATION_PATTERN.finditer(text):
         sid = match.group(1)
@@ -44,22 +47,22 @@ def extract_citations(text: str) -> list[str]:
     return sids
 
 
-def extract_citation_spans(text: str) -> dict[str, list[Tuple[int, int]]]:
+def extract_citation_spans(
+    text: str, start: int = 0
+) -> dict[str, list[Tuple[int, int]]]:
     """
     Extract citation IDs with their positions in the text.
 
     Args:
         text: The text to search for citations
+        start: Only report citations beginning at or after this position
 
     Returns:
         dictionary mapping citation IDs to lists of (start, end) position tuples
     """
-    # Use the same pattern as the original extract_citations
-    CITATION_PATTERN = re.compile(r"\[([A-Za-z0-9]{7,8})\]")
-
     citation_spans: dict = {}
 
-    for match in CITATION_PATTERN.finditer(text):
+    for match in CITATION_PATTERN.finditer(text, start):
         sid = match.group(1)
         start = match.start()
         end = match.end()
@@ -86,6 +89,15 @@ class CitationTracker:
         # Track which citation IDs we've seen
         self.seen_citation_ids: Set[str] = set()
 
+        # Length of the text scanned by the last `find_new_citation_spans`
+        # call, so streamed text is only scanned once.
+        self.scanned_length = 0
+
+    def reset_scan(self):
+        """Scan the next text from the beginning, e.g. after the buffer is
+        cleared."""
+        self.scanned_length = 0
+
     def is_new_citation(self, citation_id: str) -> bool:
         """Check if this is the first occurrence of this citation ID."""
         is_new = citation_id not in self.seen_citation_ids
@@ -129,6 +141,10 @@ def find_new_citation_spans(
     """
     Extract citation spans that haven't been processed yet.
 
+    `text` is expected to grow by appending, as a streamed answer does. Only
+    the part added since the previous call is scanned, along with enough of
+    the old tail to catch a citation split across deltas.
+
     Args:
         text: Text to search
         tracker: The CitationTracker instance
@@ -136,8 +152,14 @@ def find_new_citation_spans(
     Returns:
         dictionary of citation IDs to lists of new (start, end) spans
     """
-    # Get all citation spans in the text
-    all_spans = extract_citation_spans(text)
+    if len(text) < tracker.scanned_length:
+        tracker.reset_scan()
+    # Citations starting earlier than this were complete in the text seen
+    # last time, so they have been found already.
+    start = max(0, tracker.scanned_length - MAX_CITATION_LENGTH + 1)
+    tracker.scanned_length = len(text)
+
+    all_spans = extract_citation_spans(text, start)
 
     # Filter to only spans we haven't processed yet
     new_spans: dict = {}
@@ -179,4 +201,5 @@ __all__ = [
     "extract_citation_spans",
     "CitationTracker",
     "find_new_citation_spans",
+    "ZipStreamWriter",
 ]
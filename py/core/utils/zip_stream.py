@@ -0,0 +1,232 @@
+"""Incremental writer for ZIP archives that are streamed as they are built."""
+
+import struct
+import zlib
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP_MAX_ENTRIES = 0xFFFF
+
+# Values of classic fields whose real value is in a ZIP64 record.
+_MASK32 = 0xFFFFFFFF
+_MASK16 = 0xFFFF
+
+# Bit 3 defers the CRC and sizes to a data descriptor after the content and
+# bit 11 marks names as UTF-8.
+_FLAGS = 0x0808
+_VERSION = 20
+_VERSION_ZIP64 = 45
+
+
+class _Entry(NamedTuple):
+    name: bytes
+    dos_time: int
+    dos_date: int
+    crc: int
+    size: int
+    offset: int
+    zip64: bool
+
+
+def _dos_datetime(date_time: Optional[datetime]) -> tuple[int, int]:
+    date_time = date_time or datetime.now()
+    if date_time.year < 1980:
+        return 0, (1 << 5) | 1
+    return (
+        (date_time.hour << 11)
+        | (date_time.minute << 5)
+        | (date_time.second // 2),
+        ((date_time.year - 1980) << 9)
+        | (date_time.month << 5)
+        | date_time.day,
+    )
+
+
+class ZipStreamWriter:
+    """Builds a ZIP archive piece by piece, returning the bytes of each
+    piece so they can be sent as soon as they are produced.
+
+    Entries are stored uncompressed, with their CRC and size written in a
+    data descriptor after the content, so nothing is buffered. ZIP64 records
+    are used for entries whose expected size reaches 4 GB and for archives
+    whose offsets or entry count exceed the classic limits.
+
+    Usage:
+        yield writer.start_entry(name, size)
+        for chunk in chunks:
+            yield writer.write(chunk)
+        yield writer.end_entry()
+        ...
+        yield writer.close()
+    """
+
+    def __init__(self):
+        self._offset = 0
+        self._entries: list[_Entry] = []
+        self._current: Optional[dict] = None
+
+    def start_entry(
+        self,
+        name: str,
+        size: int,
+        date_time: Optional[datetime] = None,
+    ) -> bytes:
+        """Start an entry of `size` bytes, returning its local header. The
+        size only decides whether the entry needs ZIP64 records."""
+        if self._current is not None:
+            raise ValueError("The previous entry has not been ended.")
+        encoded_name = name.encode("utf-8")
+        zip64 = size >= ZIP64_LIMIT
+        dos_time, dos_date = _dos_datetime(date_time)
+        self._current = {
+            "name": encoded_name,
+            "dos_time": dos_time,
+            "dos_date": dos_date,
+            "crc": 0,
+            "size": 0,
+            "offset": self._offset,
+            "zip64": zip64,
+        }
+        extra = struct.pack("<HHQQ", 0x0001, 16, 0, 0) if zip64 else b""
+        size_field = _MASK32 if zip64 else 0
+        header = struct.pack(
+            "<IHHHHHIIIHH",
+            0x04034B50,
+            _VERSION_ZIP64 if zip64 else _VERSION,
+            _FLAGS,
+            0,  # stored
+            dos_time,
+            dos_date,
+            0,
+            size_field,
+            size_field,
+            len(encoded_name),
+            len(extra),
+        )
+        return self._advance(header + encoded_name + extra)
+
+    def write(self, data: bytes) -> bytes:
+        """Add `data` to the current entry and return it."""
+        if self._current is None:
+            raise ValueError("No entry has been started.")
+        entry = self._current
+        entry["crc"] = zlib.crc32(data, entry["crc"])
+        entry["size"] += len(data)
+        if entry["size"] >= ZIP64_LIMIT and not entry["zip64"]:
+            raise ValueError(
+                f"Entry {entry['name']!r} is larger than its expected size "
+                "and needs ZIP64."
+            )
+        return self._advance(data)
+
+    def end_entry(self) -> bytes:
+        """Finish the current entry, returning its data descriptor."""
+        if self._current is None:
+            raise ValueError("No entry has been started.")
+        entry = _Entry(**self._current)
+        self._current = None
+        self._entries.append(entry)
+        if entry.zip64:
+            descriptor = struct.pack(
+                "<IIQQ", 0x08074B50, entry.crc, entry.size, entry.size
+            )
+        else:
+            descriptor = struct.pack(
+                "<IIII", 0x08074B50, entry.crc, entry.size, entry.size
+            )
+        return self._advance(descriptor)
+
+    def close(self) -> bytes:
+        """Return the central directory and end of archive records."""
+        if self._current is not None:
+            raise ValueError("The last entry has not been ended.")
+        directory_offset = self._offset
+        records = [self._directory_record(entry) for entry in self._entries]
+        directory = b"".join(records)
+        directory_size = len(directory)
+
+        count = len(self._entries)
+        trailer = b""
+        if (
+            count >= ZIP_MAX_ENTRIES
+            or directory_offset >= ZIP64_LIMIT
+            or directory_size >= ZIP64_LIMIT
+        ):
+            zip64_end_offset = directory_offset + directory_size
+            trailer = struct.pack(
+                "<IQHHIIQQQQ",
+                0x06064B50,
+                44,
+                _VERSION_ZIP64,
+                _VERSION_ZIP64,
+                0,
+                0,
+                count,
+                count,
+                directory_size,
+                directory_offset,
+            ) + struct.pack("<IIQI", 0x07064B50, 0, zip64_end_offset, 1)
+        trailer += struct.pack(
+            "<IHHHHIIH",
+            0x06054B50,
+            0,
+            0,
+            _MASK16 if trailer else count,
+            _MASK16 if trailer else count,
+            _MASK32 if trailer else directory_size,
+            _MASK32 if trailer else directory_offset,
+            0,
+        )
+        return self._advance(directory + trailer)
+
+    @staticmethod
+    def _directory_record(entry: _Entry) -> bytes:
+        zip64_fields = []
+        size = entry.size
+        if entry.zip64:
+            zip64_fields += [entry.size, entry.size]
+            size = _MASK32
+        offset = entry.offset
+        if entry.offset >= ZIP64_LIMIT:
+            zip64_fields.append(entry.offset)
+            offset = _MASK32
+        extra = (
+            struct.pack(
+                f"<HH{len(zip64_fields)}Q",
+                0x0001,
+                8 * len(zip64_fields),
+                *zip64_fields,
+            )
+            if zip64_fields
+            else b""
+        )
+        version = _VERSION_ZIP64 if zip64_fields else _VERSION
+        return (
+            struct.pack(
+                "<IHHHHHHIIIHHHHHII",
+                0x02014B50,
+                version,
+                version,
+                _FLAGS,
+                0,
+                entry.dos_time,
+                entry.dos_date,
+                entry.crc,
+                size,
+                size,
+                len(entry.name),
+                len(extra),
+                0,
+                0,
+                0,
+                0,
+                offset,
+            )
+            + entry.name
+            + extra
+        )
+
+    def _advance(self, data: bytes) -> bytes:
+        self._offset += len(data)
+        return data
@@ -614,6 +614,8 @@ class DocumentsSDK:
         ids: Optional[list[str | UUID]] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        exact_total: Optional[bool] = False,
     ) -> WrappedDocumentsResponse:
         """List documents with pagination.
 
@@ -621,6 +623,8 @@ class DocumentsSDK:
             ids (Optional[list[str | UUID]]): Optional list of document IDs to filter by
             offset (int, optional): Specifies the number of objects to skip. Defaults to 0.
             limit (int, optional): Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.
+            cursor (Optional[str]): The `next_cursor` of the previous page, to fetch the page after it.
+            exact_total (Optional[bool]): Whether to count `total_entries` exactly rather than estimate it. Defaults to False.
 
         Returns:
             WrappedDocumentsResponse
@@ -628,7 +632,10 @@ class DocumentsSDK:
         params = {
             "offset": offset,
             "limit": limit,
+            "exact_total": exact_total,
         }
+        if cursor:
+            params["cursor"] = cursor  # type: ignore
         if ids:
             params["ids"] = [str(doc_id) for doc_id in ids]  # type: ignore
 
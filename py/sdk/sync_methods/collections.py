@@ -44,6 +44,8 @@ class CollectionsSDK:
         ids: Optional[list[str | UUID]] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        exact_total: Optional[bool] = False,
     ) -> WrappedCollectionsResponse:
         """List collections with pagination and filtering options.
 
@@ -51,6 +53,8 @@ class CollectionsSDK:
             ids (Optional[list[str | UUID]]): Filter collections by ids
             offset (int, optional): Specifies the number of objects to skip. Defaults to 0.
             limit (int, optional): Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.
+            cursor (Optional[str]): The `next_cursor` of the previous page, to fetch the page after it.
+            exact_total (Optional[bool]): Whether to count `total_entries` exactly rather than estimate it. Defaults to False.
 
         Returns:
             WrappedCollectionsResponse
@@ -58,7 +62,10 @@ class CollectionsSDK:
         params: dict = {
             "offset": offset,
             "limit": limit,
+            "exact_total": exact_total,
         }
+        if cursor:
+            params["cursor"] = cursor  # type: ignore
         if ids:
             params["ids"] = ids
 
@@ -27,6 +27,8 @@ class GraphsSDK:
         collection_ids: Optional[list[str | UUID]] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        exact_total: Optional[bool] = False,
     ) -> WrappedGraphsResponse:
         """List graphs with pagination and filtering options.
 
@@ -34,6 +36,8 @@ class GraphsSDK:
             ids (Optional[list[str | UUID]]): Filter graphs by ids
             offset (int, optional): Specifies the number of objects to skip. Defaults to 0.
             limit (int, optional): Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.
+            cursor (Optional[str]): The `next_cursor` of the previous page, to fetch the page after it.
+            exact_total (Optional[bool]): Whether to count `total_entries` exactly rather than estimate it. Defaults to False.
 
         Returns:
             WrappedGraphsResponse
@@ -41,7 +45,10 @@ class GraphsSDK:
         params: dict = {
             "offset": offset,
             "limit": limit,
+            "exact_total": exact_total,
         }
+        if cursor:
+            params["cursor"] = cursor  # type: ignore
         if collection_ids:
             params["collection_ids"] = collection_ids
 
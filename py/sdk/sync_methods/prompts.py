@@ -39,15 +39,36 @@ class PromptsSDK:
 
         return WrappedGenericMessageResponse(**response_dict)
 
-    def list(self) -> WrappedPromptsResponse:
-        """List all available prompts.
+    def list(
+        self,
+        offset: Optional[int] = 0,
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        exact_total: Optional[bool] = False,
+    ) -> WrappedPromptsResponse:
+        """List available prompts, ordered by name.
+
+        Args:
+            offset (int, optional): Specifies the number of objects to skip. Defaults to 0.
+            limit (int, optional): Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.
+            cursor (Optional[str]): The `next_cursor` of the previous page, to fetch the page after it.
+            exact_total (Optional[bool]): Whether to count `total_entries` exactly rather than estimate it. Defaults to False.
 
         Returns:
-            dict: List of all available prompts
+            dict: List of available prompts
         """
+        params: dict = {
+            "offset": offset,
+            "limit": limit,
+            "exact_total": exact_total,
+        }
+        if cursor:
+            params["cursor"] = cursor
+
         response_dict = self.client._make_request(
             "GET",
             "prompts",
+            params=params,
             version="v3",
         )
 
@@ -1,4 +1,4 @@
-from .base import AsyncSyncMeta, R2RSerializable, syncable
+from .base import AsyncSyncMeta, ExportFormat, R2RSerializable, syncable
 from .document import (
     Document,
     DocumentChunk,
@@ -71,6 +71,7 @@ __all__ = [
     # Base abstractions
     "R2RSerializable",
     "AsyncSyncMeta",
+    "ExportFormat",
     "syncable",
     # Completion abstractions
     "MessageType",
@@ -64,6 +64,20 @@ class R2RSerializable(BaseModel):
         }
 
 
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+    @property
+    def media_type(self) -> str:
+        return {
+            ExportFormat.CSV: "text/csv",
+            ExportFormat.PARQUET: "application/vnd.apache.parquet",
+            ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+        }[self]
+
+
 class AsyncSyncMeta(type):
     _event_loop = None  # Class-level shared event loop
 
@@ -368,6 +368,10 @@ class HybridSearchSettings(R2RSerializable):
     rrf_k: int = Field(
         default=50, description="K-value for RRF (Rank Reciprocal Fusion)"
     )
+    run_concurrently: bool = Field(
+        default=True,
+        description="Whether to run the semantic and full text searches concurrently on separate connections",
+    )
 
 
 class ChunkSearchSettings(R2RSerializable):
@@ -385,6 +389,10 @@ class ChunkSearchSettings(R2RSerializable):
         default=40,
         description="Size of the dynamic candidate list for HNSW index search. Higher increases accuracy but decreases speed.",
     )
+    iterative_scan: bool = Field(
+        default=False,
+        description="Whether filtered searches should keep scanning the vector index until enough rows match the filters. Requires pgvector 0.8 or later.",
+    )
     enabled: bool = Field(
         default=True,
         description="Whether to enable chunk search",
@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
 from pydantic import BaseModel
 
@@ -12,6 +12,8 @@ class R2RResults(BaseModel, Generic[T]):
 class PaginatedR2RResult(BaseModel, Generic[T]):
     results: T
     total_entries: int
+    # Pass as `cursor` to fetch the next page, if there is one.
+    next_cursor: Optional[str] = None
 
 
 class GenericBooleanResponse(BaseModel):
@@ -277,9 +277,17 @@ class SearchResultsCollector:
     Handles both object-oriented and dictionary-based search results.
     """
 
+    # Citations use the first 7 or 8 characters of a result id, so results are
+    # indexed by their first 7.
+    SHORT_ID_PREFIX_LENGTH = 7
+
     def __init__(self):
         # We'll store a list of (source_type, result_obj)
         self._results_in_order = []
+        # Maps an id prefix to (full_id, match, needs_conversion) candidates
+        # for the first `_indexed_count` results, in result order.
+        self._short_id_index: dict[str, list[tuple[str, Any, bool]]] = {}
+        self._indexed_count = 0
 
     @property
     def results(self):
@@ -293,6 +301,8 @@ class SearchResultsCollector:
         Handles the format: [('unknown', {...}), ('unknown', {...})]
         """
         self._results_in_order = []
+        self._short_id_index = {}
+        self._indexed_count = 0
 
         if isinstance(value, list):
             for item in value:
@@ -447,44 +457,76 @@ class SearchResultsCollector:
         # Default when type can't be determined
         return "unknown"
 
+    def _iter_id_candidates(self, source_type, result_obj):
+        """
+        Yield (full_id, match, needs_conversion) for every id a result can be
+        cited by, in the order `find_by_short_id` checks them.
+        """
+        # Check dictionary objects
+        if isinstance(result_obj, dict):
+            if "id" in result_obj:
+                yield str(result_obj["id"]), result_obj, False
+
+        # Special handling for doc with chunks
+        elif source_type == "doc":
+            yield str(result_obj.id), result_obj, False
+            for chunk in getattr(result_obj, "chunks", None) or []:
+                chunk_id = getattr(chunk, "id", None)
+                if chunk_id:
+                    yield str(chunk_id), chunk, False
+
+        # Handle object with id attribute
+        else:
+            obj_id = getattr(result_obj, "id", None)
+            if obj_id:
+                yield str(obj_id), result_obj, True
+
+    def _update_short_id_index(self):
+        """Index results appended since the last lookup by id prefix."""
+        if self._indexed_count > len(self._results_in_order):
+            self._short_id_index = {}
+            self._indexed_count = 0
+
+        for source_type, result_obj in self._results_in_order[
+            self._indexed_count :
+        ]:
+            for candidate in self._iter_id_candidates(source_type, result_obj):
+                prefix = candidate[0][: self.SHORT_ID_PREFIX_LENGTH]
+                self._short_id_index.setdefault(prefix, []).append(candidate)
+        self._indexed_count = len(self._results_in_order)
+
     def find_by_short_id(self, short_id):
         """Find a result by its short ID prefix"""
         if not short_id:
             return None
 
-        for source_type, result_obj in self._results_in_order:
-            # Check dictionary objects
-            if isinstance(result_obj, dict) and "id" in result_obj:
-                result_id = str(result_obj["id"])
-                does_match = result_id.startswith(short_id)
-
-                if does_match:
-                    return result_obj
-
-            # Special handling for doc with chunks
-            elif source_type == "doc":
-                if str(result_obj.id).startswith(short_id):
-                    return result_obj
-                chunks = getattr(result_obj, "chunks", [])
-                if chunks:
-                    for chunk in chunks:
-                        chunk_id = getattr(chunk, "id", None)
-                        if chunk_id and str(chunk_id).startswith(short_id):
-                            return chunk
-
-            # Handle object with id attribute
-            else:
-                obj_id = getattr(result_obj, "id", None)
-                if obj_id and str(obj_id).startswith(short_id):
-                    # Convert to dict if possible
-                    if hasattr(result_obj, "as_dict"):
-                        return result_obj.as_dict()
-                    elif hasattr(result_obj, "model_dump"):
-                        return result_obj.model_dump()
-                    elif hasattr(result_obj, "dict"):
-                        return result_obj.dict()
-                    else:
-                        return result_obj
+        if len(short_id) >= self.SHORT_ID_PREFIX_LENGTH:
+            self._update_short_id_index()
+            candidates = self._short_id_index.get(
+                short_id[: self.SHORT_ID_PREFIX_LENGTH], []
+            )
+        else:
+            candidates = (
+                candidate
+                for source_type, result_obj in self._results_in_order
+                for candidate in self._iter_id_candidates(
+                    source_type, result_obj
+                )
+            )
+
+        for full_id, match, needs_conversion in candidates:
+            if not full_id.startswith(short_id):
+                continue
+            if not needs_conversion:
+                return match
+            # Convert to dict if possible
+            if hasattr(match, "as_dict"):
+                return match.as_dict()
+            elif hasattr(match, "model_dump"):
+                return match.model_dump()
+            elif hasattr(match, "dict"):
+                return match.dict()
+            return match
 
         return None
 
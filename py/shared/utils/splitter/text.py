@@ -27,6 +27,7 @@ import logging
 import pathlib
 import re
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 from io import BytesIO, StringIO
@@ -500,17 +501,25 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             return text
 
     def _merge_splits(
-        self, splits: Iterable[str], separator: str
+        self,
+        splits: Iterable[str],
+        separator: str,
+        lengths: Optional[Iterable[int]] = None,
     ) -> list[str]:
         # We now want to combine these smaller pieces into medium size
         # chunks to send to the LLM.
+        # `lengths` may carry the already measured length of each split.
         separator_len = self._length_function(separator)
+        splits = list(splits)
+        if lengths is None:
+            lengths = map(self._length_function, splits)
 
         docs = []
-        current_doc: list[str] = []
+        # (split, length) pairs of the chunk being built, so each split is
+        # only measured once however long it stays in the overlap window.
+        current_doc: deque[tuple[str, int]] = deque()
         total = 0
-        for d in splits:
-            _len = self._length_function(d)
+        for d, _len in zip(splits, lengths, strict=True):
             if (
                 total + _len + (separator_len if len(current_doc) > 0 else 0)
                 > self._chunk_size
@@ -521,7 +530,9 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                         f"which is longer than the specified {self._chunk_size}"
                     )
                 if len(current_doc) > 0:
-                    doc = self._join_docs(current_doc, separator)
+                    doc = self._join_docs(
+                        [split for split, _ in current_doc], separator
+                    )
                     if doc is not None:
                         docs.append(doc)
                     # Keep on popping if:
@@ -534,13 +545,12 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                         > self._chunk_size
                         and total > 0
                     ):
-                        total -= self._length_function(current_doc[0]) + (
-                            separator_len if len(current_doc) > 1 else 0
+                        total -= current_doc.popleft()[1] + (
+                            separator_len if len(current_doc) > 0 else 0
                         )
-                        current_doc = current_doc[1:]
-            current_doc.append(d)
+            current_doc.append((d, _len))
             total += _len + (separator_len if len(current_doc) > 1 else 0)
-        doc = self._join_docs(current_doc, separator)
+        doc = self._join_docs([split for split, _ in current_doc], separator)
         if doc is not None:
             docs.append(doc)
         return docs
@@ -1266,22 +1276,30 @@ class RecursiveCharacterTextSplitter(TextSplitter):
 
         # Now go merging things, recursively splitting longer texts.
         _good_splits = []
+        _good_lengths = []
         _separator = "" if self._keep_separator else separator
         for s in splits:
-            if self._length_function(s) < self._chunk_size:
+            _len = self._length_function(s)
+            if _len < self._chunk_size:
                 _good_splits.append(s)
+                _good_lengths.append(_len)
             else:
                 if _good_splits:
-                    merged_text = self._merge_splits(_good_splits, _separator)
+                    merged_text = self._merge_splits(
+                        _good_splits, _separator, _good_lengths
+                    )
                     final_chunks.extend(merged_text)
                     _good_splits = []
+                    _good_lengths = []
                 if not new_separators:
                     final_chunks.append(s)
                 else:
                     other_info = self._split_text(s, new_separators)
                     final_chunks.extend(other_info)
         if _good_splits:
-            merged_text = self._merge_splits(_good_splits, _separator)
+            merged_text = self._merge_splits(
+                _good_splits, _separator, _good_lengths
+            )
             final_chunks.extend(merged_text)
         return final_chunks
 
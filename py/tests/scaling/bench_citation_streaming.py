@@ -0,0 +1,134 @@
+"""Measures citation handling while streaming a long answer, comparing a full
+rescan of the accumulated text on every delta with the incremental
+`find_new_citation_spans`, and linear short-id lookups with the prefix index
+in `SearchResultsCollector`.
+
+No database or LLM is needed.
+
+Usage:
+    python tests/scaling/bench_citation_streaming.py --tokens 20000 --results 200
+"""
+
+import argparse
+import random
+import time
+import uuid
+
+from core.base import ChunkSearchResult
+from core.utils import (
+    CitationTracker,
+    SearchResultsCollector,
+    extract_citation_spans,
+    find_new_citation_spans,
+)
+
+
+def make_collector(results: int) -> SearchResultsCollector:
+    collector = SearchResultsCollector()
+    for i in range(results):
+        collector.add_result(
+            ChunkSearchResult(
+                id=uuid.uuid4(),
+                document_id=uuid.uuid4(),
+                owner_id=None,
+                collection_ids=[],
+                score=0.5,
+                text=f"Benchmark chunk {i}",
+                metadata={},
+            ),
+            "chunk",
+        )
+    return collector
+
+
+def make_deltas(
+    tokens: int, collector: SearchResultsCollector, rng: random.Random
+) -> list[str]:
+    short_ids = [str(result.id)[:8] for _, result in collector.results]
+    words = ["the", "retrieved", "context", "shows", "that", "answer", "is"]
+    deltas = []
+    for _ in range(tokens):
+        if rng.random() < 0.02:
+            # Citations usually arrive split over several deltas.
+            citation = f" [{rng.choice(short_ids)}]"
+            deltas.extend([citation[:4], citation[4:]])
+        else:
+            deltas.append(f" {rng.choice(words)}")
+    return deltas
+
+
+def linear_find_by_short_id(collector: SearchResultsCollector, short_id: str):
+    for _, result_obj in collector.results:
+        if str(result_obj.id).startswith(short_id):
+            return result_obj.as_dict()
+    return None
+
+
+def stream_full_rescan(deltas, collector) -> int:
+    tracker = CitationTracker()
+    buffer = ""
+    citations = 0
+    for delta in deltas:
+        buffer += delta
+        for cid, spans in extract_citation_spans(buffer).items():
+            for span in spans:
+                if tracker.is_new_span(cid, span):
+                    citations += 1
+                    if tracker.is_new_citation(cid):
+                        linear_find_by_short_id(collector, cid)
+    return citations
+
+
+def stream_incremental(deltas, collector) -> int:
+    tracker = CitationTracker()
+    buffer = ""
+    citations = 0
+    for delta in deltas:
+        buffer += delta
+        for cid, spans in find_new_citation_spans(buffer, tracker).items():
+            for _ in spans:
+                citations += 1
+                if tracker.is_new_citation(cid):
+                    collector.find_by_short_id(cid)
+    return citations
+
+
+def main(tokens: int, results: int) -> None:
+    rng = random.Random(0)
+    collector = make_collector(results)
+    deltas = make_deltas(tokens, collector, rng)
+
+    for name, stream in (
+        ("full rescan", stream_full_rescan),
+        ("incremental", stream_incremental),
+    ):
+        start = time.perf_counter()
+        citations = stream(deltas, collector)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:>12}: {len(deltas)} deltas, {citations} citations in "
+            f"{elapsed * 1000:,.1f}ms"
+        )
+
+    short_ids = [str(result.id)[:8] for _, result in collector.results]
+    lookups = 10_000
+    for name, lookup in (
+        ("linear", lambda sid: linear_find_by_short_id(collector, sid)),
+        ("indexed", collector.find_by_short_id),
+    ):
+        start = time.perf_counter()
+        for i in range(lookups):
+            lookup(short_ids[i % len(short_ids)])
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:>12}: {lookups} short-id lookups in "
+            f"{elapsed * 1000:,.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=20_000)
+    parser.add_argument("--results", type=int, default=200)
+    args = parser.parse_args()
+    main(args.tokens, args.results)
@@ -0,0 +1,109 @@
+"""Measures how long slicing every community out of a graph takes with
+`CommunityGraphView` against the previous list scans, which filtered all
+entities and relationships once per community.
+
+The synthetic graph has `--entities` entities and `--edges` relationships,
+split into communities of `--community-size` nodes with most edges inside a
+community. The list scans are timed on a sample of communities and
+extrapolated, as running them for every community takes minutes.
+
+Usage:
+    python tests/scaling/bench_community_view.py --entities 50000 --edges 100000
+"""
+
+import argparse
+import random
+import time
+import uuid
+
+from core.base.abstractions import Entity, Relationship
+from core.main.services.graph_service import CommunityGraphView
+
+
+def make_graph(
+    entity_count: int, edge_count: int, community_size: int
+) -> tuple[list[Entity], list[Relationship], list[list[str]]]:
+    rng = random.Random(0)
+    parent_id = uuid.uuid4()
+    names = [f"entity-{i}" for i in range(entity_count)]
+    entities = [
+        Entity(id=uuid.uuid4(), name=name, parent_id=parent_id)
+        for name in names
+    ]
+    communities = [
+        names[i : i + community_size]
+        for i in range(0, entity_count, community_size)
+    ]
+
+    relationships = []
+    for _ in range(edge_count):
+        if rng.random() < 0.9:
+            subject, object_ = rng.sample(rng.choice(communities), 2)
+        else:
+            subject, object_ = rng.sample(names, 2)
+        relationships.append(
+            Relationship(
+                id=uuid.uuid4(),
+                subject=subject,
+                predicate="related_to",
+                object=object_,
+                parent_id=parent_id,
+            )
+        )
+    return entities, relationships, communities
+
+
+def scan_community(
+    nodes: list[str],
+    all_entities: list[Entity],
+    all_relationships: list[Relationship],
+) -> tuple[list[Entity], list[Relationship]]:
+    """The previous slicing, run for each community."""
+    entities = [e for e in all_entities if e.name in nodes]
+    relationships = [
+        r
+        for r in all_relationships
+        if r.subject in nodes and r.object in nodes
+    ]
+    return entities, relationships
+
+
+def main(
+    entity_count: int, edge_count: int, community_size: int, sample: int
+) -> None:
+    entities, relationships, communities = make_graph(
+        entity_count, edge_count, community_size
+    )
+    print(
+        f"{len(entities):,} entities, {len(relationships):,} relationships, "
+        f"{len(communities):,} communities"
+    )
+
+    start = time.perf_counter()
+    view = CommunityGraphView(entities, relationships)
+    slices = [view.community(nodes) for nodes in communities]
+    view_elapsed = time.perf_counter() - start
+
+    sampled = communities[:sample]
+    start = time.perf_counter()
+    scanned = [
+        scan_community(nodes, entities, relationships) for nodes in sampled
+    ]
+    scan_elapsed = (
+        (time.perf_counter() - start) * len(communities) / len(sampled)
+    )
+    assert scanned == slices[: len(sampled)]
+
+    print(f"   list scans: {scan_elapsed:8.2f}s (from {len(sampled)} sampled)")
+    print(f"   graph view: {view_elapsed:8.2f}s including indexing")
+    print(f"      speedup: {scan_elapsed / view_elapsed:8,.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=50_000)
+    parser.add_argument("--edges", type=int, default=100_000)
+    parser.add_argument("--community-size", type=int, default=25)
+    parser.add_argument("--sample", type=int, default=50)
+    args = parser.parse_args()
+    main(args.entities, args.edges, args.community_size, args.sample)
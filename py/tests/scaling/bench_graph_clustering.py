@@ -0,0 +1,82 @@
+"""Measures how long clustering a graph takes with the local worker process
+backend, `GraphClusteringPool`, against the clustering service, which is
+sent every relationship as JSON over HTTP.
+
+Graphs are synthetic: `--edges` edges over communities of
+`--community-size` entities, with one edge in ten crossing communities.
+Each size is clustered with both backends, and the service is skipped when
+`CLUSTERING_SERVICE_URL` is not set.
+
+Usage:
+    CLUSTERING_SERVICE_URL=http://localhost:7276 \
+        python tests/scaling/bench_graph_clustering.py --edges 100000 1000000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+import numpy as np
+
+from core.providers.database.graph_clustering import (
+    EdgeList,
+    GraphClusteringPool,
+)
+from core.providers.database.graphs import PostgresGraphsHandler
+
+
+def synthetic_graph(edge_count: int, community_size: int) -> EdgeList:
+    rng = np.random.default_rng(7272)
+    node_count = max(edge_count // 5, community_size)
+    sources = rng.integers(0, node_count, edge_count)
+    communities = sources // community_size
+    offsets = rng.integers(0, community_size, edge_count)
+    targets = np.minimum(
+        communities * community_size + offsets, node_count - 1
+    )
+    crossing = rng.random(edge_count) < 0.1
+    targets[crossing] = rng.integers(0, node_count, int(crossing.sum()))
+    weights = rng.random(edge_count) + 0.5
+
+    edges = EdgeList()
+    for source, target, weight in zip(
+        sources.tolist(), targets.tolist(), weights.tolist(), strict=True
+    ):
+        edges.add(f"entity-{source}", f"entity-{target}", weight)
+    return edges
+
+
+async def run_benchmark(edge_counts: list[int], community_size: int) -> None:
+    pool = GraphClusteringPool()
+    service = PostgresGraphsHandler(project_name="bench_graph_clustering")
+    backends = [("local", pool.cluster)]
+    if os.environ.get("CLUSTERING_SERVICE_URL"):
+        backends.append(("service", service._call_clustering_service))
+
+    try:
+        # Start the worker before timing anything.
+        await pool.cluster(synthetic_graph(100, community_size), {})
+        for edge_count in edge_counts:
+            edges = synthetic_graph(edge_count, community_size)
+            for name, cluster in backends:
+                start = time.perf_counter()
+                communities = await cluster(edges, {})
+                elapsed = time.perf_counter() - start
+                clusters = len({c["cluster"] for c in communities})
+                print(
+                    f"{edge_count:>9,} edges, {name:>7}: {elapsed:8.2f}s, "
+                    f"{len(edges.names):,} nodes in {clusters:,} clusters"
+                )
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--edges", type=int, nargs="+", default=[100_000, 1_000_000]
+    )
+    parser.add_argument("--community-size", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.edges, args.community_size))
@@ -0,0 +1,91 @@
+"""Measures PDF parsing throughput in pages/sec with `BasicPDFParser` on the
+event loop and through `ParserProcessPool` for a range of worker counts.
+
+Alongside each run a ticker coroutine records the longest stall of the event
+loop, which is what concurrent requests on the same worker would wait.
+Worker start-up is excluded by warming each pool first.
+
+Usage:
+    python tests/scaling/bench_parser_pool.py --copies 5 --workers 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import pathlib
+import time
+from io import BytesIO
+
+from pypdf import PdfReader, PdfWriter
+
+from core.base import AppConfig, IngestionConfig, ParserProcessPool
+from core.parsers import BasicPDFParser
+
+DATA_DIR = pathlib.Path(__file__).parents[2] / "core" / "examples" / "data"
+
+
+def make_pdf(copies: int) -> bytes:
+    writer = PdfWriter()
+    for _ in range(copies):
+        for path in sorted(DATA_DIR.glob("*.pdf")):
+            for page in PdfReader(path).pages:
+                writer.add_page(page)
+    output = BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+async def measure(name: str, pages, page_count: int) -> None:
+    stall = 0.0
+    done = False
+
+    async def ticker() -> None:
+        nonlocal stall
+        while not done:
+            before = time.perf_counter()
+            await asyncio.sleep(0.01)
+            stall = max(stall, time.perf_counter() - before - 0.01)
+
+    ticker_task = asyncio.create_task(ticker())
+    # Let the ticker start sleeping before parsing can block the loop.
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    parsed = [page async for page in pages]
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker_task
+
+    assert len(parsed) == page_count
+    print(
+        f"{name:>12}: {page_count / elapsed:8,.1f} pages/sec, "
+        f"longest event loop stall {stall * 1000:,.0f}ms"
+    )
+
+
+async def main(copies: int, workers: list[int], pages_per_task: int) -> None:
+    data = make_pdf(copies)
+    parser = BasicPDFParser(IngestionConfig(app=AppConfig()), None, None)
+    page_count = len(PdfReader(BytesIO(data)).pages)
+    print(f"{page_count} pages, {len(data) / 2**20:,.1f} MB")
+
+    await measure("event loop", parser.ingest(data), page_count)
+    for count in workers:
+        pool = ParserProcessPool(
+            max_workers=count, pages_per_task=pages_per_task
+        )
+        try:
+            async for _ in pool.ingest(parser, make_pdf(1)):
+                pass
+            await measure(
+                f"{count} workers", pool.ingest(parser, data), page_count
+            )
+        finally:
+            pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--copies", type=int, default=5)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--pages-per-task", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.copies, args.workers, args.pages_per_task))
@@ -0,0 +1,123 @@
+"""Measures `RecursiveCharacterTextSplitter` over the documents in
+`core/examples/data`, comparing the previous `_merge_splits`, which popped
+the overlap window with list slicing and re-measured every split it kept,
+with the current single-pass version.
+
+Both produce the same chunks; the benchmark checks that before reporting.
+A tiktoken length function is used by default since that is where the extra
+measurements hurt most.
+
+Usage:
+    python tests/scaling/bench_text_splitter.py --chunk-size 512 --chunk-overlap 256
+"""
+
+import argparse
+import pathlib
+import time
+from typing import Iterable
+
+import tiktoken
+from pypdf import PdfReader
+
+from shared.utils.splitter.text import RecursiveCharacterTextSplitter
+
+DATA_DIR = pathlib.Path(__file__).parents[2] / "core" / "examples" / "data"
+
+
+class LegacyRecursiveCharacterTextSplitter(RecursiveCharacterTextSplitter):
+    def _merge_splits(
+        self, splits: Iterable[str], separator: str, lengths=None
+    ) -> list[str]:
+        separator_len = self._length_function(separator)
+
+        docs = []
+        current_doc: list[str] = []
+        total = 0
+        for d in splits:
+            _len = self._length_function(d)
+            if (
+                total + _len + (separator_len if len(current_doc) > 0 else 0)
+                > self._chunk_size
+            ):
+                if len(current_doc) > 0:
+                    doc = self._join_docs(current_doc, separator)
+                    if doc is not None:
+                        docs.append(doc)
+                    while total > self._chunk_overlap or (
+                        total
+                        + _len
+                        + (separator_len if len(current_doc) > 0 else 0)
+                        > self._chunk_size
+                        and total > 0
+                    ):
+                        total -= self._length_function(current_doc[0]) + (
+                            separator_len if len(current_doc) > 1 else 0
+                        )
+                        current_doc = current_doc[1:]
+            current_doc.append(d)
+            total += _len + (separator_len if len(current_doc) > 1 else 0)
+        doc = self._join_docs(current_doc, separator)
+        if doc is not None:
+            docs.append(doc)
+        return docs
+
+
+def load_corpus() -> dict[str, str]:
+    corpus = {}
+    for path in sorted(DATA_DIR.iterdir()):
+        if path.suffix == ".pdf":
+            reader = PdfReader(path)
+            corpus[path.name] = "\n\n".join(
+                page.extract_text() or "" for page in reader.pages
+            )
+        elif path.suffix in (".txt", ".html", ".md"):
+            corpus[path.name] = path.read_text(errors="ignore")
+    return corpus
+
+
+def main(chunk_size: int, chunk_overlap: int, length: str) -> None:
+    corpus = load_corpus()
+    print(
+        f"{len(corpus)} documents, "
+        f"{sum(len(text) for text in corpus.values()):,} characters"
+    )
+
+    if length == "tiktoken":
+        encoding = tiktoken.get_encoding("cl100k_base")
+
+        def length_function(text: str) -> int:
+            return len(encoding.encode(text))
+
+    else:
+        length_function = len
+
+    results = {}
+    for name, splitter_cls in (
+        ("legacy", LegacyRecursiveCharacterTextSplitter),
+        ("current", RecursiveCharacterTextSplitter),
+    ):
+        splitter = splitter_cls(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            length_function=length_function,
+        )
+        start = time.perf_counter()
+        results[name] = {
+            doc: splitter.split_text(text) for doc, text in corpus.items()
+        }
+        elapsed = time.perf_counter() - start
+        chunks = sum(len(chunks) for chunks in results[name].values())
+        print(f"{name:>8}: {chunks} chunks in {elapsed:.2f}s")
+
+    assert results["legacy"] == results["current"], "chunks differ"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunk-size", type=int, default=512)
+    parser.add_argument("--chunk-overlap", type=int, default=256)
+    parser.add_argument(
+        "--length", choices=["tiktoken", "characters"], default="tiktoken"
+    )
+    args = parser.parse_args()
+    main(args.chunk_size, args.chunk_overlap, args.length)
@@ -0,0 +1,112 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.base import CredentialCache
+from core.providers.database.tokens import PostgresTokensHandler
+from shared.abstractions import User
+
+
+def make_user() -> User:
+    return User(
+        id=uuid.uuid4(),
+        email="test@example.com",
+        is_active=True,
+        is_verified=True,
+        is_superuser=False,
+    )
+
+
+class BlacklistConnectionManager:
+    """Stands in for Postgres by keeping blacklisted tokens in a list."""
+
+    def __init__(self):
+        self.tokens: list[str] = []
+        self.queries = 0
+
+    async def execute_query(self, query, params=None, isolation_level=None):
+        self.queries += 1
+        if "INSERT" in query:
+            self.tokens.append(params[0])
+        elif "DELETE" in query:
+            self.tokens.clear()
+
+    async def fetch_query(self, query, params=None):
+        self.queries += 1
+        return [{"token": token} for token in self.tokens]
+
+    async def fetchrow_query(self, query, params=None):
+        self.queries += 1
+        return {"?column?": 1} if params[0] in self.tokens else None
+
+
+def test_credential_cache_expiry_and_user_invalidation(monkeypatch):
+    cache = CredentialCache(ttl_seconds=60)
+    user, other_user = make_user(), make_user()
+    cache.set("token-a", user)
+    cache.set("api-key-a", user)
+    cache.set("token-b", other_user)
+    # Credentials that expire before the TTL are cached only until then.
+    cache.set("short-lived", user,
+              datetime.now(timezone.utc) + timedelta(seconds=5))
+
+    assert cache.get("token-a") == user
+    assert cache.get("unknown") is None
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+    assert cache.get("short-lived") is None
+    assert cache.get("token-a") == user
+
+    cache.invalidate_user(user.id)
+    assert cache.get("token-a") is None
+    assert cache.get("api-key-a") is None
+    assert cache.get("token-b") == other_user
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 120)
+    assert cache.get("token-b") is None
+    assert len(cache) == 0
+
+
+def test_credential_cache_is_bounded():
+    cache = CredentialCache(ttl_seconds=60, max_entries=2)
+    user = make_user()
+    for credential in ("a", "b", "c"):
+        cache.set(credential, user)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == user
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_blacklist_mirror():
+    connection_manager = BlacklistConnectionManager()
+    handler = PostgresTokensHandler("test", connection_manager)
+    connection_manager.tokens.append("revoked-elsewhere")
+
+    # The first mirrored check loads the table; later ones stay in memory.
+    assert not await handler.is_token_blacklisted("fresh",
+                                                  max_staleness_seconds=60)
+    assert await handler.is_token_blacklisted("revoked-elsewhere",
+                                              max_staleness_seconds=60)
+    queries = connection_manager.queries
+    for _ in range(10):
+        assert not await handler.is_token_blacklisted(
+            "fresh", max_staleness_seconds=60)
+    assert connection_manager.queries == queries
+
+    # Tokens blacklisted by this process are visible immediately.
+    await handler.blacklist_token("fresh")
+    assert await handler.is_token_blacklisted("fresh",
+                                              max_staleness_seconds=60)
+
+    # Without a staleness bound misses still go to Postgres.
+    assert not await handler.is_token_blacklisted("other")
+    assert connection_manager.queries == queries + 2
+
+    await handler.clean_expired_blacklisted_tokens()
+    assert not await handler.is_token_blacklisted("fresh",
+                                                  max_staleness_seconds=60)
@@ -5,6 +5,11 @@ from typing import AsyncGenerator, Optional, Tuple
 
 import pytest
 
+from core.base import Vector, VectorEntry, VectorType
+from core.providers.database.chunks import (
+    decode_vector_binary,
+    encode_vector_binary,
+)
 from r2r import R2RAsyncClient, R2RException
 
 
@@ -300,5 +305,97 @@ class TestChunks:
             await test_client.logout_user()
 
 
+def test_vector_binary_round_trip():
+    vector = [0.25, -1.5, 3.0, 0.0]
+    encoded = encode_vector_binary(vector)
+    assert encoded[:4] == b"\x00\x04\x00\x00"
+    assert decode_vector_binary(encoded) == vector
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_entries(chunks_handler):
+    document_id = uuid.uuid4()
+    owner_id = uuid.uuid4()
+
+    def make_entry(chunk_id: uuid.UUID, text: str) -> VectorEntry:
+        return VectorEntry(
+            id=chunk_id,
+            document_id=document_id,
+            owner_id=owner_id,
+            collection_ids=[],
+            vector=Vector(data=[0.1, 0.2, 0.3, 0.4], type=VectorType.FIXED),
+            text=text,
+            metadata={"chunk_order": 0},
+        )
+
+    repeated_id = uuid.uuid4()
+    entries = [
+        make_entry(uuid.uuid4(), "first"),
+        make_entry(repeated_id, "stale"),
+        make_entry(repeated_id, "fresh"),
+    ]
+    await chunks_handler.bulk_upsert_entries(entries)
+
+    chunk = await chunks_handler.get_chunk(repeated_id)
+    assert chunk["text"] == "fresh"
+
+    listed = await chunks_handler.list_document_chunks(document_id,
+                                                       offset=0,
+                                                       limit=10,
+                                                       include_vectors=True)
+    assert listed["total_entries"] == 2
+    assert listed["results"][0]["vector"] == pytest.approx(
+        [0.1, 0.2, 0.3, 0.4])
+
+    # Re-running the bulk load updates rows in place.
+    await chunks_handler.bulk_upsert_entries(
+        [make_entry(repeated_id, "updated")])
+    chunk = await chunks_handler.get_chunk(repeated_id)
+    assert chunk["text"] == "updated"
+
+    await chunks_handler.delete({"document_id": {"$eq": str(document_id)}})
+
+
+
+@pytest.mark.asyncio
+async def test_chunk_counts_and_limits(chunks_handler):
+    document_id = uuid.uuid4()
+    owner_id = uuid.uuid4()
+
+    def make_entry(chunk_id: uuid.UUID) -> VectorEntry:
+        return VectorEntry(
+            id=chunk_id,
+            document_id=document_id,
+            owner_id=owner_id,
+            collection_ids=[],
+            vector=Vector(data=[0.1, 0.2, 0.3, 0.4], type=VectorType.FIXED),
+            text="counted",
+            metadata={},
+        )
+
+    chunk_ids = [uuid.uuid4() for _ in range(3)]
+    await chunks_handler.upsert_entries([make_entry(i) for i in chunk_ids],
+                                        max_chunks={owner_id: 3})
+    assert await chunks_handler.get_chunk_count(owner_id) == 3
+
+    # Replacing existing chunks does not count against the limit.
+    await chunks_handler.bulk_upsert_entries(
+        [make_entry(chunk_ids[0])], max_chunks={owner_id: 3})
+    assert await chunks_handler.get_chunk_count(owner_id) == 3
+
+    with pytest.raises(R2RException):
+        await chunks_handler.bulk_upsert_entries(
+            [make_entry(uuid.uuid4())], max_chunks={owner_id: 3})
+    assert await chunks_handler.get_chunk_count(owner_id) == 3
+
+    await chunks_handler.delete({"document_id": {"$eq": str(document_id)}})
+    assert await chunks_handler.get_chunk_count(owner_id) == 0
+
+    await chunks_handler.bulk_upsert_entries(
+        [make_entry(uuid.uuid4()) for _ in range(2)])
+    assert await chunks_handler.get_chunk_count(owner_id) == 2
+    await chunks_handler.delete_user_vector(owner_id)
+    assert await chunks_handler.get_chunk_count(owner_id) == 0
+
 if __name__ == "__main__":
     pytest.main(["-v", "--asyncio-mode=auto"])
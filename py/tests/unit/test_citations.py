@@ -0,0 +1,85 @@
+import random
+import uuid
+
+from core.base import ChunkSearchResult
+from core.utils import (
+    CitationTracker,
+    SearchResultsCollector,
+    extract_citation_spans,
+    find_new_citation_spans,
+)
+
+
+def test_incremental_scan_matches_full_scan():
+    rng = random.Random(0)
+    ids = [uuid.uuid4().hex[:rng.choice((7, 8))] for _ in range(20)]
+    words = ["The", "answer", "is", "here.", "[", "]", "[abc]"]
+    text = " ".join(
+        f"[{rng.choice(ids)}]" if rng.random() < 0.2 else rng.choice(words)
+        for _ in range(2_000))
+
+    tracker = CitationTracker()
+    found: dict = {}
+    position = 0
+    while position < len(text):
+        # Small deltas regularly split citations across chunks.
+        position += rng.randint(1, 6)
+        for cid, spans in find_new_citation_spans(text[:position],
+                                                  tracker).items():
+            found.setdefault(cid, []).extend(spans)
+
+    assert found == extract_citation_spans(text)
+
+
+def test_scan_restarts_after_buffer_reset():
+    tracker = CitationTracker()
+    first = "Some text before a tool call [abcdefg1]"
+    assert find_new_citation_spans(first, tracker) == {
+        "abcdefg1": [(29, 39)]
+    }
+
+    tracker.reset_scan()
+    assert find_new_citation_spans("[bcdefgh2] and more text", tracker) == {
+        "bcdefgh2": [(0, 10)]
+    }
+
+
+def test_find_by_short_id_uses_prefix_index():
+    chunks = [
+        ChunkSearchResult(
+            id=uuid.uuid4(),
+            document_id=uuid.uuid4(),
+            owner_id=None,
+            collection_ids=[],
+            score=0.5,
+            text=f"chunk {i}",
+            metadata={},
+        ) for i in range(50)
+    ]
+    web = {
+        "id": "web12345-result",
+        "title": "t",
+        "link": "l",
+        "snippet": "s"
+    }
+    collector = SearchResultsCollector()
+    for chunk in chunks[:25]:
+        collector.add_result(chunk, "chunk")
+
+    target = chunks[10]
+    assert collector.find_by_short_id(str(target.id)[:8]) == target.as_dict()
+
+    # Results added after the first lookup are indexed on the next one.
+    for chunk in chunks[25:]:
+        collector.add_result(chunk, "chunk")
+    collector.add_result(web)
+    assert collector.find_by_short_id(str(chunks[40].id)[:7]) == chunks[
+        40].as_dict()
+    assert collector.find_by_short_id("web1234") is web
+    assert collector.find_by_short_id("zzzzzzz") is None
+
+    # Replacing the results rebuilds the index.
+    collector.results = [("chunk", chunks[0])]
+    assert collector.find_by_short_id(str(chunks[40].id)[:8]) is None
+    assert collector.find_by_short_id(str(chunks[0].id)[:8]) == chunks[
+        0].as_dict()
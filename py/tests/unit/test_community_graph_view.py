@@ -0,0 +1,38 @@
+import uuid
+
+from core.base.abstractions import Entity, Relationship
+from core.main.services.graph_service import CommunityGraphView
+
+
+def _relationship(subject: str, object_: str) -> Relationship:
+    return Relationship(
+        id=uuid.uuid4(),
+        subject=subject,
+        predicate="related_to",
+        object=object_,
+    )
+
+
+def test_community_slices_match_scans():
+    entities = [
+        Entity(id=uuid.uuid4(), name=name)
+        for name in ["a", "b", "c", "a", "d"]
+    ]
+    relationships = [
+        _relationship("a", "b"),
+        _relationship("b", "d"),
+        _relationship("c", "a"),
+        _relationship("a", "a"),
+        _relationship("b", "a"),
+    ]
+    view = CommunityGraphView(entities, relationships)
+
+    for nodes in [["a", "b"], ["c", "a"], ["d"], ["x"], ["b", "a", "b"]]:
+        community_entities, community_relationships = view.community(nodes)
+        assert community_entities == [
+            e for e in entities if e.name in nodes
+        ]
+        assert community_relationships == [
+            r for r in relationships
+            if r.subject in nodes and r.object in nodes
+        ]
@@ -1,5 +1,9 @@
+import csv
+import io
 import json
 import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -8,7 +12,12 @@ from core.base import (
     DocumentType,
     GraphExtractionStatus,
     IngestionStatus,
+    R2RException,
+    Vector,
+    VectorEntry,
+    VectorType,
 )
+from core.main.services.management_service import ManagementService
 
 
 def make_db_entry(doc: DocumentResponse):
@@ -145,3 +154,241 @@ async def test_delete_document(documents_handler):
     res = await documents_handler.get_documents_overview(
         offset=0, limit=10, filter_document_ids=[doc_id])
     assert res["total_entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_export_documents_csv(documents_handler):
+    doc_id = uuid.uuid4()
+    doc = DocumentResponse(
+        id=doc_id,
+        collection_ids=[],
+        owner_id=uuid.uuid4(),
+        document_type=DocumentType.TXT,
+        metadata={},
+        title='Quoted "Export" Doc',
+        version="v1",
+        size_in_bytes=42,
+        ingestion_status=IngestionStatus.SUCCESS,
+        extraction_status=GraphExtractionStatus.PENDING,
+        created_at=None,
+        updated_at=None,
+        summary=None,
+        summary_embedding=None,
+    )
+    await documents_handler.upsert_documents_overview([doc])
+
+    chunks = await documents_handler.export(
+        columns=["title", "id", "size_in_bytes"],
+        filters={"id": {
+            "$eq": str(doc_id)
+        }},
+    )
+    data = b"".join([chunk async for chunk in chunks]).decode()
+
+    rows = list(csv.reader(io.StringIO(data)))
+    assert rows == [
+        ["title", "id", "size_in_bytes"],
+        ['Quoted "Export" Doc', str(doc_id), "42"],
+    ]
+
+    await documents_handler.delete(doc_id)
+
+
+@pytest.mark.asyncio
+async def test_delete_by_chunk_filter(db_provider):
+    documents_handler = db_provider.documents_handler
+    chunks_handler = db_provider.chunks_handler
+    owner_id = uuid.uuid4()
+
+    doc_ids = {}
+    for tag in ["A", "B"]:
+        doc_id = uuid.uuid4()
+        doc_ids[tag] = doc_id
+        await documents_handler.upsert_documents_overview([
+            DocumentResponse(
+                id=doc_id,
+                collection_ids=[],
+                owner_id=owner_id,
+                document_type=DocumentType.TXT,
+                metadata={"tag": tag},
+                title=f"Doc {tag}",
+                version="v1",
+                size_in_bytes=10,
+                ingestion_status=IngestionStatus.SUCCESS,
+                extraction_status=GraphExtractionStatus.PENDING,
+                created_at=None,
+                updated_at=None,
+                summary=None,
+                summary_embedding=None,
+            )
+        ])
+        await chunks_handler.bulk_upsert_entries([
+            VectorEntry(
+                id=uuid.uuid4(),
+                document_id=doc_id,
+                owner_id=owner_id,
+                collection_ids=[],
+                vector=Vector(data=[0.1, 0.2, 0.3, 0.4],
+                              type=VectorType.FIXED),
+                text=f"Chunk {i} of {tag}",
+                metadata={"tag": tag},
+            ) for i in range(25)
+        ])
+
+    with pytest.raises(R2RException) as exc_info:
+        await documents_handler.delete_by_chunk_filter(
+            filters={"tag": {
+                "$eq": "A"
+            }},
+            owner_id=str(uuid.uuid4()),
+        )
+    assert exc_info.value.status_code == 404
+
+    deleted_ids, deleted_chunks = await documents_handler.delete_by_chunk_filter(
+        filters={"tag": {
+            "$eq": "A"
+        }},
+        owner_id=str(owner_id),
+        batch_size=1,
+        chunk_batch_size=10,
+    )
+    assert deleted_ids == [doc_ids["A"]]
+    assert deleted_chunks == 25
+
+    res = await documents_handler.get_documents_overview(
+        offset=0, limit=10, filter_document_ids=list(doc_ids.values()))
+    assert [d.id for d in res["results"]] == [doc_ids["B"]]
+    remaining = await chunks_handler.list_document_chunks(doc_ids["B"],
+                                                          offset=0,
+                                                          limit=100)
+    assert remaining["total_entries"] == 25
+    assert await chunks_handler.get_chunk_count(owner_id) == 25
+
+    await documents_handler.delete_by_chunk_filter(
+        filters={}, document_ids=[doc_ids["B"]])
+    assert await chunks_handler.get_chunk_count(owner_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_single_chunk_keeps_document(db_provider):
+    management = ManagementService(config=MagicMock(),
+                                   providers=SimpleNamespace(
+                                       database=db_provider))
+    documents_handler = db_provider.documents_handler
+    chunks_handler = db_provider.chunks_handler
+    owner_id = uuid.uuid4()
+    doc_id = uuid.uuid4()
+
+    await documents_handler.upsert_documents_overview([
+        DocumentResponse(
+            id=doc_id,
+            collection_ids=[],
+            owner_id=owner_id,
+            document_type=DocumentType.TXT,
+            metadata={},
+            title="Single chunk delete",
+            version="v1",
+            size_in_bytes=10,
+            ingestion_status=IngestionStatus.SUCCESS,
+            extraction_status=GraphExtractionStatus.PENDING,
+            created_at=None,
+            updated_at=None,
+            summary=None,
+            summary_embedding=None,
+        )
+    ])
+    await db_provider.files_handler.store_file(doc_id, "doc.txt",
+                                               io.BytesIO(b"contents"),
+                                               "text/plain")
+    chunk_ids = [uuid.uuid4() for _ in range(3)]
+    await chunks_handler.bulk_upsert_entries([
+        VectorEntry(
+            id=chunk_id,
+            document_id=doc_id,
+            owner_id=owner_id,
+            collection_ids=[],
+            vector=Vector(data=[0.1, 0.2, 0.3, 0.4], type=VectorType.FIXED),
+            text="chunk",
+            metadata={},
+        ) for chunk_id in chunk_ids
+    ])
+
+    # The filter the DELETE /chunks/{id} route builds.
+    result = await management.delete_chunks_by_filter({
+        "$and": [
+            {"owner_id": {"$eq": str(owner_id)}},
+            {"chunk_id": {"$eq": str(chunk_ids[0])}},
+        ]
+    })
+    assert result["deleted_chunks_count"] == 1
+
+    remaining = await chunks_handler.list_document_chunks(doc_id,
+                                                          offset=0,
+                                                          limit=10)
+    assert {c["id"] for c in remaining["results"]} == set(chunk_ids[1:])
+    _, file_content, _ = await db_provider.files_handler.retrieve_file(doc_id)
+    assert file_content.read() == b"contents"
+    overview = await documents_handler.get_documents_overview(
+        offset=0, limit=1, filter_document_ids=[doc_id])
+    assert [d.id for d in overview["results"]] == [doc_id]
+
+    await documents_handler.delete_by_chunk_filter(filters={},
+                                                   document_ids=[doc_id])
+
+
+@pytest.mark.asyncio
+async def test_documents_overview_cursor_pagination(documents_handler):
+    owner_id = uuid.uuid4()
+    docs = [
+        DocumentResponse(
+            id=uuid.uuid4(),
+            collection_ids=[],
+            owner_id=owner_id,
+            document_type=DocumentType.TXT,
+            metadata={},
+            title=f"Page Doc {i}",
+            version="v1",
+            size_in_bytes=i,
+            ingestion_status=IngestionStatus.SUCCESS,
+            extraction_status=GraphExtractionStatus.PENDING,
+            created_at=None,
+            updated_at=None,
+            summary=None,
+            summary_embedding=None,
+        ) for i in range(7)
+    ]
+    # Created in one statement, so the documents share a creation time and
+    # only their ids order them.
+    await documents_handler.upsert_documents_overview(docs)
+
+    pages, cursor = [], None
+    while True:
+        page = await documents_handler.get_documents_overview(
+            offset=0,
+            limit=3,
+            filter_user_ids=[owner_id],
+            cursor=cursor,
+        )
+        assert page["total_entries"] == 7
+        pages.append([d.id for d in page["results"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    by_offset = await documents_handler.get_documents_overview(
+        offset=0, limit=-1, filter_user_ids=[owner_id])
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert sum(pages, []) == [d.id for d in by_offset["results"]]
+    assert by_offset["next_cursor"] is None
+
+    estimated = await documents_handler.get_documents_overview(
+        offset=3, limit=3, filter_user_ids=[owner_id], exact_total=False)
+    assert estimated["total_entries"] == 7
+
+    with pytest.raises(R2RException):
+        await documents_handler.get_documents_overview(offset=0,
+                                                       limit=3,
+                                                       cursor="not-a-cursor")
+
+    for doc in docs:
+        await documents_handler.delete(doc.id)
@@ -0,0 +1,190 @@
+import asyncio
+import time
+from typing import Any, Optional
+
+import pytest
+
+from core.base import (
+    AppConfig,
+    EmbeddingBatchingSettings,
+    EmbeddingCache,
+    EmbeddingCacheSettings,
+    EmbeddingConfig,
+    EmbeddingProvider,
+    EmbeddingPurpose,
+)
+
+
+class FakeEmbeddingProvider(EmbeddingProvider):
+    """Embeds a text as [len(text), number of calls so far]."""
+
+    def __init__(self, config: EmbeddingConfig):
+        super().__init__(config)
+        self.requests: list[list[str]] = []
+
+    async def _execute_task(self, task: dict[str, Any]):
+        self.requests.append(list(task["texts"]))
+        return [[float(len(text)), float(len(self.requests))]
+                for text in task["texts"]]
+
+    def _execute_task_sync(self, task: dict[str, Any]):
+        raise NotImplementedError
+
+    async def async_get_embedding(self, text, stage=EmbeddingProvider.Step.BASE,
+                                  purpose=EmbeddingPurpose.INDEX, **kwargs):
+        task = {
+            "texts": [text],
+            "stage": stage,
+            "purpose": purpose,
+            "kwargs": kwargs,
+        }
+        return (await self._execute_with_backoff_async(task))[0]
+
+    async def async_get_embeddings(self, texts,
+                                   stage=EmbeddingProvider.Step.BASE,
+                                   purpose=EmbeddingPurpose.INDEX, **kwargs):
+        task = {
+            "texts": texts,
+            "stage": stage,
+            "purpose": purpose,
+            "kwargs": kwargs,
+        }
+        return await self._execute_with_backoff_async(task)
+
+    def rerank(self, query, results, stage=EmbeddingProvider.Step.RERANK,
+               limit=10):
+        return results[:limit]
+
+    async def arerank(self, query, results,
+                      stage=EmbeddingProvider.Step.RERANK, limit=10):
+        return results[:limit]
+
+
+def make_provider(batching_settings: Optional[
+    EmbeddingBatchingSettings] = None,
+                  **cache_settings) -> FakeEmbeddingProvider:
+    return FakeEmbeddingProvider(
+        EmbeddingConfig(
+            app=AppConfig(),
+            provider="litellm",
+            base_model="test/model",
+            base_dimension=2,
+            cache_settings=EmbeddingCacheSettings(**{
+                "enabled": True,
+                **cache_settings
+            }),
+            batching_settings=batching_settings
+            or EmbeddingBatchingSettings(),
+        ))
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_reuses_normalized_queries():
+    provider = make_provider()
+
+    first = await provider.async_get_embedding(
+        "what is r2r", purpose=EmbeddingPurpose.QUERY)
+    second = await provider.async_get_embedding(
+        "  what   is r2r ", purpose=EmbeddingPurpose.QUERY)
+
+    assert first == second
+    assert provider.requests == [["what is r2r"]]
+    assert provider.cache.stats()["hits"] == 1
+
+    # A different purpose is a different cache entry.
+    await provider.async_get_embedding("what is r2r",
+                                       purpose=EmbeddingPurpose.INDEX)
+    assert len(provider.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_only_requests_missing_texts():
+    provider = make_provider()
+    await provider.async_get_embedding("a")
+
+    vectors = await provider.async_get_embeddings(["a", "bb", "ccc"])
+
+    assert provider.requests[-1] == ["bb", "ccc"]
+    assert [vector[0] for vector in vectors] == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_bypassed_with_kwargs():
+    provider = make_provider()
+    await provider.async_get_embedding("a")
+    await provider.async_get_embedding("a", dimensions=1)
+    assert len(provider.requests) == 2
+
+
+def test_embedding_cache_eviction_and_compact_storage():
+    cache = EmbeddingCache(
+        EmbeddingCacheSettings(enabled=True,
+                               max_entries=2,
+                               storage_dtype="float16"))
+    keys = [EmbeddingCache.make_key("m", "s", "p", str(i)) for i in range(3)]
+    for key in keys:
+        cache.set(key, [0.5, 0.25])
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == [0.5, 0.25]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_embedding_cache_ttl(monkeypatch):
+    cache = EmbeddingCache(
+        EmbeddingCacheSettings(enabled=True, ttl_seconds=60))
+    key = EmbeddingCache.make_key("m", "s", "p", "text")
+    cache.set(key, [1.0])
+    assert cache.get(key) == [1.0]
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 120)
+    assert cache.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_batching_coalesces_concurrent_requests():
+    provider = make_provider(batching_settings=EmbeddingBatchingSettings(
+        enabled=True, window_ms=20, max_batch_size=64),
+                             enabled=False)
+
+    texts = ["a", "bb", "a", "ccc", "bb"]
+    vectors = await asyncio.gather(
+        *(provider.async_get_embedding(text) for text in texts))
+
+    assert provider.requests == [["a", "bb", "ccc"]]
+    assert [vector[0] for vector in vectors] == [1.0, 2.0, 1.0, 3.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_batching_flushes_full_batches_immediately():
+    provider = make_provider(batching_settings=EmbeddingBatchingSettings(
+        enabled=True, window_ms=10_000, max_batch_size=2),
+                             enabled=False)
+
+    vectors = await asyncio.wait_for(
+        asyncio.gather(provider.async_get_embedding("a"),
+                       provider.async_get_embedding("bb")),
+        timeout=1,
+    )
+
+    assert provider.requests == [["a", "bb"]]
+    assert [vector[0] for vector in vectors] == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_batching_propagates_errors():
+    provider = make_provider(batching_settings=EmbeddingBatchingSettings(
+        enabled=True, window_ms=5),
+                             enabled=False)
+    provider.config.max_retries = 1
+
+    async def fail(task):
+        raise RuntimeError("provider down")
+
+    provider._execute_task = fail
+
+    results = await asyncio.gather(provider.async_get_embedding("a"),
+                                   provider.async_get_embedding("b"),
+                                   return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,46 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from core.providers.database.export import _arrow_type, _to_record_batch
+
+pa = pytest.importorskip("pyarrow")
+
+
+def _schema(columns: list[tuple[str, str]]):
+    return pa.schema([(name, _arrow_type(pa, type_name))
+                      for name, type_name in columns])
+
+
+def test_record_batch_converts_postgres_values():
+    schema = _schema([
+        ("id", "uuid"),
+        ("collection_ids", "_uuid"),
+        ("tags", "_text"),
+        ("metadata", "jsonb"),
+        ("total", "numeric"),
+        ("created_at", "timestamptz"),
+    ])
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rows = [
+        (ids[0], ids, ["a", None], json.dumps({"a": 1}),
+         Decimal("12345678901234567890.123456789"), created_at),
+        (ids[1], None, [], None, None, None),
+    ]
+
+    batch = _to_record_batch(pa, schema, rows)
+
+    assert batch.schema.field("collection_ids").type == pa.list_(
+        pa.string())
+    assert batch.to_pydict() == {
+        "id": [str(ids[0]), str(ids[1])],
+        "collection_ids": [[str(i) for i in ids], None],
+        "tags": [["a", None], []],
+        "metadata": ['{"a": 1}', None],
+        "total": ["12345678901234567890.123456789", None],
+        "created_at": [created_at, None],
+    }
@@ -0,0 +1,87 @@
+import hashlib
+import io
+import os
+import uuid
+import zipfile
+
+import pytest
+
+from core.base import R2RException
+
+
+async def iter_chunks(content: bytes, size: int):
+    for i in range(0, len(content), size):
+        yield content[i:i + size]
+
+
+@pytest.fixture
+async def files_handler(db_provider):
+    handler = db_provider.files_handler
+    chunk_size = handler.chunk_size
+    handler.chunk_size = 64 * 1024
+    yield handler
+    handler.chunk_size = chunk_size
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("length", [1000, 64 * 1024, 300 * 1024 + 7])
+async def test_store_file_stream(files_handler, length):
+    document_id = uuid.uuid4()
+    content = os.urandom(length)
+
+    size, content_hash = await files_handler.store_file_stream(
+        document_id,
+        "upload.bin",
+        iter_chunks(content, 10_000),
+        "application/octet-stream",
+        max_size=length,
+    )
+
+    assert size == length
+    assert content_hash == hashlib.sha256(content).hexdigest()
+    _, file_content, stored_size = await files_handler.retrieve_file(
+        document_id)
+    assert stored_size == length
+    assert file_content.read() == content
+
+    await files_handler.delete_file(document_id)
+
+
+@pytest.mark.asyncio
+async def test_store_file_stream_enforces_max_size(files_handler):
+    document_id = uuid.uuid4()
+    content = os.urandom(200 * 1024)
+
+    with pytest.raises(R2RException) as exc_info:
+        await files_handler.store_file_stream(
+            document_id,
+            "upload.bin",
+            iter_chunks(content, 10_000),
+            max_size=len(content) - 1,
+        )
+
+    assert exc_info.value.status_code == 413
+    with pytest.raises(R2RException) as exc_info:
+        await files_handler.retrieve_file(document_id)
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_stream_files_as_zip(files_handler):
+    files = {uuid.uuid4(): os.urandom(length) for length in (10, 200 * 1024)}
+    for document_id, content in files.items():
+        await files_handler.store_file_stream(
+            document_id, f"{document_id}.bin", iter_chunks(content, 10_000))
+
+    zip_name, chunks = await files_handler.stream_files_as_zip(
+        document_ids=list(files))
+    data = b"".join([chunk async for chunk in chunks])
+
+    assert zip_name.endswith(".zip")
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        for document_id, content in files.items():
+            assert archive.read(f"{document_id}.bin") == content
+
+    for document_id in files:
+        await files_handler.delete_file(document_id)
@@ -0,0 +1,70 @@
+import uuid
+
+import pytest
+
+from core.base.abstractions import Relationship
+from core.providers.database.graph_clustering import (
+    EdgeList,
+    GraphClusteringPool,
+)
+
+
+def _relationship(subject: str, object_: str,
+                  weight: float | None = None) -> Relationship:
+    return Relationship(
+        id=uuid.uuid4(),
+        subject=subject,
+        predicate="related_to",
+        object=object_,
+        weight=weight,
+    )
+
+
+def test_edge_list_from_relationships():
+    edges = EdgeList.from_relationships([
+        _relationship("a", "b", 2.0),
+        _relationship("b", "c"),
+        _relationship("c", "a", 0.5),
+    ])
+
+    assert len(edges) == 3
+    assert edges.names == ["a", "b", "c"]
+    sources, targets, weights = edges.arrays()
+    assert sources.tolist() == [0, 1, 2]
+    assert targets.tolist() == [1, 2, 0]
+    assert weights.tolist() == [2.0, 1.0, 0.5]
+
+
+def test_edge_list_empty():
+    edges = EdgeList()
+
+    assert len(edges) == 0
+    assert [array.tolist() for array in edges.arrays()] == [[], [], []]
+
+
+@pytest.mark.asyncio
+async def test_local_clustering_assigns_every_node():
+    pytest.importorskip("graspologic")
+    relationships = [
+        _relationship(f"{group}{i}", f"{group}{j}") for group in "xy"
+        for i in range(5) for j in range(i + 1, 5)
+    ]
+    relationships.append(_relationship("x0", "y0"))
+
+    pool = GraphClusteringPool()
+    try:
+        communities = await pool.cluster(
+            EdgeList.from_relationships(relationships), {})
+    finally:
+        pool.shutdown()
+
+    assert {c["node"] for c in communities if c["level"] == 0} == {
+        f"{group}{i}"
+        for group in "xy" for i in range(5)
+    }
+    clusters = {
+        c["node"]: c["cluster"]
+        for c in communities if c["level"] == 0
+    }
+    assert len({clusters[f"x{i}"] for i in range(5)}) == 1
+    assert clusters["x1"] != clusters["y1"]
@@ -3,6 +3,7 @@ from enum import Enum
 
 import pytest
 
+from core.base.abstractions import Entity, Relationship
 from core.base.api.models import GraphResponse
 
 
@@ -261,6 +262,50 @@ async def test_update_graph(graphs_handler):
     assert fetched_graph.description == "NewDescription"
 
 
+@pytest.mark.asyncio
+async def test_list_graphs_latest_per_collection_with_cursor(graphs_handler):
+    coll_ids = [uuid.uuid4() for _ in range(3)]
+    latest = []
+    for coll_id in coll_ids:
+        await graphs_handler.connection_manager.execute_query(
+            f"""
+            INSERT INTO "{graphs_handler.project_name}"."graphs"
+            (id, collection_id, name, status, created_at)
+            VALUES ($1, $2, 'Older', 'pending', NOW() - INTERVAL '1 day')
+            """,
+            [uuid.uuid4(), coll_id],
+        )
+        latest.append(await graphs_handler.create(collection_id=coll_id,
+                                                  name="Latest"))
+
+    graph_ids = [g.id for g in latest]
+    first = await graphs_handler.list_graphs(offset=0,
+                                             limit=2,
+                                             filter_graph_ids=graph_ids,
+                                             exact_total=False)
+    second = await graphs_handler.list_graphs(offset=0,
+                                              limit=2,
+                                              filter_graph_ids=graph_ids,
+                                              cursor=first["next_cursor"],
+                                              exact_total=False)
+    assert first["total_entries"] == 3
+    assert [g.id for g in first["results"] + second["results"]
+            ] == [g.id for g in reversed(latest)]
+
+    # Estimated and exact totals both count collections, not graph rows.
+    estimated = await graphs_handler.list_graphs(offset=0,
+                                                 limit=1,
+                                                 exact_total=False)
+    exact = await graphs_handler.list_graphs(offset=0, limit=1)
+    assert estimated["total_entries"] == exact["total_entries"]
+
+    # Only the latest graph of each collection is listed.
+    for coll_id, graph in zip(coll_ids, latest, strict=True):
+        overview = await graphs_handler.list_graphs(
+            offset=0, limit=10, filter_collection_id=coll_id)
+        assert [g.id for g in overview["results"]] == [graph.id]
+
+
 @pytest.mark.asyncio
 async def test_bulk_entities(graphs_handler):
     coll_id = uuid.uuid4()
@@ -304,6 +349,99 @@ async def test_bulk_entities(graphs_handler):
         assert ent["name"] in fetched_names
 
 
+@pytest.mark.asyncio
+async def test_create_many_entities_and_relationships(graphs_handler):
+    coll_id = uuid.uuid4()
+    graph_resp = await graphs_handler.create(collection_id=coll_id,
+                                             name="CreateMany")
+    graph_id = graph_resp.id
+
+    entities = await graphs_handler.entities.create_many(
+        [
+            Entity(name=f"Entity{i}",
+                   category="Category",
+                   parent_id=graph_id,
+                   metadata={"i": i}) for i in range(50)
+        ],
+        store_type=StoreType.GRAPHS,
+    )
+    assert [e.name for e in entities] == [f"Entity{i}" for i in range(50)]
+    assert len({e.id for e in entities}) == 50
+
+    relationships = await graphs_handler.relationships.create_many(
+        [
+            Relationship(
+                subject=subject.name,
+                subject_id=subject.id,
+                predicate="next",
+                object=object_.name,
+                object_id=object_.id,
+                parent_id=graph_id,
+            ) for subject, object_ in zip(
+                entities, entities[1:], strict=False)
+        ],
+        store_type=StoreType.GRAPHS,
+    )
+    assert len(relationships) == 49
+
+    ents, total = await graphs_handler.get_entities(parent_id=graph_id,
+                                                    offset=0,
+                                                    limit=100)
+    assert total == 50
+    by_id = {e.id: e for e in ents}
+    assert by_id[entities[7].id].name == "Entity7"
+    assert by_id[entities[7].id].metadata == {"i": 7}
+
+    rels, total_rels = await graphs_handler.relationships.get(
+        parent_id=graph_id,
+        store_type=StoreType.GRAPHS,
+        offset=0,
+        limit=100)
+    assert total_rels == 49
+    assert {(r.subject_id, r.object_id)
+            for r in rels} == {(r.subject_id, r.object_id)
+                               for r in relationships}
+
+    assert await graphs_handler.entities.create_many(
+        [], store_type=StoreType.GRAPHS) == []
+
+
+@pytest.mark.asyncio
+async def test_update_entity_descriptions(graphs_handler):
+    coll_id = uuid.uuid4()
+    graph_resp = await graphs_handler.create(collection_id=coll_id,
+                                             name="UpdateDescriptions")
+    graph_id = graph_resp.id
+
+    await graphs_handler.entities.create_many(
+        [
+            Entity(name="Undescribed", parent_id=graph_id),
+            Entity(name="Undescribed", parent_id=graph_id),
+            Entity(name="Described",
+                   description="Original",
+                   parent_id=graph_id),
+        ],
+        store_type=StoreType.GRAPHS,
+    )
+    await graphs_handler.entities.update_descriptions(
+        parent_id=graph_id,
+        store_type=StoreType.GRAPHS,
+        entities=[
+            Entity(name="Undescribed", description="New"),
+            Entity(name="Described", description="Replacement"),
+        ],
+    )
+
+    ents, _ = await graphs_handler.get_entities(parent_id=graph_id,
+                                                offset=0,
+                                                limit=10)
+    assert sorted((e.name, e.description) for e in ents) == [
+        ("Described", "Original"),
+        ("Undescribed", "New"),
+        ("Undescribed", "New"),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_relationship_filtering(graphs_handler):
     coll_id = uuid.uuid4()
@@ -556,3 +694,34 @@ async def test_filter_by_collection_ids_in_entities(graphs_handler):
 #         DELETE FROM "{graphs_handler.project_name}"."graphs_entities" WHERE id = $1
 #     """
 #     await graphs_handler.connection_manager.execute_query(delete_sql, [row_id])
+
+
+@pytest.mark.asyncio
+async def test_get_edge_list(graphs_handler):
+    coll_id = uuid.uuid4()
+    graph_resp = await graphs_handler.create(collection_id=coll_id,
+                                             name="EdgeList")
+    graph_id = graph_resp.id
+
+    relationships = await graphs_handler.relationships.create_many(
+        [
+            Relationship(subject=f"Entity{i}",
+                         predicate="next",
+                         object=f"Entity{(i + 1) % 25}",
+                         weight=float(i),
+                         parent_id=graph_id) for i in range(25)
+        ],
+        store_type=StoreType.GRAPHS,
+    )
+
+    edges = await graphs_handler.relationships.get_edge_list(
+        parent_id=graph_id, store_type=StoreType.GRAPHS, page_size=4)
+
+    assert len(edges) == len(relationships)
+    sources, targets, weights = edges.arrays()
+    assert sorted(
+        (edges.names[source], edges.names[target], weight)
+        for source, target, weight in zip(
+            sources.tolist(), targets.tolist(), weights.tolist(),
+            strict=True)) == sorted(
+                (r.subject, r.object, r.weight) for r in relationships)
@@ -0,0 +1,162 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from core.base import DocumentChunk, DocumentResponse, DocumentType
+
+
+@pytest.fixture
+def ingestion_service():
+    from core import R2RConfig
+    from core.main.services import IngestionService
+
+    providers = MagicMock()
+    providers.embedding.config.concurrent_request_limit = 2
+    providers.embedding.async_get_embeddings = AsyncMock(
+        side_effect=lambda texts: [[0.1, 0.2] for _ in texts]
+    )
+    config = R2RConfig({})
+    config.ingestion.pipeline_queue_size = 4
+    return IngestionService(config=config, providers=providers)
+
+
+def make_document() -> DocumentResponse:
+    return DocumentResponse(
+        id=uuid4(),
+        collection_ids=[],
+        owner_id=uuid4(),
+        document_type=DocumentType.TXT,
+        metadata={"title": "pipeline.txt"},
+        title="pipeline.txt",
+        version="v0",
+        size_in_bytes=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_parse_embed_store_pipeline(ingestion_service):
+    document = make_document()
+    chunks = [
+        DocumentChunk(
+            id=uuid4(),
+            document_id=document.id,
+            owner_id=document.owner_id,
+            collection_ids=[],
+            data=f"chunk {i}",
+            metadata={},
+        )
+        for i in range(50)
+    ]
+
+    async def parse_file(document_info, ingestion_config):
+        for chunk in chunks:
+            yield chunk
+
+    stored = []
+
+    async def store_embeddings(embeddings, storage_batch_size=128):
+        assert len(embeddings) <= storage_batch_size
+        stored.extend(embeddings)
+        yield "stored"
+
+    ingestion_service.parse_file = parse_file
+    ingestion_service.store_embeddings = store_embeddings
+
+    timings = await ingestion_service.parse_embed_store(
+        document,
+        {"skip_document_summary": True},
+        token_counter=lambda text: len(text.split()),
+        embedding_batch_size=4,
+        storage_batch_size=16,
+    )
+
+    assert sorted(entry.text for entry in stored) == sorted(
+        chunk.data for chunk in chunks
+    )
+    assert document.total_tokens == 100
+    assert set(document.metadata["ingestion_timings"]) == {
+        "parse",
+        "embed",
+        "store",
+        "total",
+    }
+    assert timings["total"] >= timings["parse"]
+
+
+@pytest.mark.asyncio
+async def test_parse_embed_store_propagates_stage_errors(ingestion_service):
+    document = make_document()
+
+    async def parse_file(document_info, ingestion_config):
+        for i in range(100):
+            yield DocumentChunk(
+                id=uuid4(),
+                document_id=document.id,
+                owner_id=document.owner_id,
+                collection_ids=[],
+                data=f"chunk {i}",
+                metadata={},
+            )
+
+    async def store_embeddings(embeddings, storage_batch_size=128):
+        raise RuntimeError("storage failed")
+        yield
+
+    ingestion_service.parse_file = parse_file
+    ingestion_service.store_embeddings = store_embeddings
+
+    with pytest.raises(RuntimeError, match="storage failed"):
+        await ingestion_service.parse_embed_store(
+            document,
+            {"skip_document_summary": True},
+            embedding_batch_size=4,
+            storage_batch_size=8,
+        )
+
+
+@pytest.mark.asyncio
+async def test_store_embeddings_resolves_limits_once(ingestion_service):
+    from core.base import R2RException, Vector, VectorEntry, VectorType
+
+    owner_id = uuid4()
+    document_id = uuid4()
+    database = ingestion_service.providers.database
+    database.config.bulk_load_chunks = False
+    database.config.app.default_max_chunks_per_user = 100
+    database.users_handler.get_user_by_id = AsyncMock(
+        return_value=MagicMock(limits_overrides={"max_chunks": 5})
+    )
+    stored = []
+
+    async def upsert_entries(entries, max_chunks=None):
+        assert max_chunks == {owner_id: 5}
+        if len(stored) + len(entries) > max_chunks[owner_id]:
+            raise R2RException(status_code=403, message="over the limit")
+        stored.extend(entries)
+
+    database.chunks_handler.upsert_entries = upsert_entries
+
+    entries = [
+        VectorEntry(
+            id=uuid4(),
+            document_id=document_id,
+            owner_id=owner_id,
+            collection_ids=[],
+            vector=Vector(data=[0.1, 0.2], type=VectorType.FIXED),
+            text=f"chunk {i}",
+            metadata={},
+        )
+        for i in range(8)
+    ]
+    messages = [
+        message
+        async for message in ingestion_service.store_embeddings(
+            entries, storage_batch_size=4
+        )
+    ]
+
+    database.users_handler.get_user_by_id.assert_awaited_once_with(owner_id)
+    assert len(stored) == 4
+    assert messages[0] == "over the limit"
+    assert "with vector count: 4" in messages[1]
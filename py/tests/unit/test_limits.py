@@ -1,10 +1,12 @@
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 import pytest
 
-from core.base import LimitSettings
+from core.base import AppConfig, DatabaseConfig, LimitSettings
+from core.providers.database.limits import InMemoryRequestCounter
 from core.providers.database.postgres import PostgresLimitsHandler
 from shared.abstractions import User
 
@@ -463,3 +465,103 @@ async def test_route_specific_monthly_usage(limits_handler):
                                                                   route=None)
     assert global_monthly == 8, (
         f"Expected total of 8 monthly requests, got {global_monthly}")
+
+
+class RecordingConnectionManager:
+    """Stands in for Postgres when only batched inserts are expected."""
+
+    def __init__(self):
+        self.batches: list[list[tuple]] = []
+
+    async def execute_many(self, query, params=None, batch_size=1000):
+        self.batches.append(list(params))
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_limits_without_queries():
+    """The memory backend enforces per-minute limits from process memory and
+    writes request logs in batches."""
+    config = DatabaseConfig(
+        app=AppConfig(project_name="test_project"),
+        limits=LimitSettings(global_per_min=3, route_per_min=2),
+        limits_backend="memory",
+    )
+    connection_manager = RecordingConnectionManager()
+    handler = PostgresLimitsHandler(
+        project_name="test_project",
+        connection_manager=connection_manager,  # type: ignore
+        config=config,
+    )
+    user = User(
+        id=uuid.uuid4(),
+        email="memory@example.com",
+        is_active=True,
+        is_verified=True,
+        is_superuser=False,
+    )
+
+    for _ in range(2):
+        await handler.check_limits(user, "/v3/a")
+        await handler.log_request(user.id, "/v3/a")
+    await handler.log_request(user.id, "/v3/a")
+
+    with pytest.raises(ValueError,
+                       match="Per-route per-minute rate limit exceeded"):
+        await handler.check_limits(user, "/v3/a")
+
+    await handler.log_request(user.id, "/v3/b")
+    with pytest.raises(ValueError,
+                       match="Global per-minute rate limit exceeded"):
+        await handler.check_limits(user, "/v3/b")
+
+    assert connection_manager.batches == []
+    await handler.close()
+    assert len(connection_manager.batches) == 1
+    assert [row[2] for row in connection_manager.batches[0]
+            ] == ["/v3/a", "/v3/a", "/v3/a", "/v3/b"]
+
+
+def test_memory_counter_drops_idle_users():
+    """Keys whose windows have emptied are dropped once retention passes."""
+    counter = InMemoryRequestCounter(retention=timedelta(minutes=2))
+    idle_user, active_user = uuid.uuid4(), uuid.uuid4()
+    start = time.time()
+    counter.record(idle_user, "/v3/a", timestamp=start)
+    counter.record(active_user, "/v3/a", timestamp=start + 180)
+
+    assert idle_user not in counter._user_requests
+    assert (idle_user, "/v3/a") not in counter._route_requests
+    assert len(counter._user_requests[active_user]) == 1
+
+
+def test_monthly_counts_are_swept():
+    """Stale or idle monthly counts, and local tallies without a count, are
+    dropped by the sweep."""
+    config = DatabaseConfig(
+        app=AppConfig(project_name="test_project"),
+        limits_backend="memory",
+        monthly_count_refresh_seconds=60,
+    )
+    handler = PostgresLimitsHandler(
+        project_name="test_project",
+        connection_manager=RecordingConnectionManager(),  # type: ignore
+        config=config,
+    )
+    now = time.monotonic()
+    start_of_month = datetime.now(timezone.utc).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0)
+    fresh, idle, last_month, uncounted, refreshing = (
+        (uuid.uuid4(), None) for _ in range(5))
+    handler._monthly_counts = {
+        fresh: (now, start_of_month, 1),
+        idle: (now - 120, start_of_month, 1),
+        last_month: (now, start_of_month - timedelta(days=1), 1),
+    }
+    for key in (fresh, idle, last_month, uncounted, refreshing):
+        handler._monthly_local[key] += 1
+    handler._monthly_refreshing.add(refreshing)
+
+    handler._sweep_monthly_counts(now)
+
+    assert set(handler._monthly_counts) == {fresh}
+    assert set(handler._monthly_local) == {fresh, refreshing}
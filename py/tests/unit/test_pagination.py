@@ -0,0 +1,63 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from core.base import R2RException
+from core.providers.database.pagination import (
+    CREATED_AT_ID,
+    Keyset,
+    total_from_page,
+)
+
+
+def _rows(count: int) -> list[dict]:
+    return [{
+        "created_at": datetime(2024, 1, 1, 12, 0, i, 1234, tzinfo=timezone.utc),
+        "id": uuid.uuid4(),
+    } for i in range(count)]
+
+
+def test_cursor_round_trips_the_last_key():
+    keyset = Keyset(CREATED_AT_ID, alias="d")
+    rows = _rows(3)
+
+    cursor = keyset.next_cursor(rows, limit=3)
+    params: list = ["owner"]
+    condition = keyset.condition(cursor, params)
+
+    assert condition == "(d.created_at, d.id) < ($2, $3)"
+    assert params == ["owner", rows[-1]["created_at"], rows[-1]["id"]]
+    assert keyset.order_by() == "d.created_at DESC, d.id DESC"
+
+
+def test_ascending_keyset():
+    keyset = Keyset((("name", str), ), descending=False)
+    cursor = keyset.next_cursor([{"name": "a"}, {"name": "b"}], limit=2)
+
+    params: list = []
+    assert keyset.condition(cursor, params) == "(name) > ($1)"
+    assert params == ["b"]
+    assert keyset.order_by() == "name ASC"
+
+
+def test_no_cursor_after_the_last_page():
+    keyset = Keyset(CREATED_AT_ID)
+
+    assert keyset.next_cursor(_rows(2), limit=3) is None
+    assert keyset.next_cursor(_rows(3), limit=-1) is None
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "W10", "WyJ4Il0"])
+def test_invalid_cursors_are_rejected(cursor):
+    with pytest.raises(R2RException) as exc_info:
+        Keyset(CREATED_AT_ID).condition(cursor, [])
+    assert exc_info.value.status_code == 400
+
+
+def test_total_from_page():
+    assert total_from_page(_rows(2), offset=0, limit=3, cursor=None) == 2
+    assert total_from_page(_rows(3), offset=0, limit=-1, cursor=None) == 3
+    assert total_from_page(_rows(3), offset=0, limit=3, cursor=None) is None
+    assert total_from_page(_rows(2), offset=3, limit=3, cursor=None) is None
+    assert total_from_page(_rows(2), offset=0, limit=3, cursor="c") is None
@@ -0,0 +1,50 @@
+import pathlib
+
+import pytest
+
+from core.base import AppConfig, IngestionConfig, ParserProcessPool
+from core.parsers import BasicPDFParser, HTMLParser
+
+DATA_DIR = pathlib.Path(__file__).parents[2] / "core" / "examples" / "data"
+
+
+@pytest.fixture
+def process_pool():
+    pool = ParserProcessPool(max_workers=2, timeout=120, pages_per_task=3)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pdf_pages_match_in_process_parsing(process_pool):
+    data = (DATA_DIR / "graphrag.pdf").read_bytes()
+    parser = BasicPDFParser(IngestionConfig(app=AppConfig()), None, None)
+
+    expected = [page async for page in parser.ingest(data)]
+    pages = [page async for page in process_pool.ingest(parser, data)]
+
+    assert len(expected) > process_pool.pages_per_task
+    assert pages == expected
+
+
+@pytest.mark.asyncio
+async def test_whole_document_parsing(process_pool):
+    data = (DATA_DIR / "pg_essay_1.html").read_bytes()
+    parser = HTMLParser(IngestionConfig(app=AppConfig()), None, None)
+
+    expected = [text async for text in parser.ingest(data)]
+    assert [text async for text in process_pool.ingest(parser, data)
+            ] == expected
+
+
+@pytest.mark.asyncio
+async def test_timeout():
+    pool = ParserProcessPool(max_workers=1, timeout=0)
+    data = (DATA_DIR / "graphrag.pdf").read_bytes()
+    parser = BasicPDFParser(IngestionConfig(app=AppConfig()), None, None)
+    try:
+        with pytest.raises(TimeoutError):
+            async for _ in pool.ingest(parser, data):
+                pass
+    finally:
+        pool.shutdown()
@@ -2,6 +2,8 @@ import uuid
 
 import pytest
 
+from core.providers.database.prompts_handler import Cache, PromptTemplate
+
 # from core.providers.database.postgres_prompts import PostgresPromptsHandler
 
 
@@ -177,3 +179,63 @@ async def test_get_cached_prompt(prompt_handler):
                                                        bypass_cache=True)
     assert "Updated in DB" in content_3, (
         "Now we should see the new DB changes after bypassing cache.")
+
+
+@pytest.mark.asyncio
+async def test_rendered_prompts_are_not_cached(prompt_handler):
+    prompt_name = f"test_uncached_{uuid.uuid4()}"
+    await prompt_handler.add_prompt(
+        name=prompt_name,
+        template="Context: {context}",
+        input_types={"context": "str"},
+    )
+
+    before = prompt_handler.cache_stats()
+    for i in range(20):
+        content = await prompt_handler.get_cached_prompt(
+            prompt_name, {"context": f"retrieved context {i}"})
+        assert content == f"Context: retrieved context {i}"
+    after = prompt_handler.cache_stats()
+
+    assert after["size"] == before["size"]
+    assert after["hits"] - before["hits"] == 20
+
+
+def test_prompt_template_matches_str_format():
+    templates = [
+        "Plain {a} and {b}",
+        "Escaped {{braces}} around {a}",
+        "Spec {a:>8} and conversion {b!r}",
+        "Positional {0}",
+        "No fields",
+    ]
+    inputs = {"a": "x", "b": "{y}"}
+    for template in templates:
+        prompt_template = PromptTemplate(template, {"a": "str", "b": "str"})
+        try:
+            expected = template.format(**inputs)
+        except IndexError:
+            with pytest.raises(IndexError):
+                prompt_template.format(inputs)
+            continue
+        assert prompt_template.format(inputs) == expected
+
+    with pytest.raises(ValueError):
+        PromptTemplate("{a}", {"a": "str"}).format({"c": "unexpected"})
+    with pytest.raises(KeyError):
+        PromptTemplate("{a} {b}", {"a": "str", "b": "str"}).format({"a": 1})
+
+
+def test_cache_evicts_by_size():
+    cache = Cache[str](max_size=None, max_bytes=100, size_of=len)
+    cache.set("a", "x" * 60)
+    cache.set("b", "y" * 30)
+    assert cache.get("a") is not None
+    cache.set("c", "z" * 30)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    stats = cache.stats()
+    assert stats["bytes"] == 90
+    assert stats["evictions"] == 1
+    assert (stats["hits"], stats["misses"]) == (3, 1)
@@ -0,0 +1,33 @@
+from shared.utils.splitter.text import RecursiveCharacterTextSplitter
+
+
+def test_merge_splits_overlap():
+    splitter = RecursiveCharacterTextSplitter(chunk_size=9, chunk_overlap=4)
+    assert splitter.split_text("a b c d e f g h i j") == [
+        "a b c d e",
+        "d e f g",
+        "f g h i",
+        "h i j",
+    ]
+
+
+def test_recursive_split_measures_each_split_once():
+    measured: list[str] = []
+
+    def length_function(text: str) -> int:
+        measured.append(text)
+        return len(text.split())
+
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=20,
+        chunk_overlap=10,
+        length_function=length_function,
+        separators=[" "],
+    )
+    words = [f"word{i}" for i in range(1_000)]
+    chunks = splitter.split_text(" ".join(words))
+
+    assert chunks[0] == " ".join(words[:20])
+    assert chunks[-1].endswith("word999")
+    # Once per split plus once for the separator.
+    assert len(measured) == len(words) + 1
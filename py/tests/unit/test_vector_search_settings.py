@@ -0,0 +1,21 @@
+from core.providers.database.base import (
+    MAX_EF_SEARCH,
+    vector_search_settings,
+)
+
+
+def test_ef_search_covers_limit():
+    settings = vector_search_settings(ef_search=40, probes=10, limit=200)
+    assert settings == {"hnsw.ef_search": "200", "ivfflat.probes": "10"}
+
+    settings = vector_search_settings(ef_search=40, probes=10, limit=5_000)
+    assert settings["hnsw.ef_search"] == str(MAX_EF_SEARCH)
+
+
+def test_iterative_scan():
+    settings = vector_search_settings(
+        ef_search=100, probes=10, limit=10, iterative_scan=True
+    )
+    assert settings["hnsw.ef_search"] == "100"
+    assert settings["hnsw.iterative_scan"] == "strict_order"
+    assert settings["ivfflat.iterative_scan"] == "relaxed_order"
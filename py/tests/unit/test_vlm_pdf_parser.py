@@ -0,0 +1,115 @@
+import asyncio
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from PIL import Image
+
+from core.base import AppConfig, IngestionConfig
+from core.parsers import VLMPDFParser
+
+PAGE_COUNT = 20
+
+
+@pytest.fixture
+def llm_provider():
+    provider = MagicMock()
+    provider.in_flight = 0
+    provider.max_in_flight = 0
+
+    async def aget_completion(messages, generation_config):
+        provider.in_flight += 1
+        provider.max_in_flight = max(provider.max_in_flight,
+                                     provider.in_flight)
+        await asyncio.sleep(random.uniform(0, 0.01))
+        provider.in_flight -= 1
+        text = messages[0]["content"][0]["text"]
+        return SimpleNamespace(choices=[
+            SimpleNamespace(message=SimpleNamespace(content=text))
+        ])
+
+    provider.aget_completion = aget_completion
+    return provider
+
+
+@pytest.fixture
+def parser(llm_provider):
+    database_provider = MagicMock()
+    database_provider.prompts_handler.get_cached_prompt = AsyncMock(
+        return_value="Describe the page.")
+    parser = VLMPDFParser(
+        IngestionConfig(
+            app=AppConfig(),
+            vision_pdf_window_pages=3,
+            vision_pdf_max_concurrent_pages=4,
+        ),
+        database_provider,
+        llm_provider,
+    )
+    parser.windows = []
+
+    async def convert_pdf_to_images(data, dpi, first_page, last_page):
+        parser.windows.append((dpi, first_page, last_page))
+        return [
+            Image.new("RGB", (8, 8))
+            for _ in range(first_page, last_page + 1)
+        ]
+
+    parser.count_pdf_pages = AsyncMock(return_value=PAGE_COUNT)
+    parser.convert_pdf_to_images = convert_pdf_to_images
+    return parser
+
+
+@pytest.mark.asyncio
+async def test_pages_are_rendered_in_windows_and_yielded_in_order(
+        parser, llm_provider):
+    pages = [page async for page in parser.ingest(b"%PDF")]
+
+    assert [page["page_number"]
+            for page in pages] == list(range(1, PAGE_COUNT + 1))
+    assert parser.windows[0] == (300, 1, 3)
+    assert parser.windows[-1] == (300, 19, 20)
+    assert len(parser.windows) == 7
+    assert llm_provider.max_in_flight <= 4
+
+
+@pytest.mark.asyncio
+async def test_unordered_ingestion_and_per_document_overrides(
+        parser, llm_provider):
+    pages = [
+        page async for page in parser.ingest(
+            b"%PDF",
+            maintain_order=False,
+            vision_pdf_dpi=150,
+            vision_pdf_window_pages=10,
+            vision_pdf_max_concurrent_pages=2,
+        )
+    ]
+
+    assert sorted(page["page_number"]
+                  for page in pages) == list(range(1, PAGE_COUNT + 1))
+    assert parser.windows == [(150, 1, 10), (150, 11, 20)]
+    assert llm_provider.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_failed_page_cancels_remaining_pages(parser, llm_provider):
+    calls = 0
+
+    async def aget_completion(messages, generation_config):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("vision model unavailable")
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(choices=[
+            SimpleNamespace(message=SimpleNamespace(content="text"))
+        ])
+
+    llm_provider.aget_completion = aget_completion
+
+    with pytest.raises(RuntimeError, match="vision model unavailable"):
+        async for _ in parser.ingest(b"%PDF"):
+            pass
+    assert calls < PAGE_COUNT
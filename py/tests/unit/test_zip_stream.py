@@ -0,0 +1,60 @@
+import io
+import os
+import zipfile
+from datetime import datetime
+
+import pytest
+
+from core.utils import zip_stream
+from core.utils.zip_stream import ZipStreamWriter
+
+FILES = [
+    ("notes.txt", b"hello world"),
+    ("résumé/report.bin", os.urandom(50_000)),
+    ("empty.txt", b""),
+]
+
+
+def build_archive(files) -> bytes:
+    writer = ZipStreamWriter()
+    pieces = []
+    for name, content in files:
+        pieces.append(
+            writer.start_entry(name, len(content), datetime(2024, 5, 17, 9,
+                                                            30, 12)))
+        for i in range(0, len(content), 4096):
+            pieces.append(writer.write(content[i:i + 4096]))
+        pieces.append(writer.end_entry())
+    pieces.append(writer.close())
+    return b"".join(pieces)
+
+
+def assert_archive(data: bytes, files) -> None:
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == [name for name, _ in files]
+        for name, content in files:
+            assert archive.read(name) == content
+        assert archive.getinfo("notes.txt").date_time == (2024, 5, 17, 9, 30,
+                                                          12)
+
+
+def test_archive_round_trip():
+    assert_archive(build_archive(FILES), FILES)
+
+
+def test_zip64_archive_round_trip(monkeypatch):
+    # Lower the limits so every entry, offset and the entry count need ZIP64.
+    monkeypatch.setattr(zip_stream, "ZIP64_LIMIT", 1)
+    monkeypatch.setattr(zip_stream, "ZIP_MAX_ENTRIES", 2)
+
+    assert_archive(build_archive(FILES), FILES)
+
+
+def test_entry_larger_than_expected_needs_zip64(monkeypatch):
+    monkeypatch.setattr(zip_stream, "ZIP64_LIMIT", 100)
+    writer = ZipStreamWriter()
+    writer.start_entry("small.bin", 10)
+
+    with pytest.raises(ValueError, match="ZIP64"):
+        writer.write(os.urandom(200))